@@ -7,7 +7,9 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
+import pandas as pd
 
+from risk_pipeline.compute.parallel import resolve_workers
 from risk_pipeline.config import (
     FAST_BINOMIAL_STEPS,
     FAST_PATHS,
@@ -19,16 +21,30 @@ from risk_pipeline.config import (
     parse_bool,
 )
 from risk_pipeline.data.download_patch import download_prices_chunked
+from risk_pipeline.data.option_chain import load_option_chain
 from risk_pipeline.data.preprocess import align_prices, compute_log_returns, dataset_stats
 from risk_pipeline.io_utils import ensure_dir, write_json, write_text
-from risk_pipeline.pricing.engines.binomial_crr import crr_price
-from risk_pipeline.pricing.engines.black_scholes import bs_price
-from risk_pipeline.pricing.engines.mc_cpu import mc_price_cpu
+from risk_pipeline.pricing.engines.american_approx import (
+    american_approx_price,
+    baw_price_batch,
+    bjerksund_stensland_price_batch,
+)
+from risk_pipeline.pricing.engines.binomial_crr import CRR_ACCELERATIONS, crr_price
+from risk_pipeline.pricing.cache import PricingCache
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
+from risk_pipeline.pricing.engines.implied_vol import implied_vol_batch
+from risk_pipeline.pricing.engines.lsm import LSM_BASES, lsm_price
+from risk_pipeline.pricing.engines.mc_cpu import mc_price_cpu, mc_price_cpu_parallel, parse_variance_reduction
+from risk_pipeline.pricing.engines.fourier import carr_madan_price_batch, cos_price_batch, gbm_char_fn
 from risk_pipeline.pricing.engines.mc_gpu import mc_price_gpu_cupy
-from risk_pipeline.pricing.greeks.bs_analytic import bs_greeks
-from risk_pipeline.pricing.greeks.finite_diff import bs_greeks_finite_diff
-from risk_pipeline.pricing.no_arbitrage.checks import bounds_check_call_put, put_call_parity_check
+from risk_pipeline.pricing.engines.pde_cn import pde_cn_price
+from risk_pipeline.pricing.greeks.bs_batch import bs_price_greeks_batch, select_greeks
+from risk_pipeline.pricing.greeks.finite_diff import bs_greeks_finite_diff, crr_greeks_batch
+from risk_pipeline.pricing.no_arbitrage.checks import bounds_check_call_put, put_call_parity_check, scan_chain_arbitrage
+from risk_pipeline.pricing.portfolio_var import option_book_var
+from risk_pipeline.pricing.scenarios import revalue_book
 from risk_pipeline.volatility.historical import estimate_hist_vol
+from risk_pipeline.volatility.svi import calibrate_svi_surface
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +67,25 @@ def _bench(fn, repeat: int) -> dict[str, Any]:
     }
 
 
+def _cached_bench(cache: PricingCache | None, engine: str, params: dict[str, Any], fn, repeat: int) -> dict[str, Any]:
+    if cache is None:
+        return _bench(fn, repeat=repeat)
+    found, result = cache.lookup(engine, params)
+    if found:
+        return {
+            "repeat": 0,
+            "timings_sec": [],
+            "mean_sec": None,
+            "min_sec": None,
+            "max_sec": None,
+            "result": result,
+            "cached": True,
+        }
+    bench = _bench(fn, repeat=repeat)
+    cache.store(engine, params, bench["result"])
+    return {**bench, "cached": False}
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Run derivatives pricing + no-arbitrage pipeline")
     p.add_argument("--run-id", type=str, default=None)
@@ -67,25 +102,53 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--download-jitter", type=float, default=0.3)
     p.add_argument("--offline", action="store_true")
     p.add_argument("--use-cache", type=str, default="true")
+    p.add_argument("--pricing-cache", type=str, default="false")
+    p.add_argument("--pricing-cache-dir", type=str, default=None)
+    p.add_argument("--pricing-cache-max-mb", type=float, default=64.0)
 
     p.add_argument("--option-type", choices=["call", "put"], default="call")
     p.add_argument("--strike", type=float, required=True)
     p.add_argument("--maturity-days", type=int, required=True)
     p.add_argument("--risk-free-rate", type=float, default=0.03)
     p.add_argument("--dividend-yield", type=float, default=0.0)
-    p.add_argument("--sigma-mode", choices=["hist", "fixed", "implied_stub"], default="hist")
+    p.add_argument("--sigma-mode", choices=["hist", "fixed", "implied"], default="hist")
     p.add_argument("--sigma", type=float, default=None)
+    p.add_argument("--market-price", type=float, default=None)
     p.add_argument("--hist-vol-window", type=int, default=60)
     p.add_argument("--annualization", type=int, default=252)
     p.add_argument("--min-returns-rows", type=int, default=30)
+    p.add_argument("--chain-file", type=str, default=None)
+    p.add_argument("--arb-tol", type=float, default=0.01)
+    p.add_argument("--risk-ladder", action="store_true")
+    p.add_argument("--option-var", action="store_true")
+    p.add_argument("--var-paths", type=int, default=10000)
+    p.add_argument("--var-alpha", type=float, default=0.99)
+    p.add_argument("--var-horizon-days", type=float, default=1.0)
+    p.add_argument("--var-workers", type=int, default=None)
 
     p.add_argument("--paths", type=int, default=None)
     p.add_argument("--seed", type=int, default=9)
+    p.add_argument("--mc-variance-reduction", type=str, default="none")
+    p.add_argument("--mc-sampler", choices=["pseudo", "sobol"], default="pseudo")
+    p.add_argument("--mc-randomizations", type=int, default=16)
+    p.add_argument("--mc-block-size", type=int, default=None)
+    p.add_argument("--mc-target-stderr", type=float, default=None)
+    p.add_argument("--mc-target-rel-ci", type=float, default=None)
+    p.add_argument("--mc-time-budget", type=float, default=None)
+    p.add_argument("--mc-workers", type=int, default=None)
+    p.add_argument("--mc-chunk-paths", type=int, default=1 << 16)
+    p.add_argument("--mc-greeks", action="store_true")
+    p.add_argument("--lsm-paths", type=int, default=None)
+    p.add_argument("--lsm-exercise-dates", type=int, default=50)
+    p.add_argument("--lsm-basis", choices=list(LSM_BASES), default="laguerre")
     p.add_argument("--backend", choices=["cpu", "gpu", "both"], default="cpu")
     p.add_argument("--gpu-backend", choices=["cupy"], default="cupy")
 
     p.add_argument("--repeat", type=int, default=None)
     p.add_argument("--binomial-steps", type=int, default=None)
+    p.add_argument("--binomial-acceleration", choices=list(CRR_ACCELERATIONS), default="bbsr")
+    p.add_argument("--pde-space-steps", type=int, default=400)
+    p.add_argument("--pde-time-steps", type=int, default=100)
     p.add_argument("--outdir", type=str, default=None)
     p.add_argument("--debug", action="store_true")
     return p
@@ -122,11 +185,34 @@ def _validate_inputs(args: argparse.Namespace, maturity: float, paths: int, step
         raise ValueError("--binomial-steps must be > 0")
     if repeat <= 0:
         raise ValueError("--repeat must be > 0")
+    if args.pricing_cache_max_mb <= 0.0:
+        raise ValueError("--pricing-cache-max-mb must be > 0")
+    if args.pde_space_steps < 4 or args.pde_time_steps <= 0:
+        raise ValueError("--pde-space-steps must be >= 4 and --pde-time-steps > 0")
+    parse_variance_reduction(args.mc_variance_reduction)
+    if args.mc_block_size is not None and args.mc_block_size <= 1:
+        raise ValueError("--mc-block-size must be > 1")
+    adaptive = any(x is not None for x in (args.mc_target_stderr, args.mc_target_rel_ci, args.mc_time_budget))
+    if adaptive and (args.mc_workers is not None or args.mc_sampler != "pseudo"):
+        raise ValueError("--mc-target-* / --mc-time-budget need --mc-sampler pseudo without --mc-workers")
+    if args.mc_workers is not None:
+        if args.mc_workers < 0:
+            raise ValueError("--mc-workers must be >= 0 (0 means all cores)")
+        if args.mc_sampler != "pseudo":
+            raise ValueError("--mc-workers supports only --mc-sampler pseudo")
+        if args.mc_chunk_paths <= 1:
+            raise ValueError("--mc-chunk-paths must be > 1")
+    if args.var_workers is not None and args.var_workers < 0:
+        raise ValueError("--var-workers must be >= 0 (0 means all cores)")
+    if args.mc_sampler == "sobol" and args.mc_randomizations < 2:
+        raise ValueError("--mc-randomizations must be >= 2 with --mc-sampler sobol")
 
 
 def _select_sigma(
     args: argparse.Namespace,
     returns_series,
+    spot: float,
+    maturity: float,
 ) -> tuple[float, dict[str, Any]]:
     if args.sigma_mode == "hist":
         hist = estimate_hist_vol(
@@ -151,18 +237,35 @@ def _select_sigma(
             "note": "fixed_sigma_input",
         }
 
-    if args.sigma_mode == "implied_stub":
-        if args.sigma is None or args.sigma <= 0.0:
-            raise ValueError("implied_stub is a placeholder. Provide --sigma > 0 for now")
-        return float(args.sigma), {
+    if args.sigma_mode == "implied":
+        if args.market_price is None or args.market_price <= 0.0:
+            raise ValueError("--market-price must be provided and > 0 when --sigma-mode implied")
+        solved = implied_vol_batch(
+            price=args.market_price,
+            spot=spot,
+            strike=args.strike,
+            maturity=maturity,
+            rate=args.risk_free_rate,
+            dividend_yield=args.dividend_yield,
+            is_call=args.option_type == "call",
+        )
+        if not bool(solved["converged"]):
+            raise ValueError(
+                f"Implied volatility did not converge for --market-price {args.market_price}; "
+                "check it lies within no-arbitrage bounds"
+            )
+        sigma_implied = float(solved["sigma"])
+        return sigma_implied, {
             "sigma_daily": None,
-            "sigma_annual": float(args.sigma),
+            "sigma_annual": sigma_implied,
             "window_used": 0,
             "annualization": int(args.annualization),
             "num_returns": int(returns_series.dropna().shape[0]),
             "returns_start": str(returns_series.index.min().date()),
             "returns_end": str(returns_series.index.max().date()),
-            "note": "implied_stub_placeholder_uses_sigma_input",
+            "note": "implied_from_market_price",
+            "market_price": float(args.market_price),
+            "iterations": int(solved["iterations"]),
         }
 
     raise ValueError(f"Unknown sigma_mode={args.sigma_mode}")
@@ -185,6 +288,10 @@ def run_pipeline(args: argparse.Namespace) -> Path:
     _validate_inputs(args, maturity=maturity, paths=paths, steps=steps, repeat=repeat)
 
     cache_dir_arg = Path(args.cache_dir) if args.cache_dir else (root / "datasets" / "yfinance_cache")
+    pricing_cache: PricingCache | None = None
+    pricing_cache_dir = Path(args.pricing_cache_dir) if args.pricing_cache_dir else (root / "datasets" / "pricing_cache")
+    if parse_bool(args.pricing_cache):
+        pricing_cache = PricingCache(pricing_cache_dir, max_bytes=int(args.pricing_cache_max_mb * (1 << 20)))
 
     if not enable_download_patch:
         raise ValueError("This pipeline requires the chunked download patch; set --enable-download-patch true")
@@ -215,24 +322,180 @@ def run_pipeline(args: argparse.Namespace) -> Path:
     if s0 <= 0.0:
         raise ValueError(f"Invalid S0 from latest close: {s0}")
 
-    sigma_used, hist_vol = _select_sigma(args=args, returns_series=returns_df[ticker])
-
-    bs_call = bs_price(s0, args.strike, maturity, args.risk_free_rate, args.dividend_yield, sigma_used, "call")
-    bs_put = bs_price(s0, args.strike, maturity, args.risk_free_rate, args.dividend_yield, sigma_used, "put")
+    sigma_used, hist_vol = _select_sigma(args=args, returns_series=returns_df[ticker], spot=s0, maturity=maturity)
 
     bench_bs = _bench(
-        lambda: bs_price(
+        lambda: bs_price_greeks_batch(
             s0,
             args.strike,
             maturity,
             args.risk_free_rate,
             args.dividend_yield,
             sigma_used,
-            args.option_type,
         ),
         repeat=repeat,
     )
-    bench_bin = _bench(
+    bs_fused = bench_bs["result"]
+    bs_call = float(bs_fused["call_price"])
+    bs_put = float(bs_fused["put_price"])
+    chain_df = None
+    chain_scan: dict[str, Any] | None = None
+    bench_chain: dict[str, Any] | None = None
+    bench_iv: dict[str, Any] | None = None
+    svi_info: dict[str, Any] | None = None
+    ladder: dict[str, Any] | None = None
+    option_var: dict[str, Any] | None = None
+    if args.chain_file:
+        chain_df = load_option_chain(Path(args.chain_file))
+        bench_chain = _bench(
+            lambda: bs_price_batch(
+                s0,
+                chain_df["strike"].to_numpy(),
+                chain_df["maturity_years"].to_numpy(),
+                args.risk_free_rate,
+                args.dividend_yield,
+                sigma_used,
+                chain_df["is_call"].to_numpy(),
+            ),
+            repeat=repeat,
+        )
+        chain_df["bs_price"] = bench_chain["result"]
+        # Cross-check: one COS transform per expiry prices all of its strikes.
+        chain_df["cos_price"] = np.nan
+        for expiry, rows in chain_df.groupby("maturity_years").groups.items():
+            strikes = chain_df.loc[rows, "strike"].to_numpy()
+            calls = chain_df.loc[rows, "is_call"].to_numpy()
+            if expiry <= 0.0:
+                # Expired contracts have no transform; they are worth intrinsic value, as in bs_price_batch.
+                chain_df.loc[rows, "cos_price"] = np.maximum(np.where(calls, 1.0, -1.0) * (s0 - strikes), 0.0)
+                continue
+            chain_df.loc[rows, "cos_price"] = cos_price_batch(
+                s0,
+                strikes,
+                float(expiry),
+                args.risk_free_rate,
+                args.dividend_yield,
+                calls,
+                gbm_char_fn(float(expiry), args.risk_free_rate, args.dividend_yield, sigma_used),
+            )
+        american_inputs = (
+            s0,
+            chain_df["strike"].to_numpy(),
+            chain_df["maturity_years"].clip(lower=1e-8).to_numpy(),
+            args.risk_free_rate,
+            args.dividend_yield,
+            sigma_used,
+            chain_df["is_call"].to_numpy(),
+        )
+        chain_df["american_baw"] = baw_price_batch(*american_inputs)
+        chain_df["american_bjerksund_stensland"] = bjerksund_stensland_price_batch(*american_inputs)
+        if "market_price" in chain_df.columns:
+            bench_iv = _bench(
+                lambda: implied_vol_batch(
+                    chain_df["market_price"].to_numpy(dtype=float),
+                    s0,
+                    chain_df["strike"].to_numpy(),
+                    chain_df["maturity_years"].to_numpy(),
+                    args.risk_free_rate,
+                    args.dividend_yield,
+                    chain_df["is_call"].to_numpy(),
+                ),
+                repeat=repeat,
+            )
+            chain_df["implied_vol"] = bench_iv["result"]["sigma"]
+            chain_df["iv_converged"] = bench_iv["result"]["converged"]
+            chain_df["iv_iterations"] = bench_iv["result"]["iterations"]
+            try:
+                surface, skipped = calibrate_svi_surface(
+                    chain_df["strike"].to_numpy(),
+                    chain_df["maturity_years"].to_numpy(),
+                    chain_df["implied_vol"].where(chain_df["iv_converged"]).to_numpy(dtype=float),
+                    s0,
+                    args.risk_free_rate,
+                    args.dividend_yield,
+                )
+            except ValueError as exc:
+                svi_info = {"fitted_expiries": [], "note": str(exc)}
+            else:
+                # The fit already drops T <= 0 quotes; expired rows get no surface vol either.
+                live = chain_df["maturity_years"] > 0.0
+                chain_df["svi_vol"] = np.nan
+                chain_df.loc[live, "svi_vol"] = surface.sigma(
+                    chain_df.loc[live, "strike"].to_numpy(), chain_df.loc[live, "maturity_years"].to_numpy()
+                )
+                svi_info = {
+                    "fitted_expiries": surface.expiries.tolist(),
+                    "skipped_expiries": skipped,
+                    "rmse_total_variance": surface.rmse.tolist(),
+                    "max_abs_vol_error": float((chain_df["svi_vol"] - chain_df["implied_vol"]).abs().max()),
+                }
+        quoted = "market_price" if "market_price" in chain_df.columns else "bs_price"
+        # Expired rows carry no term structure to check; violations index the scanned rows, so map them back.
+        scanned = chain_df.loc[chain_df["maturity_years"] > 0.0]
+        chain_scan = scan_chain_arbitrage(
+            scanned["strike"].to_numpy(),
+            scanned["maturity_years"].to_numpy(),
+            scanned[quoted].to_numpy(dtype=float),
+            scanned["is_call"].to_numpy(),
+            s0,
+            args.risk_free_rate,
+            args.dividend_yield,
+            tol=args.arb_tol,
+        )
+        rows = scanned.index.to_numpy()
+        violations = chain_scan["violations"]
+        violations["quote"] = rows[violations["quote"].to_numpy()]
+        violations["other"] = np.where(violations["other"] >= 0, rows[violations["other"].clip(lower=0).to_numpy()], -1)
+        chain_scan["expired_skipped"] = int(chain_df.shape[0] - scanned.shape[0])
+        # The chain doubles as an option book for the risk views (quantity column optional).
+        if args.risk_ladder or args.option_var:
+            book = pd.DataFrame(
+                {
+                    "underlying": ticker,
+                    "spot": s0,
+                    "strike": chain_df["strike"],
+                    "maturity_years": chain_df["maturity_years"],
+                    "sigma": chain_df["svi_vol"].fillna(sigma_used) if "svi_vol" in chain_df.columns else sigma_used,
+                    "option_type": chain_df["option_type"],
+                    "quantity": chain_df["quantity"] if "quantity" in chain_df.columns else 1.0,
+                }
+            )
+        if args.risk_ladder:
+            # Spot -20%..+20% x vol -10..+10 pts.
+            ladder = revalue_book(
+                book,
+                spot_shocks=np.linspace(-0.2, 0.2, 9),
+                vol_shocks=np.linspace(-0.1, 0.1, 5),
+                rate=args.risk_free_rate,
+                dividend_yield=args.dividend_yield,
+            )
+        if args.option_var:
+            option_var = option_book_var(
+                book,
+                returns_df[[ticker]],
+                num_paths=args.var_paths,
+                seed=args.seed,
+                alpha=args.var_alpha,
+                horizon_days=args.var_horizon_days,
+                rate=args.risk_free_rate,
+                dividend_yield=args.dividend_yield,
+                annualization=args.annualization,
+                workers=args.var_workers,
+            )
+
+    contract = {
+        "spot": float(s0),
+        "strike": float(args.strike),
+        "maturity": float(maturity),
+        "rate": float(args.risk_free_rate),
+        "dividend_yield": float(args.dividend_yield),
+        "sigma": float(sigma_used),
+        "option_type": args.option_type,
+    }
+    bench_bin = _cached_bench(
+        pricing_cache,
+        "binomial_crr",
+        {**contract, "steps": int(steps), "acceleration": "none"},
         lambda: crr_price(
             s0,
             args.strike,
@@ -245,9 +508,31 @@ def run_pipeline(args: argparse.Namespace) -> Path:
         ),
         repeat=repeat,
     )
+    bench_bin_acc: dict[str, Any] | None = None
+    if args.binomial_acceleration != "none":
+        bench_bin_acc = _cached_bench(
+            pricing_cache,
+            "binomial_crr",
+            {**contract, "steps": int(steps), "acceleration": args.binomial_acceleration},
+            lambda: crr_price(
+                s0,
+                args.strike,
+                maturity,
+                args.risk_free_rate,
+                args.dividend_yield,
+                sigma_used,
+                args.option_type,
+                steps,
+                acceleration=args.binomial_acceleration,
+            ),
+            repeat=repeat,
+        )
 
-    bench_mc_cpu = _bench(
-        lambda: mc_price_cpu(
+    bench_pde = _cached_bench(
+        pricing_cache,
+        "pde_cn",
+        {**contract, "space_steps": int(args.pde_space_steps), "time_steps": int(args.pde_time_steps)},
+        lambda: pde_cn_price(
             s0,
             args.strike,
             maturity,
@@ -255,12 +540,130 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             args.dividend_yield,
             sigma_used,
             args.option_type,
-            paths,
-            args.seed,
+            space_steps=args.pde_space_steps,
+            time_steps=args.pde_time_steps,
         ),
         repeat=repeat,
     )
 
+    # American exercise: the CRR tree is the reference for the closed-form approximations.
+    american_args = (s0, args.strike, maturity, args.risk_free_rate, args.dividend_yield, sigma_used, args.option_type)
+    bench_american = {
+        "binomial_crr": _bench(
+            lambda: crr_price(*american_args, steps, exercise="american", acceleration=args.binomial_acceleration),
+            repeat=repeat,
+        ),
+        "baw": _bench(lambda: american_approx_price(*american_args, method="baw"), repeat=repeat),
+        "bjerksund_stensland": _bench(
+            lambda: american_approx_price(*american_args, method="bjerksund_stensland"), repeat=repeat
+        ),
+    }
+    if args.lsm_paths is not None:
+        bench_american["lsm"] = _bench(
+            lambda: lsm_price(
+                *american_args,
+                paths=args.lsm_paths,
+                seed=args.seed,
+                exercise_dates=args.lsm_exercise_dates,
+                basis=args.lsm_basis,
+            ),
+            repeat=repeat,
+        )
+
+    char_fn = gbm_char_fn(maturity, args.risk_free_rate, args.dividend_yield, sigma_used)
+    bench_cos = _bench(
+        lambda: cos_price_batch(
+            s0,
+            args.strike,
+            maturity,
+            args.risk_free_rate,
+            args.dividend_yield,
+            args.option_type == "call",
+            char_fn,
+        ),
+        repeat=repeat,
+    )
+    fft_price = float(
+        carr_madan_price_batch(
+            s0,
+            args.strike,
+            maturity,
+            args.risk_free_rate,
+            args.dividend_yield,
+            args.option_type == "call",
+            char_fn,
+        )[0]
+    )
+
+    mc_params = {
+        **contract,
+        "paths": int(paths),
+        "seed": int(args.seed),
+        "variance_reduction": args.mc_variance_reduction,
+        "block_size": args.mc_block_size,
+        "greeks": bool(args.mc_greeks),
+    }
+    # A wall-clock budget makes the result timing-dependent, so those runs are never cached.
+    mc_cache = pricing_cache if args.mc_time_budget is None else None
+    if args.mc_workers is not None:
+        bench_mc_cpu = _cached_bench(
+            mc_cache,
+            "mc_cpu_parallel",
+            # chunk_paths fixes the per-chunk streams; the worker count only schedules them.
+            {**mc_params, "chunk_paths": int(args.mc_chunk_paths)},
+            lambda: mc_price_cpu_parallel(
+                s0,
+                args.strike,
+                maturity,
+                args.risk_free_rate,
+                args.dividend_yield,
+                sigma_used,
+                args.option_type,
+                paths,
+                args.seed,
+                workers=args.mc_workers,
+                chunk_paths=args.mc_chunk_paths,
+                variance_reduction=args.mc_variance_reduction,
+                block_size=args.mc_block_size,
+                greeks=args.mc_greeks,
+            ),
+            repeat=repeat,
+        )
+        # A hit may come from a run with another worker count; report this run's.
+        bench_mc_cpu["result"]["workers"] = resolve_workers(args.mc_workers)
+    else:
+        bench_mc_cpu = _cached_bench(
+            mc_cache,
+            "mc_cpu",
+            {
+                **mc_params,
+                "sampler": args.mc_sampler,
+                "randomizations": int(args.mc_randomizations),
+                "target_stderr": args.mc_target_stderr,
+                "target_rel_ci": args.mc_target_rel_ci,
+            },
+            lambda: mc_price_cpu(
+                s0,
+                args.strike,
+                maturity,
+                args.risk_free_rate,
+                args.dividend_yield,
+                sigma_used,
+                args.option_type,
+                paths,
+                args.seed,
+                variance_reduction=args.mc_variance_reduction,
+                sampler=args.mc_sampler,
+                randomizations=args.mc_randomizations,
+                block_size=args.mc_block_size,
+                target_stderr=args.mc_target_stderr,
+                target_rel_ci=args.mc_target_rel_ci,
+                time_budget_sec=args.mc_time_budget,
+                greeks=args.mc_greeks,
+            ),
+            repeat=repeat,
+        )
+
     gpu_note = ""
     bench_mc_gpu: dict[str, Any] | None = None
     if args.backend in {"gpu", "both"}:
@@ -278,6 +681,7 @@ def run_pipeline(args: argparse.Namespace) -> Path:
                 args.option_type,
                 paths,
                 args.seed,
+                greeks=args.mc_greeks,
             ),
             repeat=repeat,
         )
@@ -299,6 +703,35 @@ def run_pipeline(args: argparse.Namespace) -> Path:
 
     abs_err_bin = abs(bin_selected - bs_selected)
     rel_err_bin = abs_err_bin / max(1e-12, abs(bs_selected))
+    bin_accelerated: dict[str, Any] | None = None
+    if bench_bin_acc is not None:
+        acc_price = float(bench_bin_acc["result"])
+        acc_abs_err = abs(acc_price - bs_selected)
+        bin_accelerated = {
+            "method": args.binomial_acceleration,
+            "price": acc_price,
+            "abs_error_vs_bs": float(acc_abs_err),
+            "rel_error_vs_bs": float(acc_abs_err / max(1e-12, abs(bs_selected))),
+        }
+    pde_result = bench_pde["result"]
+    abs_err_pde = abs(pde_result["price"] - bs_selected)
+    american_ref = float(bench_american["binomial_crr"]["result"])
+    american_approx = {
+        method: {
+            "price": float(bench_american[method]["result"]),
+            "abs_error_vs_crr": float(abs(bench_american[method]["result"] - american_ref)),
+            "rel_error_vs_crr": float(abs(bench_american[method]["result"] - american_ref) / max(1e-12, abs(american_ref))),
+        }
+        for method in ("baw", "bjerksund_stensland")
+    }
+    if "lsm" in bench_american:
+        lsm_result = bench_american["lsm"]["result"]
+        american_approx["lsm"] = {
+            **lsm_result,
+            "abs_error_vs_crr": float(abs(lsm_result["price"] - american_ref)),
+            "rel_error_vs_crr": float(abs(lsm_result["price"] - american_ref) / max(1e-12, abs(american_ref))),
+        }
+    cos_price = float(bench_cos["result"][0])
     abs_err_mc = abs(mc_selected - bs_selected)
     rel_err_mc = abs_err_mc / max(1e-12, abs(bs_selected))
 
@@ -323,15 +756,11 @@ def run_pipeline(args: argparse.Namespace) -> Path:
 
     greeks_payload = {
         "option_type": args.option_type,
-        "bs_analytic": bs_greeks(
-            s0,
-            args.strike,
-            maturity,
-            args.risk_free_rate,
-            args.dividend_yield,
-            sigma_used,
-            args.option_type,
-        ),
+        "bs_analytic": {
+            name: float(value)
+            for name, value in select_greeks(bs_fused, args.option_type).items()
+            if name != "price"
+        },
         "finite_diff": bs_greeks_finite_diff(
             s0,
             args.strike,
@@ -341,12 +770,35 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             sigma_used,
             args.option_type,
         ),
+        "binomial_lattice": {
+            name: float(value[0])
+            for name, value in crr_greeks_batch(
+                s0,
+                np.array([args.strike]),
+                maturity,
+                args.risk_free_rate,
+                args.dividend_yield,
+                sigma_used,
+                args.option_type == "call",
+                max(steps, 4),
+                acceleration=args.binomial_acceleration,
+            ).items()
+            if name != "price"
+        },
     }
+    if args.mc_greeks:
+        greeks_payload["mc_pathwise"] = {"engine": selected_mc_engine, **selected_mc["greeks"]}
 
     prices.to_csv(outdir / "prices_aligned.csv")
     returns_df.to_csv(outdir / "returns.csv")
     write_json(outdir / "download_report.json", download_report)
     write_json(outdir / "hist_vol.json", hist_vol)
+    if chain_df is not None:
+        chain_df.drop(columns=["is_call"]).to_csv(outdir / "chain_prices.csv", index=False)
+        if not chain_scan["ok"]:
+            chain_scan["violations"].to_csv(outdir / "chain_arbitrage.csv", index=False)
+    if ladder is not None:
+        ladder["scenarios"].assign(book_pnl=ladder["book_pnl"]).to_csv(outdir / "risk_ladder.csv", index=False)
 
     price_payload = {
         "option_type": args.option_type,
@@ -360,6 +812,33 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             "selected": float(bin_selected),
             "abs_error_vs_bs": float(abs_err_bin),
             "rel_error_vs_bs": float(rel_err_bin),
+            "accelerated": bin_accelerated,
+        },
+        "pde": {
+            "method": "crank_nicolson_rannacher",
+            "price": float(pde_result["price"]),
+            "space_steps": int(args.pde_space_steps),
+            "time_steps": int(args.pde_time_steps),
+            "abs_error_vs_bs": float(abs_err_pde),
+            "rel_error_vs_bs": float(abs_err_pde / max(1e-12, abs(bs_selected))),
+            "grid_greeks": {name: float(pde_result[name]) for name in ("delta", "gamma", "theta")},
+        },
+        "american": {
+            "reference": {
+                "engine": "binomial_crr",
+                "steps": int(steps),
+                "acceleration": args.binomial_acceleration,
+                "price": american_ref,
+            },
+            "early_exercise_premium": float(american_ref - bs_selected),
+            **american_approx,
+        },
+        "fourier": {
+            "model": "gbm",
+            "cos": cos_price,
+            "carr_madan_fft": fft_price,
+            "cos_abs_error_vs_bs": float(abs(cos_price - bs_selected)),
+            "carr_madan_abs_error_vs_bs": float(abs(fft_price - bs_selected)),
         },
         "mc": {
             "engine": selected_mc_engine,
@@ -368,7 +847,7 @@ def run_pipeline(args: argparse.Namespace) -> Path:
                 "stderr": float(selected_mc["stderr"]),
                 "ci_low": float(selected_mc["ci_low"]),
                 "ci_high": float(selected_mc["ci_high"]),
-                "paths": int(paths),
+                "paths": int(selected_mc["paths"]),
             },
             "abs_error_vs_bs": float(abs_err_mc),
             "rel_error_vs_bs": float(rel_err_mc),
@@ -379,12 +858,53 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             "put_call_parity": parity,
             "bounds": bounds,
         },
+        "chain": None,
     }
+    if chain_df is not None:
+        price_payload["chain"] = {
+            "file": str(args.chain_file),
+            "contracts": int(chain_df.shape[0]),
+            "calls": int(chain_df["is_call"].sum()),
+            "puts": int((~chain_df["is_call"]).sum()),
+            "bs_price_min": float(chain_df["bs_price"].min()),
+            "bs_price_max": float(chain_df["bs_price"].max()),
+            "expiries": int(chain_df["maturity_years"].nunique()),
+            "cos_max_abs_diff_vs_bs": float((chain_df["cos_price"] - chain_df["bs_price"]).abs().max()),
+            "no_arbitrage": {
+                "prices": quoted,
+                "tol": float(args.arb_tol),
+                "ok": chain_scan["ok"],
+                "violations": chain_scan["counts"],
+                "expired_skipped": chain_scan["expired_skipped"],
+            },
+            "output": "chain_prices.csv",
+        }
+        if bench_iv is not None:
+            price_payload["chain"]["implied_vol"] = {
+                "converged": int(chain_df["iv_converged"].sum()),
+                "failed": int((~chain_df["iv_converged"]).sum()),
+                "max_iterations": int(chain_df["iv_iterations"].max()),
+            }
+            price_payload["chain"]["svi"] = svi_info
+        if ladder is not None:
+            worst = int(np.argmin(ladder["book_pnl"]))
+            price_payload["chain"]["risk_ladder"] = {
+                "scenarios": int(ladder["scenarios"].shape[0]),
+                "base_value": float(ladder["base_value"].sum()),
+                "worst_pnl": float(ladder["book_pnl"][worst]),
+                "worst_scenario": {k: float(v) for k, v in ladder["scenarios"].iloc[worst].items()},
+                "output": "risk_ladder.csv",
+            }
+        if option_var is not None:
+            price_payload["chain"]["option_var"] = {
+                k: option_var[k] for k in ("alpha", "paths", "horizon_days", "full", "delta_gamma", "approximation_error")
+            }
     write_json(outdir / "price.json", price_payload)
     write_json(outdir / "greeks.json", greeks_payload)
 
     bench_payload = {
         "black_scholes": {
+            "kernel": "bs_price_greeks_batch",
             "repeat": bench_bs["repeat"],
             "timings_sec": bench_bs["timings_sec"],
             "mean_sec": bench_bs["mean_sec"],
@@ -399,6 +919,33 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             "max_sec": bench_bin["max_sec"],
             "steps": int(steps),
         },
+        "binomial_accelerated": None,
+        "pde": {
+            "repeat": bench_pde["repeat"],
+            "timings_sec": bench_pde["timings_sec"],
+            "mean_sec": bench_pde["mean_sec"],
+            "min_sec": bench_pde["min_sec"],
+            "max_sec": bench_pde["max_sec"],
+            "space_steps": int(args.pde_space_steps),
+            "time_steps": int(args.pde_time_steps),
+        },
+        "american": {
+            name: {
+                "repeat": bench["repeat"],
+                "timings_sec": bench["timings_sec"],
+                "mean_sec": bench["mean_sec"],
+                "min_sec": bench["min_sec"],
+                "max_sec": bench["max_sec"],
+            }
+            for name, bench in bench_american.items()
+        },
+        "fourier_cos": {
+            "repeat": bench_cos["repeat"],
+            "timings_sec": bench_cos["timings_sec"],
+            "mean_sec": bench_cos["mean_sec"],
+            "min_sec": bench_cos["min_sec"],
+            "max_sec": bench_cos["max_sec"],
+        },
         "mc_cpu": {
             "repeat": bench_mc_cpu["repeat"],
             "timings_sec": bench_mc_cpu["timings_sec"],
@@ -407,9 +954,24 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             "max_sec": bench_mc_cpu["max_sec"],
         },
         "mc_gpu": None,
+        "black_scholes_chain": None,
+        "implied_vol_chain": None,
+        "pricing_cache": None,
         "selected_backend": args.backend,
         "gpu_backend": args.gpu_backend,
     }
+    if pricing_cache is not None:
+        served = {
+            "binomial": bench_bin,
+            "binomial_accelerated": bench_bin_acc,
+            "pde": bench_pde,
+            "mc_cpu": bench_mc_cpu,
+        }
+        bench_payload["pricing_cache"] = {
+            "dir": str(pricing_cache_dir),
+            "stats": dict(pricing_cache.stats),
+            "cached": sorted(name for name, b in served.items() if b is not None and b.get("cached", False)),
+        }
     if bench_mc_gpu is not None:
         bench_payload["mc_gpu"] = {
             "repeat": bench_mc_gpu["repeat"],
@@ -421,6 +983,50 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             "device": bench_mc_gpu["result"].get("device", None),
             "reason": bench_mc_gpu["result"].get("reason", None),
         }
+    if bench_bin_acc is not None:
+        bench_payload["binomial_accelerated"] = {
+            "method": args.binomial_acceleration,
+            "repeat": bench_bin_acc["repeat"],
+            "timings_sec": bench_bin_acc["timings_sec"],
+            "mean_sec": bench_bin_acc["mean_sec"],
+            "min_sec": bench_bin_acc["min_sec"],
+            "max_sec": bench_bin_acc["max_sec"],
+            "steps": int(steps),
+        }
+    if bench_chain is not None:
+        bench_payload["black_scholes_chain"] = {
+            "repeat": bench_chain["repeat"],
+            "timings_sec": bench_chain["timings_sec"],
+            "mean_sec": bench_chain["mean_sec"],
+            "min_sec": bench_chain["min_sec"],
+            "max_sec": bench_chain["max_sec"],
+            "contracts": int(chain_df.shape[0]),
+        }
+    if bench_iv is not None:
+        bench_payload["implied_vol_chain"] = {
+            "repeat": bench_iv["repeat"],
+            "timings_sec": bench_iv["timings_sec"],
+            "mean_sec": bench_iv["mean_sec"],
+            "min_sec": bench_iv["min_sec"],
+            "max_sec": bench_iv["max_sec"],
+            "contracts": int(chain_df.shape[0]),
+        }
+    if ladder is not None:
+        bench_payload["risk_ladder"] = {
+            "revaluations": ladder["revaluations"],
+            "elapsed_sec": ladder["elapsed_sec"],
+            "sec_per_million": ladder["sec_per_million"],
+        }
+    if option_var is not None:
+        bench_payload["option_var"] = {
+            "paths": option_var["paths"],
+            "positions": option_var["positions"],
+            "scenario_sec": option_var["scenario_sec"],
+            "workers": option_var["workers"],
+            "full_sec": option_var["full"]["elapsed_sec"],
+            "delta_gamma_sec": option_var["delta_gamma"]["elapsed_sec"],
+            "speedup": option_var["approximation_error"]["speedup"],
+        }
     write_json(outdir / "bench.json", bench_payload)
 
     stats = dataset_stats(prices, returns_df)
@@ -438,16 +1044,52 @@ def run_pipeline(args: argparse.Namespace) -> Path:
         "option_type": args.option_type,
         "sigma_mode": args.sigma_mode,
         "sigma_input": None if args.sigma is None else float(args.sigma),
+        "market_price": None if args.market_price is None else float(args.market_price),
         "sigma_used": float(sigma_used),
         "hist_vol_window": int(args.hist_vol_window),
         "annualization": int(args.annualization),
         "min_returns_rows": int(args.min_returns_rows),
         "paths": int(paths),
         "seed": int(args.seed),
+        "mc_variance_reduction": args.mc_variance_reduction,
+        "mc_sampler": args.mc_sampler,
+        "mc_randomizations": int(args.mc_randomizations),
+        "mc_block_size": args.mc_block_size,
+        "mc_workers": args.mc_workers,
+        "mc_target_stderr": args.mc_target_stderr,
+        "mc_target_rel_ci": args.mc_target_rel_ci,
+        "mc_time_budget_sec": args.mc_time_budget,
+        "mc_chunk_paths": int(args.mc_chunk_paths),
+        "mc_greeks": bool(args.mc_greeks),
         "backend": args.backend,
         "gpu_backend": args.gpu_backend,
         "binomial_steps": int(steps),
+        "binomial_acceleration": args.binomial_acceleration,
+        "pde_space_steps": int(args.pde_space_steps),
+        "pde_time_steps": int(args.pde_time_steps),
         "repeat": int(repeat),
+        "chain_file": args.chain_file,
+        "lsm": (
+            {"paths": args.lsm_paths, "exercise_dates": args.lsm_exercise_dates, "basis": args.lsm_basis}
+            if args.lsm_paths is not None
+            else None
+        ),
+        "risk_ladder": bool(args.risk_ladder),
+        "option_var": (
+            {
+                "paths": args.var_paths,
+                "alpha": args.var_alpha,
+                "horizon_days": args.var_horizon_days,
+                "workers": args.var_workers,
+            }
+            if args.option_var
+            else None
+        ),
+        "pricing_cache": {
+            "enabled": pricing_cache is not None,
+            "dir": str(pricing_cache_dir),
+            "max_mb": float(args.pricing_cache_max_mb),
+        },
         "download_patch": {
             "enabled": bool(enable_download_patch),
             "chunk_months": int(args.chunk_months),
@@ -476,17 +1118,57 @@ def run_pipeline(args: argparse.Namespace) -> Path:
         f"sigma_mode={args.sigma_mode} sigma_used={sigma_used:.8f}",
         f"bs_{args.option_type}={bs_selected:.8f}",
         f"binomial_{args.option_type}={bin_selected:.8f}",
+    ]
+    if bin_accelerated is not None:
+        summary_lines.append(
+            f"binomial_{bin_accelerated['method']}_{args.option_type}={bin_accelerated['price']:.8f} "
+            f"abs_error_vs_bs={bin_accelerated['abs_error_vs_bs']:.8e}"
+        )
+    summary_lines += [
+        f"pde_cn_{args.option_type}={pde_result['price']:.8f} abs_error_vs_bs={abs_err_pde:.8e}",
+        f"american_crr_{args.option_type}={american_ref:.8f} "
+        f"baw_abs_error_vs_crr={american_approx['baw']['abs_error_vs_crr']:.8e} "
+        f"bjerksund_stensland_abs_error_vs_crr={american_approx['bjerksund_stensland']['abs_error_vs_crr']:.8e}",
+        f"fourier_cos_{args.option_type}={cos_price:.8f} carr_madan_{args.option_type}={fft_price:.8f}",
         f"mc_{selected_mc_engine}_{args.option_type}={mc_selected:.8f} stderr={selected_mc['stderr']:.8f}",
         f"mc_ci95=[{selected_mc['ci_low']:.8f},{selected_mc['ci_high']:.8f}]",
+        f"mc_cpu_sampler={bench_mc_cpu['result']['sampler']} "
+        f"mc_cpu_variance_reduction={bench_mc_cpu['result']['variance_reduction']} "
+        f"vrf={bench_mc_cpu['result']['variance_reduction_factor']}",
         f"put_call_parity_abs_error={parity['abs_error']:.8e}",
         f"bounds_call_ok={bounds['call_within_bounds']} bounds_put_ok={bounds['put_within_bounds']}",
     ]
+    if chain_df is not None:
+        summary_lines.append(
+            f"chain_contracts={chain_df.shape[0]} chain_bs_mean_sec={bench_chain['mean_sec']:.6f}"
+        )
+    if pricing_cache is not None:
+        summary_lines.append(
+            f"pricing_cache_hits={pricing_cache.stats['memory_hits'] + pricing_cache.stats['disk_hits']} "
+            f"misses={pricing_cache.stats['misses']}"
+        )
     if gpu_note:
         summary_lines.append(gpu_note)
     summary_lines.append(f"outdir={outdir}")
 
     write_text(outdir / "logs.txt", "\n".join(summary_lines) + "\n")
 
+    binomial_md_lines: list[str] = []
+    if bin_accelerated is not None:
+        binomial_md_lines = [
+            f"- Binomial CRR {bin_accelerated['method']} ({args.option_type}, steps={steps}): `{bin_accelerated['price']:.8f}`",
+            f"- Binomial CRR abs error vs BS ({bin_accelerated['method']}): `{bin_accelerated['abs_error_vs_bs']:.8e}`",
+        ]
+
+    mc_greeks_md_lines: list[str] = []
+    if "mc_pathwise" in greeks_payload:
+        mc_greeks = greeks_payload["mc_pathwise"]
+        mc_greeks_md_lines = [
+            f"- Monte Carlo {name} ({'likelihood ratio' if name == 'gamma' else 'pathwise'}): "
+            f"`{mc_greeks[name]:.8f}` (stderr `{mc_greeks[name + '_stderr']:.8f}`)"
+            for name in ("delta", "vega", "gamma")
+        ]
+
     summary_md = "\n".join(
         [
             "# Derivatives Pricing Report",
@@ -503,9 +1185,30 @@ def run_pipeline(args: argparse.Namespace) -> Path:
             "## Prices",
             f"- Black-Scholes ({args.option_type}): `{bs_selected:.8f}`",
             f"- Binomial CRR ({args.option_type}, steps={steps}): `{bin_selected:.8f}`",
+            f"- Binomial CRR abs error vs BS (raw): `{abs_err_bin:.8e}`",
+            *binomial_md_lines,
+            f"- Crank-Nicolson PDE ({args.option_type}, {args.pde_space_steps}x{args.pde_time_steps}): `{pde_result['price']:.8f}`",
+            f"- Crank-Nicolson PDE abs error vs BS: `{abs_err_pde:.8e}`",
+            f"- American CRR ({args.option_type}, steps={steps}, {args.binomial_acceleration}): `{american_ref:.8f}`",
+            f"- American Barone-Adesi-Whaley / Bjerksund-Stensland: `{american_approx['baw']['price']:.8f}` / "
+            f"`{american_approx['bjerksund_stensland']['price']:.8f}` (abs error vs CRR "
+            f"`{american_approx['baw']['abs_error_vs_crr']:.8e}` / `{american_approx['bjerksund_stensland']['abs_error_vs_crr']:.8e}`)",
+            *(
+                [
+                    f"- American Longstaff-Schwartz ({args.lsm_exercise_dates} dates, {args.lsm_basis}, "
+                    f"paths={args.lsm_paths}): `{american_approx['lsm']['price']:.8f}` "
+                    f"(stderr `{american_approx['lsm']['stderr']:.8f}`)"
+                ]
+                if "lsm" in american_approx
+                else []
+            ),
+            f"- Fourier COS / Carr-Madan FFT ({args.option_type}): `{cos_price:.8f}` / `{fft_price:.8f}`",
             f"- Monte Carlo {selected_mc_engine} ({args.option_type}, paths={paths}): `{mc_selected:.8f}`",
             f"- Monte Carlo stderr: `{selected_mc['stderr']:.8f}`",
             f"- Monte Carlo 95% CI: `[{selected_mc['ci_low']:.8f}, {selected_mc['ci_high']:.8f}]`",
+            f"- Monte Carlo CPU variance reduction: `{bench_mc_cpu['result']['variance_reduction']}` "
+            f"(factor `{bench_mc_cpu['result']['variance_reduction_factor']}`)",
+            *mc_greeks_md_lines,
             "",
             "## No-Arbitrage",
             f"- Put-call parity abs error (BS call/put): `{parity['abs_error']:.8e}`",
@@ -515,6 +1218,30 @@ def run_pipeline(args: argparse.Namespace) -> Path:
     )
     if gpu_note:
         summary_md += f"- Note: `{gpu_note}`\n"
+    if chain_df is not None:
+        summary_md += "\n".join(
+            [
+                "## Option Chain",
+                f"- Contracts priced (Black-Scholes batch): `{chain_df.shape[0]}`",
+                f"- Batch pricing mean time: `{bench_chain['mean_sec']:.6f}` sec",
+                "- Output: `chain_prices.csv`",
+                f"- Chain no-arbitrage scan ({quoted}): `ok={chain_scan['ok']}` `{chain_scan['counts']}`",
+                "",
+            ]
+        )
+        if ladder is not None:
+            summary_md += (
+                f"- Risk ladder: `{ladder['revaluations']}` revaluations at "
+                f"`{ladder['sec_per_million']:.4f}` sec/million; worst book P&L "
+                f"`{ladder['book_pnl'].min():.4f}` (`risk_ladder.csv`)\n"
+            )
+        if option_var is not None:
+            summary_md += (
+                f"- Option-book VaR {option_var['alpha']:.0%} ({option_var['horizon_days']:g}d): full "
+                f"`{option_var['full']['var']:.4f}`, delta-gamma `{option_var['delta_gamma']['var']:.4f}` "
+                f"(rel error `{option_var['approximation_error']['var_rel']:.4%}`, "
+                f"`{option_var['approximation_error']['speedup']:.1f}x` faster)\n"
+            )
     write_text(outdir / "summary.md", summary_md)
 
     logger.info("Derivatives pricing pipeline")
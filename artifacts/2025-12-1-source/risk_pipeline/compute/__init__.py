@@ -0,0 +1 @@
+"""Compute backends and executors."""
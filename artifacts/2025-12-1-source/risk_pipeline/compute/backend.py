@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+
+import numpy as np
+from scipy.special import ndtr as _host_ndtr
+
+
+class BackendError(RuntimeError):
+    """Raised when the requested compute backend is unavailable."""
+
+
+@dataclass(frozen=True)
+class Backend:
+    """An array namespace ``xp`` plus the few operations the array API does not standardize.
+
+    Engines write their math once against ``xp``; NumPy, CuPy or any other array-API module plugs in here.
+    """
+
+    name: str
+    xp: ModuleType
+    is_gpu: bool
+    device_id: int | None = None
+
+    def asarray(self, x: Any, dtype=float):
+        if self.xp is not np:
+            # The array API spells dtypes as namespace attributes (xp.float64, xp.bool), not Python types.
+            dtype = {float: getattr(self.xp, "float64", float), bool: getattr(self.xp, "bool", bool)}.get(dtype, dtype)
+        return self.xp.asarray(x, dtype=dtype)
+
+    def to_numpy(self, x: Any) -> np.ndarray:
+        if self.is_gpu:
+            return self.xp.asnumpy(x)
+        return np.asarray(x)
+
+    def synchronize(self) -> None:
+        if self.is_gpu:
+            self.xp.cuda.Stream.null.synchronize()
+
+    def ndtr(self, x: Any):
+        """Standard normal CDF; modules without a native one round-trip through SciPy on the host."""
+        if self.xp is np:
+            return _host_ndtr(x)
+        if self.is_gpu:
+            from cupyx.scipy.special import ndtr  # type: ignore[import-not-found]
+
+            return ndtr(x)
+        return self.asarray(_host_ndtr(self.to_numpy(x)))
+
+    def default_rng(self, seed):
+        # CuPy draws on the device; every other backend draws with NumPy and copies blocks over.
+        if self.is_gpu:
+            return self.xp.random.default_rng(seed)
+        return np.random.default_rng(seed)
+
+
+def get_backend(name: str, device_id: int = 0) -> Backend:
+    normalized = name.strip().lower()
+    if normalized == "cpu":
+        return Backend(name="cpu", xp=np, is_gpu=False, device_id=None)
+    if normalized != "gpu":
+        raise ValueError(f"Unknown backend '{name}', expected one of: cpu, gpu")
+
+    try:
+        import cupy as cp  # type: ignore[import-not-found]
+    except Exception as exc:
+        raise BackendError(
+            "GPU backend requested but CuPy is not installed. Install a compatible cupy-cuda package."
+        ) from exc
+
+    try:
+        device_count = int(cp.cuda.runtime.getDeviceCount())
+    except Exception as exc:
+        raise BackendError(f"GPU backend requested but CUDA runtime is unavailable: {exc}") from exc
+    if device_count <= 0:
+        raise BackendError("GPU backend requested but no CUDA devices were found.")
+    if device_id < 0 or device_id >= device_count:
+        raise BackendError(f"GPU device {device_id} is out of range; available devices: 0..{device_count - 1}")
+
+    try:
+        cp.cuda.Device(device_id).use()
+    except Exception as exc:
+        raise BackendError(f"Failed to select CUDA device {device_id}: {exc}") from exc
+
+    return Backend(name="gpu", xp=cp, is_gpu=True, device_id=device_id)
+
+
+def resolve_backend(backend: Backend | ModuleType | str | None) -> Backend:
+    """Engine-facing lookup: None means NumPy; a bare array module is wrapped as a host backend."""
+    if backend is None:
+        return get_backend("cpu")
+    if isinstance(backend, Backend):
+        return backend
+    if isinstance(backend, str):
+        return get_backend(backend)
+    if backend is np:
+        return get_backend("cpu")
+    if getattr(backend, "__name__", "") == "cupy":
+        return get_backend("gpu")
+    return Backend(name=getattr(backend, "__name__", "custom"), xp=backend, is_gpu=False)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+
+def resolve_workers(workers: int | None) -> int:
+    if workers is None or workers == 0:
+        return max(1, os.cpu_count() or 1)
+    if workers < 0:
+        raise ValueError("workers must be >= 0 (0 means all cores)")
+    return int(workers)
+
+
+def split_budget(total: int, chunk: int) -> list[int]:
+    # Chunk layout depends only on (total, chunk), never on the worker count.
+    if total <= 0:
+        raise ValueError("total must be > 0")
+    if chunk <= 0:
+        raise ValueError("chunk must be > 0")
+    full, rest = divmod(int(total), int(chunk))
+    return [int(chunk)] * full + ([rest] if rest else [])
+
+
+def spawn_streams(seed: int, count: int) -> list[np.random.SeedSequence]:
+    return np.random.SeedSequence(seed).spawn(count)
+
+
+def run_chunks(fn: Callable[[Any], Any], tasks: Sequence[Any], workers: int) -> list[Any]:
+    """Evaluate fn over tasks and return results in task order, in-process or on a process pool."""
+    if workers <= 1 or len(tasks) <= 1:
+        return [fn(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return list(pool.map(fn, tasks))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from risk_pipeline.pricing.payoffs.vanilla import call_mask
+
+
+def load_option_chain(path: Path) -> pd.DataFrame:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        raw = pd.read_csv(path)
+    elif suffix in {".parquet", ".pq"}:
+        raw = pd.read_parquet(path)
+    else:
+        raise ValueError(f"Unsupported chain file type: {path.name} (expected .csv or .parquet)")
+
+    raw.columns = [str(c).strip().lower() for c in raw.columns]
+    missing = [c for c in ("strike", "option_type") if c not in raw.columns]
+    if missing:
+        raise ValueError(f"Chain file missing required columns: {missing}")
+
+    chain = raw.copy()
+    if "maturity_years" in chain.columns:
+        chain["maturity_years"] = chain["maturity_years"].astype(float)
+    elif "maturity_days" in chain.columns:
+        chain["maturity_years"] = chain["maturity_days"].astype(float) / 365.0
+    else:
+        raise ValueError("Chain file needs a maturity_days or maturity_years column")
+
+    chain["strike"] = chain["strike"].astype(float)
+    chain["option_type"] = chain["option_type"].astype(str).str.strip().str.lower()
+    if chain.empty:
+        raise ValueError(f"Chain file has no contracts: {path}")
+    if not np.isfinite(chain[["strike", "maturity_years"]].to_numpy()).all():
+        raise ValueError("Chain strike/maturity contain non-finite values")
+    if (chain["strike"] <= 0.0).any():
+        raise ValueError("Chain strikes must be positive")
+    if (chain["maturity_years"] < 0.0).any():
+        raise ValueError("Chain maturities must be >= 0")
+    chain["is_call"] = call_mask(chain["option_type"].to_numpy())
+    return chain.reset_index(drop=True)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 import numpy as np
 
+from risk_pipeline.compute.parallel import resolve_workers, run_chunks, spawn_streams, split_budget
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,3 +115,45 @@ def simulate_portfolio_losses(
         raise FloatingPointError("Non-finite portfolio_returns")
     losses = -portfolio_returns
     return losses
+
+
+def _returns_chunk(task: tuple) -> np.ndarray:
+    num_paths, stream, chol = task
+    z = np.random.default_rng(stream).standard_normal(size=(num_paths, chol.shape[0]))
+    return np.einsum("ij,kj->ki", chol, z, optimize=True)
+
+
+def simulate_returns_parallel(
+    cov: np.ndarray,
+    num_paths: int,
+    seed: int,
+    workers: int | None = None,
+    chunk_paths: int = 1 << 16,
+) -> np.ndarray:
+    """CPU-only multi-process variant; output depends on (seed, num_paths, chunk_paths), not on workers."""
+    cov_arr = np.asarray(cov, dtype=float)
+    if not _all_finite(cov_arr):
+        raise FloatingPointError("cov contains inf/nan")
+    chol = _stable_cholesky(cov_arr)
+    sizes = split_budget(num_paths, chunk_paths)
+    tasks = [(n, stream, chol) for n, stream in zip(sizes, spawn_streams(seed, len(sizes)))]
+    scenarios = np.concatenate(run_chunks(_returns_chunk, tasks, resolve_workers(workers)))
+    if not _all_finite(scenarios):
+        raise FloatingPointError("Non-finite scenarios")
+    return scenarios
+
+
+def simulate_portfolio_losses_parallel(
+    cov: np.ndarray,
+    weights: np.ndarray,
+    num_paths: int,
+    seed: int,
+    workers: int | None = None,
+    chunk_paths: int = 1 << 16,
+) -> np.ndarray:
+    """Portfolio losses on simulate_returns_parallel scenarios; output does not depend on workers."""
+    scenarios = simulate_returns_parallel(cov, num_paths, seed, workers=workers, chunk_paths=chunk_paths)
+    losses = -np.einsum("ij,j->i", scenarios, np.asarray(weights, dtype=float), optimize=True)
+    if not _all_finite(losses):
+        raise FloatingPointError("Non-finite portfolio losses")
+    return losses
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from risk_pipeline.io_utils import ensure_dir, make_cache_key, read_json
+
+
+# Bump an engine's version whenever its numerical output changes; old cache entries then stop matching.
+ENGINE_VERSIONS: dict[str, int] = {
+    "binomial_crr": 1,
+    "pde_cn": 1,
+    "mc_cpu": 4,
+    "mc_cpu_parallel": 4,
+}
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": value.tolist(), "dtype": str(value.dtype)}
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "__ndarray__" in value:
+            return np.asarray(value["__ndarray__"], dtype=value["dtype"])
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+class PricingCache:
+    """Content-addressed pricing results: an in-process LRU in front of a size-bounded JSON store.
+
+    Keys hash (engine, engine version, params) with ``make_cache_key``; params must be JSON-serializable
+    and fully determine the result (inputs, engine settings and seed). Values go in and come out as deep
+    copies, so callers may mutate what they stored or got back without touching the cache.
+    """
+
+    def __init__(self, root: Path | None = None, max_entries: int = 256, max_bytes: int = 64 << 20):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self.root = None if root is None else ensure_dir(Path(root))
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def key(self, engine: str, params: dict[str, Any]) -> str:
+        if engine not in ENGINE_VERSIONS:
+            raise KeyError(f"Unknown engine={engine}; register it in ENGINE_VERSIONS")
+        return make_cache_key({"engine": engine, "engine_version": ENGINE_VERSIONS[engine], "params": params})
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def lookup(self, engine: str, params: dict[str, Any]) -> tuple[bool, Any]:
+        key = self.key(engine, params)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return True, copy.deepcopy(self._memory[key])
+        if self.root is not None:
+            path = self._path(key)
+            try:
+                value = _decode(read_json(path)["value"])
+                # Touch on read so disk eviction is least-recently-used, not oldest-written.
+                os.utime(path)
+            except FileNotFoundError:
+                # Absent, or evicted by another process between the read and the touch: a miss either way.
+                pass
+            else:
+                self._remember(key, copy.deepcopy(value))
+                self.stats["disk_hits"] += 1
+                return True, value
+        self.stats["misses"] += 1
+        return False, None
+
+    def store(self, engine: str, params: dict[str, Any], value: Any) -> None:
+        key = self.key(engine, params)
+        self._remember(key, copy.deepcopy(value))
+        self.stats["stores"] += 1
+        if self.root is None:
+            return
+        path = self._path(key)
+        record = {"engine": engine, "engine_version": ENGINE_VERSIONS[engine], "params": params, "value": _encode(value)}
+        # A unique temp file per write, so concurrent stores of the same key never share a half-written file.
+        ensure_dir(path.parent)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8") as f:
+            tmp = Path(f.name)
+            try:
+                json.dump(record, f, indent=2, sort_keys=True)
+            except BaseException:
+                f.close()
+                tmp.unlink(missing_ok=True)
+                raise
+        os.replace(tmp, path)
+        self._evict_disk()
+
+    def get_or_compute(self, engine: str, params: dict[str, Any], fn: Callable[[], Any]) -> Any:
+        found, value = self.lookup(engine, params)
+        if not found:
+            value = fn()
+            self.store(engine, params, value)
+        return value
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        entries = []
+        for p in self.root.glob("*/*.json"):
+            # Other processes evict from the same directory; a file can vanish after the glob.
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats["evictions"] += 1
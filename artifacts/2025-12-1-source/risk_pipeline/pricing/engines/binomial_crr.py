@@ -3,57 +3,261 @@ from __future__ import annotations
 import math
 
 import numpy as np
+from scipy.special import gammaln, xlog1py, xlogy
+
+from risk_pipeline.compute.backend import Backend, resolve_backend
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
 
 
 _EPS = 1e-12
+# Richardson extrapolation is only offered on the smoothed tree: the raw CRR error oscillates with the
+# strike's position between nodes, so 2 * P(N) - P(N/2) on it is often worse than no extrapolation.
+CRR_ACCELERATIONS = ("none", "bbs", "bbsr")
 
 
-def crr_price(
+def binomial_log_weights(steps: int, p: float) -> np.ndarray:
+    j = np.arange(steps + 1, dtype=float)
+    log_choose = gammaln(steps + 1.0) - gammaln(j + 1.0) - gammaln(steps - j + 1.0)
+    return log_choose + xlogy(j, p) + xlog1py(steps - j, -p)
+
+
+def _exercise_levels(exercise: str, exercise_times, maturity: float, steps: int) -> np.ndarray:
+    levels = np.zeros(steps + 1, dtype=bool)
+    if exercise == "european":
+        return levels
+    if exercise == "american":
+        levels[:] = True
+        return levels
+    if exercise == "bermudan":
+        if exercise_times is None or len(exercise_times) == 0:
+            raise ValueError("bermudan exercise requires exercise_times")
+        times = np.asarray(exercise_times, dtype=float)
+        if np.any(times < 0.0) or np.any(times > maturity + _EPS):
+            raise ValueError("exercise_times must lie in [0, maturity]")
+        levels[np.rint(times / maturity * steps).astype(int)] = True
+        return levels
+    raise ValueError(f"Unsupported exercise={exercise}")
+
+
+def _induct_in_place(
+    values: np.ndarray,
+    intrinsic: np.ndarray,
+    exercise_levels: np.ndarray,
+    p: float,
+    disc: float,
+    steps: int,
+    top_level: int,
+    stop_level: int = 0,
+    backend: Backend | None = None,
+) -> np.ndarray:
+    # values holds layer top_level (last axis); level i reuses its first i+1 slots. intrinsic covers
+    # the 2*steps+1 lattice points spot*u**e, so level i reads its exercise values as a strided view.
+    # Only in-place operators and slice assignment are used, so any array-API namespace works. NumPy and
+    # CuPy also take the exercise max with out=, so no level allocates; other namespaces (no out= in the
+    # array API) allocate one temporary per exercise level.
+    be = resolve_backend(backend)
+    xp = be.xp
+    has_out = xp is np or be.is_gpu
+    scratch = xp.empty_like(values)
+    up = disc * p
+    down = disc * (1.0 - p)
+    for i in range(top_level - 1, stop_level - 1, -1):
+        n = i + 1
+        scratch[..., :n] = values[..., 1 : n + 1]
+        scratch[..., :n] *= up
+        values[..., :n] *= down
+        values[..., :n] += scratch[..., :n]
+        if exercise_levels[i]:
+            level = values[..., :n]
+            if has_out:
+                xp.maximum(level, intrinsic[..., steps - i : steps + i + 1 : 2], out=level)
+            else:
+                values[..., :n] = xp.maximum(level, intrinsic[..., steps - i : steps + i + 1 : 2])
+    result = xp.empty_like(values[..., : stop_level + 1])
+    result[...] = values[..., : stop_level + 1]
+    return result
+
+
+def _strike_ladder(spot: float, strike, is_call) -> tuple[np.ndarray, np.ndarray]:
+    k, call = np.broadcast_arrays(np.asarray(strike, dtype=float), np.asarray(is_call, dtype=bool))
+    if k.ndim != 1:
+        raise ValueError("strike must be a scalar or 1D array")
+    if spot <= 0.0 or np.any(k <= 0.0):
+        raise ValueError("spot and strike must be positive")
+    return k, call
+
+
+def _lattice_layers(
     spot: float,
-    strike: float,
+    k: np.ndarray,
+    call: np.ndarray,
     maturity: float,
     rate: float,
     dividend_yield: float,
     sigma: float,
-    option_type: str,
     steps: int,
-) -> float:
-    if steps <= 0:
-        raise ValueError("steps must be > 0")
-    if spot <= 0.0 or strike <= 0.0:
-        raise ValueError("spot and strike must be positive")
-
-    if maturity <= _EPS:
-        if option_type == "call":
-            return max(spot - strike, 0.0)
-        if option_type == "put":
-            return max(strike - spot, 0.0)
-        raise ValueError(f"Unsupported option_type={option_type}")
-
-    if sigma <= _EPS:
-        forward = spot * math.exp((rate - dividend_yield) * maturity)
-        payoff = max(forward - strike, 0.0) if option_type == "call" else max(strike - forward, 0.0)
-        return math.exp(-rate * maturity) * payoff
-
+    exercise_levels: np.ndarray,
+    acceleration: str,
+    levels: int,
+    backend: Backend | None = None,
+) -> list[np.ndarray]:
+    # Scalars and the level schedule stay on the host; the lattice and every layer live on the backend.
+    be = resolve_backend(backend)
+    xp = be.xp
+    call_col = be.asarray(call, dtype=bool)[:, None]
+    sign = be.asarray(np.where(call, 1.0, -1.0))[:, None]
+    k_col = be.asarray(k)[:, None]
     dt = maturity / steps
-    u = math.exp(sigma * math.sqrt(dt))
+    log_u = sigma * math.sqrt(dt)
+    u = math.exp(log_u)
     d = 1.0 / u
     growth = math.exp((rate - dividend_yield) * dt)
     p = (growth - d) / (u - d)
     if p < 0.0 or p > 1.0:
         raise ValueError(f"Invalid risk-neutral probability p={p:.6f}. Increase steps or validate inputs")
 
-    j = np.arange(steps + 1)
-    spot_t = spot * (u ** j) * (d ** (steps - j))
-    if option_type == "call":
-        values = np.maximum(spot_t - strike, 0.0)
-    elif option_type == "put":
-        values = np.maximum(strike - spot_t, 0.0)
+    # One lattice for the whole strike ladder; rows of the payoff matrix are strikes.
+    lattice = spot * xp.exp(be.asarray(np.arange(-steps, steps + 1)) * log_u)
+    if acceleration == "bbs":
+        # BBS: replace the last tree step by the Black-Scholes value over dt at each penultimate node.
+        top_level = steps - 1
+        values = bs_price_batch(lattice[1 : 2 * steps : 2], k_col, dt, rate, dividend_yield, sigma, call_col, backend=be)
     else:
-        raise ValueError(f"Unsupported option_type={option_type}")
+        top_level = steps
+        values = xp.maximum(sign * (lattice[::2] - k_col), 0.0)
+    if top_level < levels:
+        raise ValueError(f"steps too small to expose lattice level {levels}")
 
     disc = math.exp(-rate * dt)
-    for _ in range(steps, 0, -1):
-        values = disc * (p * values[1:] + (1.0 - p) * values[:-1])
+    intrinsic = None
+    if not exercise_levels[: top_level + 1].any():
+        # European exercise: discounted binomial expectation of the top layer, O(steps) per strike and node.
+        span = top_level - levels
+        weights = be.asarray(np.exp(binomial_log_weights(span, p)) * disc**span)
+        layer = xp.stack([values[:, j : j + span + 1] @ weights for j in range(levels + 1)], axis=1)
+    else:
+        intrinsic = xp.maximum(sign * (lattice - k_col), 0.0)
+        if exercise_levels[top_level]:
+            values = xp.maximum(values, intrinsic[:, steps - top_level : steps + top_level + 1 : 2])
+        layer = _induct_in_place(values, intrinsic, exercise_levels, p, disc, steps, top_level, stop_level=levels, backend=be)
+
+    layers = [layer]
+    for i in range(levels - 1, -1, -1):
+        layer = disc * (p * layer[:, 1:] + (1.0 - p) * layer[:, :-1])
+        if exercise_levels[i]:
+            layer = xp.maximum(layer, intrinsic[:, steps - i : steps + i + 1 : 2])
+        layers.append(layer)
+    return layers[::-1]
+
+
+def crr_price_batch(
+    spot: float,
+    strike,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    is_call,
+    steps: int,
+    exercise: str = "european",
+    exercise_times=None,
+    acceleration: str = "none",
+    backend: Backend | None = None,
+) -> np.ndarray:
+    """CRR prices for a strike ladder on one lattice; the induction runs on ``backend`` (NumPy by default)."""
+    if acceleration not in CRR_ACCELERATIONS:
+        raise ValueError(f"Unsupported acceleration={acceleration}; expected one of {CRR_ACCELERATIONS}")
+    if acceleration == "bbsr":
+        # Two-point Richardson on the BBS tree's smooth 1/N error term: 2 * P(N) - P(N/2).
+        fine = crr_price_batch(
+            spot, strike, maturity, rate, dividend_yield, sigma, is_call, steps,
+            exercise=exercise, exercise_times=exercise_times, acceleration="bbs", backend=backend,
+        )
+        coarse = crr_price_batch(
+            spot, strike, maturity, rate, dividend_yield, sigma, is_call, max(steps // 2, 1),
+            exercise=exercise, exercise_times=exercise_times, acceleration="bbs", backend=backend,
+        )
+        return 2.0 * fine - coarse
+    if steps <= 0:
+        raise ValueError("steps must be > 0")
+    k, call = _strike_ladder(spot, strike, is_call)
+    sign = np.where(call, 1.0, -1.0)
+    be = resolve_backend(backend)
+
+    if maturity <= _EPS:
+        return be.asarray(np.maximum(sign * (spot - k), 0.0))
+
+    exercise_levels = _exercise_levels(exercise, exercise_times, maturity, steps)
+
+    if sigma <= _EPS:
+        # Deterministic path: exercise at the best allowed date on the step grid.
+        t = np.linspace(0.0, maturity, steps + 1)
+        forward = spot * np.exp((rate - dividend_yield) * t)
+        discounted = np.exp(-rate * t) * np.maximum(sign[:, None] * (forward - k[:, None]), 0.0)
+        exercise_levels[-1] = True
+        return be.asarray(discounted[:, exercise_levels].max(axis=1))
 
-    return float(values[0])
+    layers = _lattice_layers(
+        spot, k, call, maturity, rate, dividend_yield, sigma, steps, exercise_levels, acceleration, levels=0, backend=be
+    )
+    return layers[0][:, 0]
+
+
+def crr_lattice_layers(
+    spot: float,
+    strike,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    is_call,
+    steps: int,
+    levels: int = 2,
+    exercise: str = "european",
+    exercise_times=None,
+    acceleration: str = "none",
+) -> list[np.ndarray]:
+    """Option values on the first tree levels: entry i has shape (strikes, i + 1), node j at spot*u**(2j-i).
+
+    Lattice Greeks (delta, gamma, theta) read these from the same tree that produces the price.
+    """
+    if acceleration not in {"none", "bbs"}:
+        raise ValueError(f"Lattice layers support acceleration none or bbs, got {acceleration}")
+    if steps <= 0:
+        raise ValueError("steps must be > 0")
+    if maturity <= _EPS or sigma <= _EPS:
+        raise ValueError("lattice layers need maturity > 0 and sigma > 0")
+    k, call = _strike_ladder(spot, strike, is_call)
+    exercise_levels = _exercise_levels(exercise, exercise_times, maturity, steps)
+    return _lattice_layers(spot, k, call, maturity, rate, dividend_yield, sigma, steps, exercise_levels, acceleration, levels)
+
+
+def crr_price(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    steps: int,
+    exercise: str = "european",
+    exercise_times=None,
+    acceleration: str = "none",
+) -> float:
+    if option_type not in {"call", "put"}:
+        raise ValueError(f"Unsupported option_type={option_type}")
+    prices = crr_price_batch(
+        spot,
+        np.array([strike], dtype=float),
+        maturity,
+        rate,
+        dividend_yield,
+        sigma,
+        option_type == "call",
+        steps,
+        exercise=exercise,
+        exercise_times=exercise_times,
+        acceleration=acceleration,
+    )
+    return float(prices[0])
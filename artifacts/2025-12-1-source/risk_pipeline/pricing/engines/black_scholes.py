@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
+from risk_pipeline.compute.backend import Backend, resolve_backend
+
 
 _EPS = 1e-12
 
@@ -58,3 +62,40 @@ def bs_price(spot: float, strike: float, maturity: float, rate: float, dividend_
 
 def bs_norm_terms(x: float) -> tuple[float, float]:
     return _norm_cdf(x), _norm_pdf(x)
+
+
+def bs_price_batch(spot, strike, maturity, rate, dividend_yield, sigma, is_call, backend: Backend | None = None) -> np.ndarray:
+    """Broadcast Black-Scholes prices, computed and returned on ``backend`` (NumPy by default)."""
+    be = resolve_backend(backend)
+    xp = be.xp
+    s, k, t, r, q, vol, call = xp.broadcast_arrays(
+        be.asarray(spot),
+        be.asarray(strike),
+        be.asarray(maturity),
+        be.asarray(rate),
+        be.asarray(dividend_yield),
+        be.asarray(sigma),
+        be.asarray(is_call, dtype=bool),
+    )
+    if xp.any(s <= 0.0) or xp.any(k <= 0.0):
+        raise ValueError("spot and strike must be positive")
+
+    expired = t <= _EPS
+    deterministic = ~expired & (vol <= _EPS)
+    one = xp.ones_like(s)
+    sign = xp.where(call, one, -one)
+
+    # Masked contracts get dummy inputs so the closed form stays finite; xp.where picks them out below.
+    t_safe = xp.where(expired, 1.0, t)
+    vol_safe = xp.where(vol <= _EPS, 1.0, vol)
+    discount_q = xp.exp(-q * t_safe)
+    discount_r = xp.exp(-r * t_safe)
+    denom = vol_safe * xp.sqrt(t_safe)
+    d1 = (xp.log(s / k) + (r - q + 0.5 * vol_safe * vol_safe) * t_safe) / denom
+    d2 = d1 - denom
+    price = sign * (s * discount_q * be.ndtr(sign * d1) - k * discount_r * be.ndtr(sign * d2))
+
+    forward = s * discount_q / discount_r
+    price = xp.where(deterministic, discount_r * xp.maximum(sign * (forward - k), 0.0), price)
+    price = xp.where(expired, xp.maximum(sign * (s - k), 0.0), price)
+    return price
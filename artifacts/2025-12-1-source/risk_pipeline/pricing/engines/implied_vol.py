@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+
+_EPS = 1e-12
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _black_otm(forward: np.ndarray, strike: np.ndarray, sqrt_t: np.ndarray, sigma: np.ndarray, theta: np.ndarray):
+    total_vol = sigma * sqrt_t
+    d1 = np.log(forward / strike) / total_vol + 0.5 * total_vol
+    d2 = d1 - total_vol
+    price = theta * (forward * ndtr(theta * d1) - strike * ndtr(theta * d2))
+    vega = forward * _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sqrt_t
+    volga = vega * d1 * d2 / sigma
+    return price, vega, volga
+
+
+def _initial_guess(otm_price: np.ndarray, forward: np.ndarray, strike: np.ndarray, maturity: np.ndarray, theta: np.ndarray) -> np.ndarray:
+    # Corrado-Miller closed form on the call-equivalent (undiscounted) price.
+    call = np.where(theta > 0.0, otm_price, otm_price + forward - strike)
+    half_gap = 0.5 * (forward - strike)
+    centred = call - half_gap
+    radicand = np.maximum(centred * centred - (forward - strike) ** 2 / math.pi, 0.0)
+    total_vol = math.sqrt(2.0 * math.pi) / (forward + strike) * (centred + np.sqrt(radicand))
+    guess = total_vol / np.sqrt(maturity)
+    # Brenner-Subrahmanyam fallback when the quadratic approximation degenerates.
+    fallback = math.sqrt(2.0 * math.pi) * otm_price / (forward * np.sqrt(maturity))
+    return np.where(np.isfinite(guess) & (guess > 0.0), guess, fallback)
+
+
+def implied_vol_batch(
+    price,
+    spot,
+    strike,
+    maturity,
+    rate,
+    dividend_yield,
+    is_call,
+    tol: float = 1e-10,
+    max_iter: int = 30,
+    sigma_low: float = 1e-6,
+    sigma_high: float = 5.0,
+) -> dict[str, np.ndarray]:
+    if max_iter <= 0:
+        raise ValueError("max_iter must be > 0")
+    if not (0.0 < sigma_low < sigma_high):
+        raise ValueError("Need 0 < sigma_low < sigma_high")
+
+    quote, s, k, t, r, q, call = np.broadcast_arrays(
+        np.asarray(price, dtype=float),
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(maturity, dtype=float),
+        np.asarray(rate, dtype=float),
+        np.asarray(dividend_yield, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    shape = quote.shape
+    quote, s, k, t, r, q, call = (a.ravel() for a in (quote, s, k, t, r, q, call))
+    if np.any(s <= 0.0) or np.any(k <= 0.0):
+        raise ValueError("spot and strike must be positive")
+
+    n = quote.size
+    sigma = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    iterations = np.zeros(n, dtype=np.int64)
+
+    # Solve on the out-of-the-money side (via parity) so deep ITM quotes keep their time value.
+    t_safe = np.maximum(t, _EPS)
+    forward = s * np.exp((r - q) * t_safe)
+    undiscounted = quote * np.exp(r * t_safe)
+    theta_in = np.where(call, 1.0, -1.0)
+    theta = np.where(k >= forward, 1.0, -1.0)
+    otm_price = undiscounted - np.where(theta_in != theta, theta_in * (forward - k), 0.0)
+    upper = np.where(theta > 0.0, forward, k)
+    # Parity leaves a few ulps of the forward/strike behind; time value below that (or the quote's own
+    # tolerance) carries no volatility information and would "converge" to noise.
+    noise = tol * undiscounted + 8.0 * np.finfo(float).eps * np.maximum(forward, k)
+    valid = (t > _EPS) & np.isfinite(quote) & (otm_price > noise) & (otm_price < upper)
+
+    idx = np.flatnonzero(valid)
+    if idx.size == 0:
+        return {"sigma": sigma.reshape(shape), "converged": converged.reshape(shape), "iterations": iterations.reshape(shape)}
+
+    f_fwd, f_k, f_t, f_theta, target = forward[idx], k[idx], t_safe[idx], theta[idx], otm_price[idx]
+    sqrt_t = np.sqrt(f_t)
+    lo = np.full(idx.size, sigma_low)
+    hi = np.full(idx.size, sigma_high)
+    vol = np.clip(_initial_guess(target, f_fwd, f_k, f_t, f_theta), sigma_low, sigma_high)
+    done = np.zeros(idx.size, dtype=bool)
+    iters = np.zeros(idx.size, dtype=np.int64)
+
+    for _ in range(max_iter):
+        act = np.flatnonzero(~done)
+        if act.size == 0:
+            break
+        v = vol[act]
+        model, vega, volga = _black_otm(f_fwd[act], f_k[act], sqrt_t[act], v, f_theta[act])
+        iters[act] += 1
+
+        # Newton/Halley on log(price): far better conditioned than raw price for deep OTM quotes.
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            diff = np.log(model / target[act])
+            slope = vega / model
+            curvature = volga / model - slope * slope
+            newton = -diff / slope
+            step = newton / (1.0 + 0.5 * newton * curvature / slope)
+
+        hit = np.abs(diff) <= tol
+        lo[act] = np.where(diff < 0.0, v, lo[act])
+        hi[act] = np.where(diff > 0.0, v, hi[act])
+
+        candidate = v + step
+        bisect = ~np.isfinite(candidate) | (candidate <= lo[act]) | (candidate >= hi[act])
+        candidate = np.where(bisect, 0.5 * (lo[act] + hi[act]), candidate)
+
+        small_step = np.abs(candidate - v) <= tol * np.maximum(v, 1.0)
+        vol[act] = np.where(hit, v, candidate)
+        done[act] = hit | small_step
+
+    sigma[idx] = vol
+    converged[idx] = done
+    iterations[idx] = iters
+    return {"sigma": sigma.reshape(shape), "converged": converged.reshape(shape), "iterations": iterations.reshape(shape)}
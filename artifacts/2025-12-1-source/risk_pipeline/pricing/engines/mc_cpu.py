@@ -1,13 +1,339 @@
 from __future__ import annotations
 
 import math
+import time
+from functools import reduce
 
 import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
 
+from risk_pipeline.compute.backend import Backend, resolve_backend
+from risk_pipeline.compute.parallel import resolve_workers, run_chunks, spawn_streams, split_budget
+from risk_pipeline.pricing.engines.black_scholes import bs_price, bs_price_batch
+from risk_pipeline.pricing.engines.mc_moments import RunningMoments
 from risk_pipeline.pricing.models.gbm import terminal_price_gbm
 from risk_pipeline.pricing.payoffs.vanilla import vanilla_payoff
 
 
+VARIANCE_REDUCTION_METHODS = ("antithetic", "moment_matching", "control_spot", "control_bs")
+SAMPLERS = ("pseudo", "sobol")
+_ADAPTIVE_FIRST_BATCH = 4096
+MC_GREEKS = ("delta", "vega", "gamma")
+
+
+def parse_variance_reduction(spec: str) -> tuple[str, ...]:
+    methods = tuple(m.strip().lower() for m in spec.split(",") if m.strip() and m.strip().lower() != "none")
+    unknown = [m for m in methods if m not in VARIANCE_REDUCTION_METHODS]
+    if unknown:
+        raise ValueError(f"Unknown variance reduction methods: {unknown}; expected some of {VARIANCE_REDUCTION_METHODS}")
+    if sum(m.startswith("control_") for m in methods) > 1:
+        raise ValueError("Use at most one control variate")
+    return tuple(dict.fromkeys(methods))
+
+
+def _control_mean(
+    control: str | None,
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+) -> float | None:
+    if control == "control_spot":
+        return spot * math.exp(-dividend_yield * maturity)
+    if control == "control_bs":
+        return bs_price(spot, strike, maturity, rate, dividend_yield, sigma, option_type)
+    return None
+
+
+def _half_time_bs_value(
+    z: np.ndarray,
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    backend: Backend,
+) -> np.ndarray:
+    # control_bs: the option's discounted Black-Scholes value at T/2, at a spot built from the same z.
+    # That spot has the exact T/2 law, so the control averages to the Black-Scholes price (the
+    # discounted value is a martingale), yet it is a smooth function of z rather than the payoff itself.
+    half = 0.5 * maturity
+    s_half = terminal_price_gbm(spot=spot, rate=rate, dividend_yield=dividend_yield, sigma=sigma, maturity=half, z=z, xp=backend.xp)
+    value = bs_price_batch(s_half, strike, half, rate, dividend_yield, sigma, option_type == "call", backend=backend)
+    return math.exp(-rate * half) * value
+
+
+def _average_legs(
+    z: np.ndarray,
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    methods: tuple[str, ...],
+    greeks: bool,
+    backend: Backend,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, np.ndarray | None]:
+    # Leg averages of (estimator, control, greek samples) plus the first leg's payoff alone (the VRF baseline).
+    xp = backend.xp
+    disc = math.exp(-rate * maturity)
+    legs = (z, -z) if "antithetic" in methods else (z,)
+
+    estimator = xp.zeros(z.shape[0])
+    control = xp.zeros(z.shape[0]) if any(m.startswith("control_") for m in methods) else None
+    greek_rows = xp.zeros((len(MC_GREEKS), z.shape[0])) if greeks else None
+    first = None
+    for leg in legs:
+        s_t = terminal_price_gbm(spot=spot, rate=rate, dividend_yield=dividend_yield, sigma=sigma, maturity=maturity, z=leg, xp=xp)
+        disc_payoff = disc * vanilla_payoff(spot=s_t, strike=strike, option_type=option_type, xp=xp)
+        if greek_rows is not None:
+            greek_rows += _greek_samples(leg, s_t, disc_payoff, spot, strike, maturity, sigma, disc, option_type, xp=xp)
+        estimator += disc_payoff
+        if first is None:
+            first = disc_payoff
+        if "control_spot" in methods:
+            control += disc * s_t
+        elif "control_bs" in methods:
+            control += _half_time_bs_value(leg, spot, strike, maturity, rate, dividend_yield, sigma, option_type, backend)
+    estimator /= len(legs)
+    if control is not None:
+        control = control / len(legs)
+    if greek_rows is not None:
+        greek_rows = greek_rows / len(legs)
+    return estimator, first, control, greek_rows
+
+
+def _sample_rows(
+    z: np.ndarray,
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    methods: tuple[str, ...],
+    greeks: bool = False,
+    backend: Backend | None = None,
+) -> np.ndarray:
+    # Rows: [estimator sample, plain single-path sample (VRF baseline), control sample (optional),
+    #        pathwise delta, pathwise vega, likelihood-ratio gamma (optional),
+    #        z, z^2 - 1 (moment matching only, of the matched draws)].
+    # Written against the backend's array namespace only, so the same math runs on every backend.
+    be = resolve_backend(backend)
+    args = (spot, strike, maturity, rate, dividend_yield, sigma, option_type, methods)
+    matched = "moment_matching" in methods
+    if matched:
+        z = (z - be.xp.mean(z)) / be.xp.std(z)
+    estimator, plain, control, greek_rows = _average_legs(z, *args, greeks, be)
+
+    rows = [estimator, plain]
+    if control is not None:
+        rows.append(control)
+    if greek_rows is not None:
+        rows.extend(greek_rows[i, :] for i in range(len(MC_GREEKS)))
+    if matched:
+        rows.extend([z, z * z - 1.0])
+    return be.xp.stack(rows)
+
+
+def _greek_samples(
+    z: np.ndarray,
+    s_t: np.ndarray,
+    disc_payoff: np.ndarray,
+    spot: float,
+    strike: float,
+    maturity: float,
+    sigma: float,
+    disc: float,
+    option_type: str,
+    xp=np,
+) -> np.ndarray:
+    # Pathwise delta/vega differentiate the payoff along the path (dS_T/dS_0 = S_T/S_0,
+    # dS_T/dsigma = S_T (sqrt(T) z - sigma T)); the kink makes the pathwise gamma zero, so gamma
+    # uses the likelihood-ratio score of log S_T instead. All three reuse z and s_t from pricing.
+    sqrt_t = math.sqrt(maturity)
+    zero = xp.zeros_like(s_t)
+    if option_type == "call":
+        slope = xp.where(s_t > strike, disc, zero)
+    else:
+        slope = xp.where(s_t < strike, -disc, zero)
+    delta = slope * s_t / spot
+    vega = slope * s_t * (sqrt_t * z - sigma * maturity)
+    score = ((z * z - 1.0) / (sigma * sigma * maturity) - z / (sigma * sqrt_t)) / (spot * spot)
+    return xp.stack([delta, vega, disc_payoff * score])
+
+
+def _variance_after_z_regression(cov: np.ndarray, weights: np.ndarray) -> float:
+    # Residual variance of weights @ rows after regressing on the trailing z and z^2 - 1 rows.
+    moments_of_z = [cov.shape[0] - 2, cov.shape[0] - 1]
+    c_wz = weights @ cov[:, moments_of_z]
+    coef = np.linalg.lstsq(cov[np.ix_(moments_of_z, moments_of_z)], c_wz, rcond=None)[0]
+    return max(float(weights @ cov @ weights - c_wz @ coef), 0.0)
+
+
+def estimate_from_moments(
+    moments: RunningMoments,
+    control_mean: float | None,
+    evals_per_sample: int,
+    matched: bool = False,
+) -> dict[str, float]:
+    count = moments.count
+    mean = moments.mean
+    cov = moments.comoment / (count - 1)
+    price = float(mean[0])
+    var = float(cov[0, 0])
+    beta = None
+    if control_mean is not None:
+        var_x = float(cov[2, 2])
+        if var_x > 0.0:
+            beta = float(cov[0, 2]) / var_x
+            price -= beta * (float(mean[2]) - control_mean)
+            var = max(var - beta * float(cov[0, 2]), 0.0)
+    if matched:
+        # Matched samples are not independent, so their spread misstates the error. Moment matching is
+        # asymptotically the z and z^2 - 1 control variates with optimal coefficients, so the variance is
+        # that of the estimator (less beta times the control) after regressing on z and z^2 - 1. The matched
+        # draws stand in for raw ones here: per block they differ by an O(1/sqrt(n)) affine map.
+        weights = np.zeros(mean.size)
+        weights[0] = 1.0
+        if beta is not None:
+            weights[2] = -beta
+        var = _variance_after_z_regression(cov, weights)
+    stderr = math.sqrt(var / count)
+    plain_var_of_mean = float(cov[1, 1]) / (count * evals_per_sample)
+    return {
+        "price": price,
+        "stderr": float(stderr),
+        "variance_reduction_factor": float(plain_var_of_mean / (stderr * stderr)) if stderr > 0.0 else None,
+        "control_beta": beta,
+        "plain_variance": float(cov[1, 1]),
+    }
+
+
+def greeks_from_moments(moments: RunningMoments, first_row: int, matched: bool = False) -> dict[str, float]:
+    count = moments.count
+    cov = moments.comoment / (count - 1)
+    out: dict[str, float] = {}
+    for i, name in enumerate(MC_GREEKS):
+        row = first_row + i
+        if matched:
+            # As for the price: the spread of matched samples misstates the error, the z-regressed residual does not.
+            weights = np.zeros(cov.shape[0])
+            weights[row] = 1.0
+            var = _variance_after_z_regression(cov, weights)
+        else:
+            var = float(cov[row, row])
+        out[name] = float(moments.mean[row])
+        out[f"{name}_stderr"] = float(math.sqrt(var / count))
+    return out
+
+
+def _accumulate(
+    normal_blocks,
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    methods: tuple[str, ...],
+    greeks: bool = False,
+    backend: Backend | None = None,
+) -> RunningMoments:
+    be = resolve_backend(backend)
+    moments: RunningMoments | None = None
+    for z in normal_blocks:
+        rows = _sample_rows(z, spot, strike, maturity, rate, dividend_yield, sigma, option_type, methods, greeks, be)
+        block = RunningMoments.from_rows(rows, be)
+        moments = block if moments is None else moments.merge(block)
+    if moments is None:
+        raise ValueError("no samples were generated")
+    return moments
+
+
+def _adaptive_moments(
+    rng: np.random.Generator,
+    max_samples: int,
+    block: int,
+    args: tuple,
+    control_mean: float | None,
+    evals_per_sample: int,
+    target_stderr: float | None,
+    target_rel_ci: float | None,
+    time_budget_sec: float | None,
+    backend: Backend | None = None,
+    matched: bool = False,
+) -> tuple[RunningMoments, str]:
+    t0 = time.perf_counter()
+    moments: RunningMoments | None = None
+    batch = min(_ADAPTIVE_FIRST_BATCH, max_samples)
+    while True:
+        n = min(batch, max_samples - (0 if moments is None else moments.count))
+        chunk = _accumulate(_pseudo_blocks(rng, n, min(block, n), backend), *args, backend)
+        moments = chunk if moments is None else moments.merge(chunk)
+        est = estimate_from_moments(moments, control_mean, evals_per_sample, matched)
+        goal = target_stderr
+        # With zero variance or a zero price so far (e.g. every payoff 0) a relative CI says nothing; keep drawing.
+        measurable = target_rel_ci is None or (est["stderr"] > 0.0 and est["price"] != 0.0)
+        if target_rel_ci is not None and measurable:
+            rel_goal = target_rel_ci * abs(est["price"]) / 1.96
+            goal = rel_goal if goal is None else min(goal, rel_goal)
+        if measurable and goal is not None and est["stderr"] <= goal:
+            return moments, "target_met"
+        if time_budget_sec is not None and time.perf_counter() - t0 >= time_budget_sec:
+            return moments, "time_budget" if measurable else "target_unreachable"
+        if moments.count >= max_samples:
+            return moments, "max_paths" if measurable else "target_unreachable"
+        # Aim for the projected sample count, but never more than double the total per round.
+        drawn = moments.count
+        per_sample_var = est["stderr"] ** 2 * drawn
+        projected = math.ceil(1.05 * per_sample_var / (goal * goal)) - drawn if goal and goal > 0.0 else drawn
+        batch = int(min(max(projected, _ADAPTIVE_FIRST_BATCH), drawn))
+
+
+def _check_greek_inputs(greeks: bool, maturity: float, sigma: float) -> None:
+    if greeks and (maturity <= 0.0 or sigma <= 0.0):
+        raise ValueError("Monte Carlo greeks need maturity > 0 and sigma > 0")
+
+
+def _pseudo_blocks(rng, samples: int, block_size: int, backend: Backend | None = None):
+    # NumPy reuses one normal buffer; the Generator stream is identical to a single full-length draw.
+    # Other backends take each block from their own generator (backend.default_rng).
+    be = resolve_backend(backend)
+    buf = np.empty(min(samples, block_size)) if be.xp is np else None
+    done = 0
+    while done < samples:
+        n = min(block_size, samples - done)
+        if buf is None:
+            yield be.asarray(rng.standard_normal(n))
+        else:
+            rng.standard_normal(out=buf[:n])
+            yield buf[:n]
+        done += n
+
+
+def _sobol_blocks(points: int, seed: np.random.SeedSequence, block_size: int):
+    # Consecutive power-of-two chunks of one scrambled sequence keep the Sobol balance properties.
+    engine = qmc.Sobol(d=1, scramble=True, seed=np.random.default_rng(seed))
+    block = 1 << (max(block_size, 2).bit_length() - 1)
+    done = 0
+    while done < points:
+        n = min(block, points - done)
+        u = engine.random(n)[:, 0]
+        yield ndtri(np.clip(u, 1e-16, 1.0 - 1e-16))
+        done += n
+
+
 def mc_price_cpu(
     spot: float,
     strike: float,
@@ -18,25 +344,185 @@ def mc_price_cpu(
     option_type: str,
     paths: int,
     seed: int,
+    variance_reduction: str = "none",
+    sampler: str = "pseudo",
+    randomizations: int = 16,
+    block_size: int | None = None,
+    target_stderr: float | None = None,
+    target_rel_ci: float | None = None,
+    time_budget_sec: float | None = None,
+    greeks: bool = False,
+    backend: Backend | None = None,
 ) -> dict[str, float]:
+    """European Monte Carlo price; the path math runs on ``backend`` (NumPy by default, see compute.backend)."""
     if paths <= 1:
         raise ValueError("paths must be > 1")
+    _check_greek_inputs(greeks, maturity, sigma)
+    adaptive = target_stderr is not None or target_rel_ci is not None or time_budget_sec is not None
+    if adaptive and sampler != "pseudo":
+        raise ValueError("adaptive targets require sampler='pseudo'")
+    if target_stderr is not None and target_stderr <= 0.0:
+        raise ValueError("target_stderr must be > 0")
+    if target_rel_ci is not None and target_rel_ci <= 0.0:
+        raise ValueError("target_rel_ci must be > 0")
+    if time_budget_sec is not None and time_budget_sec <= 0.0:
+        raise ValueError("time_budget_sec must be > 0")
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unsupported sampler={sampler}; expected one of {SAMPLERS}")
+    methods = parse_variance_reduction(variance_reduction)
+    evals_per_sample = 2 if "antithetic" in methods else 1
+    samples = paths // evals_per_sample
+    if samples <= 1:
+        raise ValueError("paths too small for the requested variance reduction")
+    control = next((m for m in methods if m.startswith("control_")), None)
+    control_mean = _control_mean(control, spot, strike, maturity, rate, dividend_yield, sigma, option_type)
+    if block_size is not None and block_size <= 1:
+        raise ValueError("block_size must be > 1")
+    # Without block_size everything is one block; with it memory stays O(block_size) for any path count.
+    block = samples if block_size is None else int(block_size)
+    args = (spot, strike, maturity, rate, dividend_yield, sigma, option_type, methods, greeks)
+    greek_row = 3 if control_mean is not None else 2
+    matched = "moment_matching" in methods
+    be = resolve_backend(backend)
 
-    rng = np.random.default_rng(seed)
-    z = rng.standard_normal(paths)
-    s_t = terminal_price_gbm(spot=spot, rate=rate, dividend_yield=dividend_yield, sigma=sigma, maturity=maturity, z=z)
-    payoff = vanilla_payoff(spot=s_t, strike=strike, option_type=option_type)
-    disc_payoff = math.exp(-rate * maturity) * payoff
+    t0 = time.perf_counter()
+    stop_reason = None
+    if sampler == "pseudo":
+        rng = be.default_rng(seed)
+        if adaptive:
+            # paths is the ceiling; batches grow until the stderr/CI target or the time budget is hit.
+            moments, stop_reason = _adaptive_moments(
+                rng, samples, block, args, control_mean, evals_per_sample, target_stderr, target_rel_ci, time_budget_sec, be,
+                matched,
+            )
+        else:
+            moments = _accumulate(_pseudo_blocks(rng, samples, block, be), *args, be)
+        est = estimate_from_moments(moments, control_mean, evals_per_sample, matched)
+        mean_price = est["price"]
+        stderr = est["stderr"]
+        vrf = est["variance_reduction_factor"]
+        used = moments.count
+        control_beta = est["control_beta"]
+        greek_values = greeks_from_moments(moments, greek_row, matched) if greeks else None
+    else:
+        # Randomized QMC: independent scramblings give i.i.d. estimates, so the stderr comes from their spread.
+        if randomizations < 2:
+            raise ValueError("sobol sampler needs randomizations >= 2")
+        per_rand = samples // randomizations
+        if per_rand < 2:
+            raise ValueError("paths too small for the requested number of randomizations")
+        per_rand = 1 << (per_rand.bit_length() - 1)
+        # Sobol points come from SciPy on the host and are copied to the backend block by block.
+        runs = [
+            _accumulate((be.asarray(z) for z in _sobol_blocks(per_rand, child, block)), *args, be)
+            for child in np.random.SeedSequence(seed).spawn(randomizations)
+        ]
+        estimates = [estimate_from_moments(run, control_mean, evals_per_sample, matched) for run in runs]
+        prices = np.array([e["price"] for e in estimates])
+        mean_price = float(prices.mean())
+        stderr = float(prices.std(ddof=1) / math.sqrt(randomizations))
+        used = per_rand * randomizations
+        plain_var_of_mean = float(np.mean([e["plain_variance"] for e in estimates])) / (used * evals_per_sample)
+        vrf = float(plain_var_of_mean / (stderr * stderr)) if stderr > 0.0 else None
+        control_beta = None
+        greek_values = None
+        if greeks:
+            per_run = np.array([[run.mean[greek_row + i] for i in range(len(MC_GREEKS))] for run in runs])
+            greek_values = {}
+            for i, name in enumerate(MC_GREEKS):
+                greek_values[name] = float(per_run[:, i].mean())
+                greek_values[f"{name}_stderr"] = float(per_run[:, i].std(ddof=1) / math.sqrt(randomizations))
+    elapsed = time.perf_counter() - t0
 
-    mean = float(np.mean(disc_payoff))
-    std = float(np.std(disc_payoff, ddof=1))
-    stderr = std / math.sqrt(paths)
     ci_half = 1.96 * stderr
+    return {
+        "price": mean_price,
+        "stderr": float(stderr),
+        "ci_low": float(mean_price - ci_half),
+        "ci_high": float(mean_price + ci_half),
+        "paths": int(used * evals_per_sample),
+        "sampler": sampler,
+        "randomizations": int(randomizations) if sampler == "sobol" else None,
+        "block_size": None if block_size is None else int(block_size),
+        "variance_reduction": ",".join(methods) if methods else "none",
+        "variance_reduction_factor": vrf,
+        "control_beta": control_beta,
+        "elapsed_sec": float(elapsed),
+        "efficiency": float(stderr * stderr * elapsed),
+        "max_paths": int(samples * evals_per_sample),
+        "stop_reason": stop_reason,
+        "greeks": greek_values,
+    }
+
+
+def _price_chunk(task: tuple) -> RunningMoments:
+    samples, stream, block, args = task
+    return _accumulate(_pseudo_blocks(np.random.default_rng(stream), samples, block), *args)
+
+
+def mc_price_cpu_parallel(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    paths: int,
+    seed: int,
+    workers: int | None = None,
+    chunk_paths: int = 1 << 16,
+    variance_reduction: str = "none",
+    block_size: int | None = None,
+    greeks: bool = False,
+) -> dict[str, float]:
+    if paths <= 1:
+        raise ValueError("paths must be > 1")
+    _check_greek_inputs(greeks, maturity, sigma)
+    methods = parse_variance_reduction(variance_reduction)
+    evals_per_sample = 2 if "antithetic" in methods else 1
+    samples = paths // evals_per_sample
+    chunk_samples = max(chunk_paths // evals_per_sample, 2)
+    if samples <= 1:
+        raise ValueError("paths too small for the requested variance reduction")
+    if block_size is not None and block_size <= 1:
+        raise ValueError("block_size must be > 1")
+    n_workers = resolve_workers(workers)
+    control = next((m for m in methods if m.startswith("control_")), None)
+    control_mean = _control_mean(control, spot, strike, maturity, rate, dividend_yield, sigma, option_type)
+    args = (spot, strike, maturity, rate, dividend_yield, sigma, option_type, methods, greeks)
 
+    # Chunks and their SeedSequence children are fixed by (seed, paths, chunk_paths); merging in chunk
+    # order makes the result bit-identical for any worker count.
+    sizes = split_budget(samples, chunk_samples)
+    block = chunk_samples if block_size is None else int(block_size)
+    tasks = [(n, stream, block, args) for n, stream in zip(sizes, spawn_streams(seed, len(sizes)))]
+
+    t0 = time.perf_counter()
+    moments = reduce(RunningMoments.merge, run_chunks(_price_chunk, tasks, n_workers))
+    matched = "moment_matching" in methods
+    est = estimate_from_moments(moments, control_mean, evals_per_sample, matched)
+    elapsed = time.perf_counter() - t0
+
+    mean_price = est["price"]
+    stderr = est["stderr"]
+    ci_half = 1.96 * stderr
     return {
-        "price": mean,
+        "price": mean_price,
         "stderr": float(stderr),
-        "ci_low": float(mean - ci_half),
-        "ci_high": float(mean + ci_half),
-        "paths": int(paths),
+        "ci_low": float(mean_price - ci_half),
+        "ci_high": float(mean_price + ci_half),
+        "paths": int(samples * evals_per_sample),
+        "sampler": "pseudo",
+        "randomizations": None,
+        "block_size": None if block_size is None else int(block_size),
+        "variance_reduction": ",".join(methods) if methods else "none",
+        "variance_reduction_factor": est["variance_reduction_factor"],
+        "control_beta": est["control_beta"],
+        "elapsed_sec": float(elapsed),
+        "efficiency": float(stderr * stderr * elapsed),
+        "workers": int(n_workers),
+        "chunks": len(sizes),
+        "chunk_paths": int(chunk_samples * evals_per_sample),
+        "greeks": greeks_from_moments(moments, 3 if control_mean is not None else 2, matched) if greeks else None,
     }
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import math
 from typing import Any
 
+from risk_pipeline.compute.backend import BackendError, get_backend
+from risk_pipeline.pricing.engines.mc_cpu import mc_price_cpu
+
 
 def mc_price_gpu_cupy(
     spot: float,
@@ -14,50 +16,37 @@ def mc_price_gpu_cupy(
     option_type: str,
     paths: int,
     seed: int,
+    greeks: bool = False,
+    device_id: int = 0,
 ) -> dict[str, Any]:
+    """mc_price_cpu's estimator dispatched to the CuPy backend; normals are drawn on the device."""
     if paths <= 1:
         raise ValueError("paths must be > 1")
+    if greeks and (maturity <= 0.0 or sigma <= 0.0):
+        raise ValueError("Monte Carlo greeks need maturity > 0 and sigma > 0")
 
     try:
-        import cupy as cp
-    except ImportError:
+        backend = get_backend("gpu", device_id=device_id)
+    except BackendError as exc:
         return {
             "available": False,
-            "reason": "cupy_not_installed",
+            "reason": str(exc),
         }
 
-    cp.random.seed(seed)
-    z = cp.random.standard_normal(paths, dtype=cp.float64)
-    drift = (rate - dividend_yield - 0.5 * sigma * sigma) * maturity
-    diffusion = sigma * math.sqrt(maturity) * z
-    s_t = spot * cp.exp(drift + diffusion)
-
-    if option_type == "call":
-        payoff = cp.maximum(s_t - strike, 0.0)
-    elif option_type == "put":
-        payoff = cp.maximum(strike - s_t, 0.0)
-    else:
-        raise ValueError(f"Unsupported option_type={option_type}")
-
-    disc_payoff = math.exp(-rate * maturity) * payoff
-    mean = float(cp.mean(disc_payoff).item())
-    std = float(cp.std(disc_payoff, ddof=1).item())
-    stderr = std / math.sqrt(paths)
-    ci_half = 1.96 * stderr
+    result = mc_price_cpu(
+        spot, strike, maturity, rate, dividend_yield, sigma, option_type, paths, seed, greeks=greeks, backend=backend
+    )
+    backend.synchronize()
 
     try:
-        device = cp.cuda.Device()
-        device_name = cp.cuda.runtime.getDeviceProperties(device.id)["name"].decode("utf-8")
+        cp = backend.xp
+        device_name = cp.cuda.runtime.getDeviceProperties(backend.device_id)["name"].decode("utf-8")
     except Exception:
         device_name = "unknown"
 
     return {
         "available": True,
-        "price": mean,
-        "stderr": float(stderr),
-        "ci_low": float(mean - ci_half),
-        "ci_high": float(mean + ci_half),
-        "paths": int(paths),
+        **result,
         "gpu_backend": "cupy",
         "device": device_name,
     }
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from risk_pipeline.compute.backend import Backend, resolve_backend
+
+
+@dataclass
+class RunningMoments:
+    """Count, mean vector and co-moment matrix of row-wise samples, mergeable with Chan's update."""
+
+    count: int
+    mean: np.ndarray
+    comoment: np.ndarray
+
+    @classmethod
+    def empty(cls, dims: int) -> RunningMoments:
+        return cls(count=0, mean=np.zeros(dims), comoment=np.zeros((dims, dims)))
+
+    @classmethod
+    def from_rows(cls, rows: np.ndarray, backend: Backend | None = None) -> RunningMoments:
+        # Reductions run where the rows live; only the small mean and co-moment come back to the host.
+        be = resolve_backend(backend)
+        mean = be.xp.mean(rows, axis=1)
+        centred = rows - mean[:, None]
+        return cls(count=int(rows.shape[1]), mean=be.to_numpy(mean), comoment=be.to_numpy(centred @ centred.T))
+
+    def merge(self, other: RunningMoments) -> RunningMoments:
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * (other.count / total)
+        comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.count * other.count / total)
+        return RunningMoments(count=total, mean=mean, comoment=comoment)
+
+    def update(self, rows: np.ndarray) -> RunningMoments:
+        return self.merge(RunningMoments.from_rows(rows))
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+from scipy.special import ndtr
+
+
+_EPS = 1e-12
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def bs_price_greeks_batch(spot, strike, maturity, rate, dividend_yield, sigma) -> dict[str, np.ndarray]:
+    s, k, t_in, r, q, vol_in = np.broadcast_arrays(
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(maturity, dtype=float),
+        np.asarray(rate, dtype=float),
+        np.asarray(dividend_yield, dtype=float),
+        np.asarray(sigma, dtype=float),
+    )
+    if np.any(s <= 0.0) or np.any(k <= 0.0):
+        raise ValueError("spot and strike must be positive")
+
+    # Greeks use the same clamping as bs_greeks; prices keep the bs_price edge-case semantics.
+    t = np.maximum(t_in, _EPS)
+    vol = np.maximum(vol_in, _EPS)
+    sqrt_t = np.sqrt(t)
+    vol_sqrt_t = vol * sqrt_t
+    discount_q = np.exp(-q * t)
+    discount_r = np.exp(-r * t)
+    d1 = (np.log(s / k) + (r - q + 0.5 * vol * vol) * t) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    n_d1 = ndtr(d1)
+    n_d2 = ndtr(d2)
+    pdf_d1 = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+
+    spot_q = s * discount_q
+    strike_r = k * discount_r
+    call_price = spot_q * n_d1 - strike_r * n_d2
+    # Not call - spot_q + strike_r: parity cancels catastrophically for deep out-of-the-money puts.
+    put_price = strike_r * ndtr(-d2) - spot_q * ndtr(-d1)
+
+    expired = t_in <= _EPS
+    deterministic = ~expired & (vol_in <= _EPS)
+    call_price = np.where(deterministic, np.maximum(spot_q - strike_r, 0.0), call_price)
+    put_price = np.where(deterministic, np.maximum(strike_r - spot_q, 0.0), put_price)
+    call_price = np.where(expired, np.maximum(s - k, 0.0), call_price)
+    put_price = np.where(expired, np.maximum(k - s, 0.0), put_price)
+
+    decay = -(spot_q * pdf_d1 * vol) / (2.0 * sqrt_t)
+    return {
+        "call_price": call_price,
+        "put_price": put_price,
+        "call_delta": discount_q * n_d1,
+        "put_delta": discount_q * (n_d1 - 1.0),
+        "gamma": discount_q * pdf_d1 / (s * vol_sqrt_t),
+        "vega": spot_q * pdf_d1 * sqrt_t,
+        "call_theta": decay - r * strike_r * n_d2 + q * spot_q * n_d1,
+        "put_theta": decay + r * strike_r * (1.0 - n_d2) - q * spot_q * (1.0 - n_d1),
+        "call_rho": k * t * discount_r * n_d2,
+        "put_rho": -k * t * discount_r * (1.0 - n_d2),
+    }
+
+
+def select_greeks(fused: dict[str, np.ndarray], option_type: str) -> dict[str, np.ndarray]:
+    if option_type not in {"call", "put"}:
+        raise ValueError(f"Unsupported option_type={option_type}")
+    return {
+        "price": fused[f"{option_type}_price"],
+        "delta": fused[f"{option_type}_delta"],
+        "gamma": fused["gamma"],
+        "vega": fused["vega"],
+        "theta": fused[f"{option_type}_theta"],
+        "rho": fused[f"{option_type}_rho"],
+    }
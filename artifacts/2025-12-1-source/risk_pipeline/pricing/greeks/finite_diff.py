@@ -1,6 +1,68 @@
 from __future__ import annotations
 
-from risk_pipeline.pricing.engines.black_scholes import bs_price
+import math
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.binomial_crr import CRR_ACCELERATIONS, crr_lattice_layers, crr_price_batch
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
+from risk_pipeline.pricing.engines.mc_moments import RunningMoments
+from risk_pipeline.pricing.models.gbm import terminal_price_gbm
+from risk_pipeline.pricing.payoffs.vanilla import vanilla_payoff
+
+
+def _scenario_inputs(
+    spot,
+    maturity,
+    rate,
+    sigma,
+    spot_bump: float,
+    vol_bump: float,
+    rate_bump: float,
+    dt: float,
+    shape: tuple[int, ...] = (),
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    s, t, r, vol = (np.broadcast_to(np.asarray(x, dtype=float), shape) for x in (spot, maturity, rate, sigma))
+    # Stacking order: base, spot up/down, vol up/down, rate up/down, shorter maturity.
+    spots = [s, s + spot_bump, np.maximum(s - spot_bump, 1e-8), s, s, s, s, s]
+    vols = [vol, vol, vol, vol + vol_bump, np.maximum(vol - vol_bump, 1e-8), vol, vol, vol]
+    rates = [r, r, r, r, r, r + rate_bump, r - rate_bump, r]
+    times = [t, t, t, t, t, t, t, np.maximum(t - dt, 1e-8)]
+    return tuple(np.stack(x) for x in (spots, vols, rates, times))
+
+
+def _difference_greeks(values: np.ndarray, spot_bump: float, vols: np.ndarray, rate_bump: float, dt: float) -> dict[str, np.ndarray]:
+    base, up, down, vol_up, vol_down, rate_up, rate_down, time_down = values
+    return {
+        "price": base,
+        "delta": (up - down) / (2.0 * spot_bump),
+        "gamma": (up - 2.0 * base + down) / (spot_bump * spot_bump),
+        # The down-bump is floored near zero vol, so divide by the spread actually taken.
+        "vega": (vol_up - vol_down) / (vols[3] - vols[4]),
+        "theta": (time_down - base) / dt,
+        "rho": (rate_up - rate_down) / (2.0 * rate_bump),
+    }
+
+
+def bs_greeks_finite_diff_batch(
+    spot,
+    strike,
+    maturity,
+    rate,
+    dividend_yield,
+    sigma,
+    is_call,
+    spot_bump: float = 1e-2,
+    vol_bump: float = 1e-4,
+    rate_bump: float = 1e-4,
+    time_bump_days: float = 1.0,
+) -> dict[str, np.ndarray]:
+    dt = time_bump_days / 365.0
+    shape = np.broadcast_shapes(*(np.shape(x) for x in (spot, strike, maturity, rate, dividend_yield, sigma, is_call)))
+    spots, vols, rates, times = _scenario_inputs(spot, maturity, rate, sigma, spot_bump, vol_bump, rate_bump, dt, shape)
+    # All bumped scenarios for every contract go through one vectorized pricing call.
+    values = bs_price_batch(spots, strike, times, rates, dividend_yield, vols, is_call)
+    return _difference_greeks(values, spot_bump, vols, rate_bump, dt)
 
 
 def bs_greeks_finite_diff(
@@ -16,33 +78,28 @@ def bs_greeks_finite_diff(
     rate_bump: float = 1e-4,
     time_bump_days: float = 1.0,
 ) -> dict[str, float]:
-    base = bs_price(spot, strike, maturity, rate, dividend_yield, sigma, option_type)
-
-    up = bs_price(spot + spot_bump, strike, maturity, rate, dividend_yield, sigma, option_type)
-    down = bs_price(max(spot - spot_bump, 1e-8), strike, maturity, rate, dividend_yield, sigma, option_type)
-    delta = (up - down) / (2.0 * spot_bump)
-    gamma = (up - 2.0 * base + down) / (spot_bump * spot_bump)
-
-    vega = (
-        bs_price(spot, strike, maturity, rate, dividend_yield, sigma + vol_bump, option_type)
-        - bs_price(spot, strike, maturity, rate, dividend_yield, max(sigma - vol_bump, 1e-8), option_type)
-    ) / (2.0 * vol_bump)
-
-    rho = (
-        bs_price(spot, strike, maturity, rate + rate_bump, dividend_yield, sigma, option_type)
-        - bs_price(spot, strike, maturity, rate - rate_bump, dividend_yield, sigma, option_type)
-    ) / (2.0 * rate_bump)
-
-    dt = time_bump_days / 365.0
-    shorter_t = max(maturity - dt, 1e-8)
-    theta = (bs_price(spot, strike, shorter_t, rate, dividend_yield, sigma, option_type) - base) / dt
+    if option_type not in {"call", "put"}:
+        raise ValueError(f"Unsupported option_type={option_type}")
+    batch = bs_greeks_finite_diff_batch(
+        spot,
+        strike,
+        maturity,
+        rate,
+        dividend_yield,
+        sigma,
+        option_type == "call",
+        spot_bump=spot_bump,
+        vol_bump=vol_bump,
+        rate_bump=rate_bump,
+        time_bump_days=time_bump_days,
+    )
 
     return {
-        "delta": float(delta),
-        "gamma": float(gamma),
-        "vega": float(vega),
-        "theta": float(theta),
-        "rho": float(rho),
+        "delta": float(batch["delta"]),
+        "gamma": float(batch["gamma"]),
+        "vega": float(batch["vega"]),
+        "theta": float(batch["theta"]),
+        "rho": float(batch["rho"]),
         "step": {
             "spot_bump": float(spot_bump),
             "vol_bump": float(vol_bump),
@@ -50,3 +107,113 @@ def bs_greeks_finite_diff(
             "time_bump_days": float(time_bump_days),
         },
     }
+
+
+def mc_greeks_finite_diff(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    paths: int,
+    seed: int,
+    block_size: int = 1 << 16,
+    spot_bump: float | None = None,
+    vol_bump: float = 1e-4,
+    rate_bump: float = 1e-4,
+    time_bump_days: float = 1.0,
+) -> dict[str, float]:
+    if paths <= 1:
+        raise ValueError("paths must be > 1")
+    if block_size <= 1:
+        raise ValueError("block_size must be > 1")
+    # Monte Carlo gamma variance grows like 1/bump, so the default spot bump is 1% of spot.
+    h = 0.01 * spot if spot_bump is None else float(spot_bump)
+    dt = time_bump_days / 365.0
+    spots, vols, rates, times = (x[:, None] for x in _scenario_inputs(spot, maturity, rate, sigma, h, vol_bump, rate_bump, dt))
+    disc = np.exp(-rates * times)
+
+    # Common random numbers: every scenario is revalued on the same normals, so the differences
+    # are per-path samples whose mean and stderr come from one streamed moment accumulator.
+    rng = np.random.default_rng(seed)
+    moments = RunningMoments.empty(6)
+    done = 0
+    while done < paths:
+        n = min(block_size, paths - done)
+        z = rng.standard_normal(n)
+        s_t = terminal_price_gbm(spot=spots, rate=rates, dividend_yield=dividend_yield, sigma=vols, maturity=times, z=z)
+        values = disc * vanilla_payoff(spot=s_t, strike=strike, option_type=option_type)
+        greeks = _difference_greeks(values, h, vols, rate_bump, dt)
+        moments = moments.update(np.vstack(list(greeks.values())))
+        done += n
+
+    out: dict[str, float] = {}
+    for i, name in enumerate(("price", "delta", "gamma", "vega", "theta", "rho")):
+        out[name] = float(moments.mean[i])
+        out[f"{name}_stderr"] = float(math.sqrt(moments.comoment[i, i] / (paths - 1) / paths))
+    out["paths"] = int(paths)
+    out["step"] = {
+        "spot_bump": float(h),
+        "vol_bump": float(vol_bump),
+        "rate_bump": float(rate_bump),
+        "time_bump_days": float(time_bump_days),
+    }
+    return out
+
+
+def crr_greeks_batch(
+    spot: float,
+    strike,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    is_call,
+    steps: int,
+    exercise: str = "european",
+    exercise_times=None,
+    acceleration: str = "none",
+    rate_bump: float = 1e-4,
+) -> dict[str, np.ndarray]:
+    if steps < 3:
+        raise ValueError("steps must be >= 3 for lattice greeks")
+    if acceleration not in CRR_ACCELERATIONS:
+        raise ValueError(f"Unsupported acceleration={acceleration}; expected one of {CRR_ACCELERATIONS}")
+    if acceleration == "bbsr":
+        # Extrapolate the Greeks exactly like the price: 2 * G(N) - G(N/2).
+        kwargs = {"exercise": exercise, "exercise_times": exercise_times, "acceleration": "bbs"}
+        fine = crr_greeks_batch(spot, strike, maturity, rate, dividend_yield, sigma, is_call, steps, rate_bump=rate_bump, **kwargs)
+        coarse = crr_greeks_batch(
+            spot, strike, maturity, rate, dividend_yield, sigma, is_call, max(steps // 2, 3), rate_bump=rate_bump, **kwargs
+        )
+        return {name: 2.0 * fine[name] - coarse[name] for name in fine}
+
+    kwargs = {"exercise": exercise, "exercise_times": exercise_times, "acceleration": acceleration}
+    # Delta, gamma and theta come from levels 0-2 of the pricing tree itself (no re-pricing).
+    v0, _, v2 = crr_lattice_layers(spot, strike, maturity, rate, dividend_yield, sigma, is_call, steps, levels=2, **kwargs)
+    dt = maturity / steps
+    u2 = math.exp(2.0 * sigma * math.sqrt(dt))
+    s_up = spot * u2
+    s_down = spot / u2
+    delta_up = (v2[:, 2] - v2[:, 1]) / (s_up - spot)
+    delta_down = (v2[:, 1] - v2[:, 0]) / (spot - s_down)
+
+    def reprice(vol: float, r: float, n: int) -> np.ndarray:
+        return crr_price_batch(spot, strike, maturity, r, dividend_yield, vol, is_call, n, **kwargs)
+
+    # CRR prices saw-tooth in sigma as the node spacing sigma * sqrt(dt) slides past the strike, so a
+    # plain sigma bump differentiates the oscillation. Fixed-grid vega instead: the bumped trees take
+    # N +/- 2 steps with sigma scaled by sqrt(N' / N), which keeps the spacing, node parity and hence the
+    # strike's position in the lattice unchanged. The rate bump only moves p, so u and d already stay put.
+    vol_up = sigma * math.sqrt((steps + 2) / steps)
+    vol_down = sigma * math.sqrt((steps - 2) / steps)
+    return {
+        "price": v0[:, 0],
+        "delta": (v2[:, 2] - v2[:, 0]) / (s_up - s_down),
+        "gamma": (delta_up - delta_down) / (0.5 * (s_up - s_down)),
+        "theta": (v2[:, 1] - v0[:, 0]) / (2.0 * dt),
+        "vega": (reprice(vol_up, rate, steps + 2) - reprice(vol_down, rate, steps - 2)) / (vol_up - vol_down),
+        "rho": (reprice(sigma, rate + rate_bump, steps) - reprice(sigma, rate - rate_bump, steps)) / (2.0 * rate_bump),
+    }
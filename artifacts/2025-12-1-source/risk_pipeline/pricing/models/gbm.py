@@ -1,9 +1,45 @@
 from __future__ import annotations
 
+import math
+from typing import Iterator
+
 import numpy as np
 
 
-def terminal_price_gbm(spot: float, rate: float, dividend_yield: float, sigma: float, maturity: float, z: np.ndarray) -> np.ndarray:
+def terminal_price_gbm(
+    spot: float, rate: float, dividend_yield: float, sigma: float, maturity: float, z: np.ndarray, xp=np
+) -> np.ndarray:
     drift = (rate - dividend_yield - 0.5 * sigma * sigma) * maturity
-    diffusion = sigma * np.sqrt(maturity) * z
-    return spot * np.exp(drift + diffusion)
+    # ** 0.5 keeps a float maturity a Python float (array-API arrays reject NumPy scalars) and works on arrays.
+    diffusion = sigma * maturity**0.5 * z
+    return spot * xp.exp(drift + diffusion)
+
+
+def iterate_gbm_steps(
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    maturity: float,
+    steps: int,
+    paths: int,
+    rng: np.random.Generator,
+) -> Iterator[np.ndarray]:
+    """Yield the spot of every path after each time step, updated in place in one reused buffer.
+
+    Only O(paths) memory is held; consumers must copy a yielded array if they need it past the next step.
+    """
+    if steps <= 0:
+        raise ValueError("steps must be > 0")
+    dt = maturity / steps
+    drift = (rate - dividend_yield - 0.5 * sigma * sigma) * dt
+    vol = sigma * math.sqrt(dt)
+    s = np.full(paths, float(spot))
+    growth = np.empty(paths)
+    for _ in range(steps):
+        rng.standard_normal(out=growth)
+        np.multiply(growth, vol, out=growth)
+        np.add(growth, drift, out=growth)
+        np.exp(growth, out=growth)
+        np.multiply(s, growth, out=s)
+        yield s
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+import pandas as pd
+
 
 def put_call_parity_check(call: float, put: float, spot: float, strike: float, rate: float, dividend_yield: float, maturity: float) -> dict[str, float]:
     lhs = call - put
@@ -29,3 +32,122 @@ def bounds_check_call_put(call: float, put: float, spot: float, strike: float, r
         "call_within_bounds": bool(call_lb - 1e-10 <= call <= call_ub + 1e-10),
         "put_within_bounds": bool(put_lb - 1e-10 <= put <= put_ub + 1e-10),
     }
+
+
+CHAIN_CHECKS = ("bounds", "parity", "vertical_spread", "butterfly", "calendar")
+
+
+def _flag(check: str, quote: np.ndarray, other: np.ndarray, amount: np.ndarray, tol: float) -> pd.DataFrame:
+    bad = amount > tol
+    return pd.DataFrame(
+        {
+            "check": check,
+            "quote": quote[bad].astype(np.int64),
+            "other": other[bad].astype(np.int64),
+            "amount": amount[bad].astype(float),
+        }
+    )
+
+
+def _calendar_violations(
+    k: np.ndarray,
+    t: np.ndarray,
+    call_equiv: np.ndarray,
+    idx: np.ndarray,
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    tol: float,
+) -> list[pd.DataFrame]:
+    # At fixed forward moneyness x = K / F_T the normalized call e^{qT} C / S is nondecreasing in T.
+    # The later expiry is linearly interpolated; for a convex curve that overstates it, so the check
+    # never flags a quote that is actually arbitrage-free.
+    x = k / (spot * np.exp((rate - dividend_yield) * t))
+    value = call_equiv * np.exp(dividend_yield * t) / spot
+    expiries = np.unique(t)
+    out = []
+    for near, far in zip(expiries[:-1], expiries[1:]):
+        a = t == near
+        b = t == far
+        order = np.argsort(x[b])
+        xb, vb, ib = x[b][order], value[b][order], idx[b][order]
+        inside = (x[a] >= xb[0]) & (x[a] <= xb[-1])
+        if xb.size < 2 or not inside.any():
+            continue
+        bound = np.interp(x[a][inside], xb, vb)
+        nearest = ib[np.clip(np.searchsorted(xb, x[a][inside]), 0, xb.size - 1)]
+        out.append(_flag("calendar", idx[a][inside], nearest, value[a][inside] - bound, tol))
+    return out
+
+
+def scan_chain_arbitrage(
+    strike,
+    maturity,
+    price,
+    is_call,
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    tol: float = 1e-8,
+) -> dict[str, object]:
+    k, t, px, call = np.broadcast_arrays(
+        np.asarray(strike, dtype=float),
+        np.asarray(maturity, dtype=float),
+        np.asarray(price, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    if k.ndim != 1:
+        raise ValueError("quotes must be 1D arrays")
+    if spot <= 0.0 or np.any(k <= 0.0) or np.any(t <= 0.0):
+        raise ValueError("spot, strike and maturity must be positive")
+    idx = np.arange(k.size)
+    disc_r = np.exp(-rate * t)
+    disc_q_spot = spot * np.exp(-dividend_yield * t)
+    forward_gap = disc_q_spot - k * disc_r
+    found: list[pd.DataFrame] = []
+
+    # Static bounds: max(0, +-(S e^{-qT} - K e^{-rT})) <= price <= S e^{-qT} (call) / K e^{-rT} (put).
+    lower = np.maximum(np.where(call, forward_gap, -forward_gap), 0.0)
+    upper = np.where(call, disc_q_spot, k * disc_r)
+    found.append(_flag("bounds", idx, np.full(k.size, -1), np.maximum(lower - px, px - upper), tol))
+
+    # Parity: sort by (T, K, type) so each put sits right before its call.
+    order = np.lexsort((call, k, t))
+    p0, p1 = order[:-1], order[1:]
+    pair = (t[p0] == t[p1]) & (k[p0] == k[p1]) & ~call[p0] & call[p1]
+    p0, p1 = p0[pair], p1[pair]
+    found.append(_flag("parity", p1, p0, np.abs(px[p1] - px[p0] - forward_gap[p1]), tol))
+
+    # Vertical spreads and butterflies within each (type, expiry) strike ladder.
+    order = np.lexsort((k, t, call))
+    same = (call[order[:-1]] == call[order[1:]]) & (t[order[:-1]] == t[order[1:]]) & (k[order[:-1]] < k[order[1:]])
+    lo, hi = order[:-1][same], order[1:][same]
+    sign = np.where(call[lo], 1.0, -1.0)
+    spread = sign * (px[lo] - px[hi])
+    width = (k[hi] - k[lo]) * disc_r[lo]
+    found.append(_flag("vertical_spread", hi, lo, np.maximum(-spread, spread - width), tol))
+
+    triple = same[:-1] & same[1:]
+    a, b, c = order[:-2][triple], order[1:-1][triple], order[2:][triple]
+    w = (k[c] - k[b]) / (k[c] - k[a])
+    found.append(_flag("butterfly", b, a, px[b] - (w * px[a] + (1.0 - w) * px[c]), tol))
+
+    # Calendar: puts are mapped to calls through parity so both sides share one condition.
+    for side in (True, False):
+        mask = call == side
+        if mask.any():
+            call_equiv = px[mask] if side else px[mask] + forward_gap[mask]
+            found.extend(
+                _calendar_violations(k[mask], t[mask], call_equiv, idx[mask], spot, rate, dividend_yield, tol)
+            )
+
+    violations = pd.concat(found, ignore_index=True)
+    violations["strike"] = k[violations["quote"].to_numpy()]
+    violations["maturity"] = t[violations["quote"].to_numpy()]
+    counts = violations["check"].value_counts()
+    return {
+        "quotes": int(k.size),
+        "violations": violations,
+        "counts": {name: int(counts.get(name, 0)) for name in CHAIN_CHECKS},
+        "ok": bool(violations.empty),
+    }
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+from risk_pipeline.pricing.payoffs.vanilla import vanilla_payoff
+
+
+PATH_PRODUCTS = (
+    "asian_arithmetic",
+    "asian_geometric",
+    "barrier_up_out",
+    "barrier_up_in",
+    "barrier_down_out",
+    "barrier_down_in",
+    "lookback_fixed",
+    "lookback_floating",
+)
+
+
+class PathPayoffState:
+    """Running per-path state for a discretely monitored payoff; memory is O(paths), not O(paths x steps)."""
+
+    def __init__(self, product: str, spot: float, paths: int, barrier: float | None = None):
+        if product not in PATH_PRODUCTS:
+            raise ValueError(f"Unsupported product={product}; expected one of {PATH_PRODUCTS}")
+        if product.startswith("barrier_") and (barrier is None or barrier <= 0.0):
+            raise ValueError("barrier products need a positive barrier level")
+        self.product = product
+        self.barrier = barrier
+        self.steps = 0
+        self.last = np.full(paths, float(spot))
+        if product.startswith("asian_"):
+            self.acc = np.zeros(paths)
+            self.scratch = np.empty(paths)
+        elif product.startswith("barrier_"):
+            up = "_up_" in product
+            self.acc = np.full(paths, spot >= barrier if up else spot <= barrier)
+            self.hit = np.empty(paths, dtype=bool)
+        elif product.startswith("lookback_"):
+            # Fixed-strike calls need the running max, puts the running min; floating needs the opposite.
+            self.acc_max = np.full(paths, float(spot))
+            self.acc_min = np.full(paths, float(spot))
+
+    def update(self, s: np.ndarray) -> None:
+        self.steps += 1
+        np.copyto(self.last, s)
+        if self.product == "asian_arithmetic":
+            np.add(self.acc, s, out=self.acc)
+        elif self.product == "asian_geometric":
+            np.log(s, out=self.scratch)
+            np.add(self.acc, self.scratch, out=self.acc)
+        elif self.product.startswith("barrier_"):
+            if "_up_" in self.product:
+                np.greater_equal(s, self.barrier, out=self.hit)
+            else:
+                np.less_equal(s, self.barrier, out=self.hit)
+            np.logical_or(self.acc, self.hit, out=self.acc)
+        else:
+            np.maximum(self.acc_max, s, out=self.acc_max)
+            np.minimum(self.acc_min, s, out=self.acc_min)
+
+    def payoff(self, strike: float, option_type: str) -> np.ndarray:
+        if self.steps == 0:
+            raise ValueError("payoff requested before any update")
+        if self.product == "asian_arithmetic":
+            return vanilla_payoff(self.acc / self.steps, strike, option_type)
+        if self.product == "asian_geometric":
+            return vanilla_payoff(np.exp(self.acc / self.steps), strike, option_type)
+        if self.product.startswith("barrier_"):
+            alive = self.acc if self.product.endswith("_in") else ~self.acc
+            return np.where(alive, vanilla_payoff(self.last, strike, option_type), 0.0)
+        if self.product == "lookback_fixed":
+            extreme = self.acc_max if option_type == "call" else self.acc_min
+            return vanilla_payoff(extreme, strike, option_type)
+        if option_type == "call":
+            return self.last - self.acc_min
+        if option_type == "put":
+            return self.acc_max - self.last
+        raise ValueError(f"Unsupported option_type={option_type}")
+
+
+def geometric_asian_price(
+    spot: float,
+    strike: float,
+    maturity: float,
+    rate: float,
+    dividend_yield: float,
+    sigma: float,
+    option_type: str,
+    steps: int,
+) -> float:
+    # Closed form for the discretely monitored geometric average over t_i = i * T / steps, i = 1..steps.
+    dt = maturity / steps
+    mu = math.log(spot) + (rate - dividend_yield - 0.5 * sigma * sigma) * dt * (steps + 1) / 2.0
+    var = sigma * sigma * dt * (steps + 1) * (2 * steps + 1) / (6.0 * steps)
+    sd = math.sqrt(var)
+    d1 = (mu - math.log(strike) + var) / sd
+    d2 = d1 - sd
+    forward = math.exp(mu + 0.5 * var)
+    disc = math.exp(-rate * maturity)
+    if option_type == "call":
+        return disc * (forward * float(ndtr(d1)) - strike * float(ndtr(d2)))
+    if option_type == "put":
+        return disc * (strike * float(ndtr(-d2)) - forward * float(ndtr(-d1)))
+    raise ValueError(f"Unsupported option_type={option_type}")
@@ -3,9 +3,19 @@ from __future__ import annotations
 import numpy as np
 
 
-def vanilla_payoff(spot: np.ndarray, strike: float, option_type: str) -> np.ndarray:
+def vanilla_payoff(spot: np.ndarray, strike: float, option_type: str, xp=np) -> np.ndarray:
     if option_type == "call":
-        return np.maximum(spot - strike, 0.0)
+        return xp.maximum(spot - strike, 0.0)
     if option_type == "put":
-        return np.maximum(strike - spot, 0.0)
+        return xp.maximum(strike - spot, 0.0)
     raise ValueError(f"Unsupported option_type={option_type}")
+
+
+def call_mask(option_type) -> np.ndarray:
+    types = np.char.lower(np.asarray(option_type, dtype=str))
+    is_call = types == "call"
+    unsupported = ~(is_call | (types == "put"))
+    if np.any(unsupported):
+        bad = sorted(set(np.asarray(types)[unsupported].tolist()))
+        raise ValueError(f"Unsupported option_type values: {bad}")
+    return is_call
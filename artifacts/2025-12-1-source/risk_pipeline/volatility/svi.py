@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.optimize import least_squares
+
+
+SVI_PARAMS = ("a", "b", "rho", "m", "s")
+
+
+def svi_total_variance(log_moneyness, params) -> np.ndarray:
+    """Raw SVI total variance w(k) = a + b (rho (k - m) + sqrt((k - m)^2 + s^2)).
+
+    ``params`` is (5,) for one slice or (..., 5) matched row-by-row with ``log_moneyness``.
+    """
+    p = np.asarray(params, dtype=float)
+    a, b, rho, m, s = (p[..., i] for i in range(5))
+    y = np.asarray(log_moneyness, dtype=float) - m
+    return a + b * (rho * y + np.sqrt(y * y + s * s))
+
+
+def _linear_fit(k: np.ndarray, w: np.ndarray, weights: np.ndarray, m: np.ndarray, s: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # For fixed (m, s) the slice is linear in (a, b*rho, b): solve every candidate's weighted normal
+    # equations in one batched call and keep the best feasible one.
+    y = k[None, :] - m[:, None]
+    design = np.stack([np.ones_like(y), y, np.sqrt(y * y + (s * s)[:, None])], axis=-1)
+    weighted = design * weights[None, :, None]
+    normal = np.einsum("cni,cnj->cij", weighted, design) + 1e-12 * np.eye(3)
+    coef = np.linalg.solve(normal, np.einsum("cni,n->ci", weighted, w)[..., None])[..., 0]
+    b = np.maximum(coef[:, 2], 1e-8)
+    rho = np.clip(coef[:, 1] / b, -0.999, 0.999)
+    params = np.column_stack([coef[:, 0], b, rho, m, s])
+    resid = svi_total_variance(k[None, :], params[:, None, :]) - w[None, :]
+    return params, np.sum(weights[None, :] * resid * resid, axis=1)
+
+
+def calibrate_svi_slice(log_moneyness, total_variance, weights=None, grid_size: int = 16) -> dict[str, np.ndarray | float]:
+    k = np.asarray(log_moneyness, dtype=float)
+    w = np.asarray(total_variance, dtype=float)
+    if k.ndim != 1 or k.shape != w.shape:
+        raise ValueError("log_moneyness and total_variance must be 1D arrays of equal length")
+    if k.size < len(SVI_PARAMS):
+        raise ValueError(f"SVI slice needs at least {len(SVI_PARAMS)} quotes, got {k.size}")
+    if not (np.isfinite(k).all() and np.isfinite(w).all()) or np.any(w <= 0.0):
+        raise ValueError("total_variance must be finite and > 0")
+    wt = np.ones_like(k) if weights is None else np.broadcast_to(np.asarray(weights, dtype=float), k.shape)
+    if np.any(wt < 0.0) or not np.any(wt > 0.0):
+        raise ValueError("weights must be >= 0 and not all zero")
+
+    # Coarse start: a (m, s) grid solved in closed form, then a bounded Gauss-Newton polish of all five.
+    span = max(float(k.max() - k.min()), 1e-3)
+    m_grid, s_grid = np.meshgrid(np.linspace(k.min(), k.max(), grid_size), span * np.geomspace(1e-3, 2.0, grid_size))
+    start, sse = _linear_fit(k, w, wt, m_grid.ravel(), s_grid.ravel())
+    x0 = start[int(np.argmin(sse))]
+
+    root_wt = np.sqrt(wt)
+
+    def residuals(x: np.ndarray) -> np.ndarray:
+        return root_wt * (svi_total_variance(k, x) - w)
+
+    def jacobian(x: np.ndarray) -> np.ndarray:
+        _, b, rho, m, s = x
+        y = k - m
+        r = np.sqrt(y * y + s * s)
+        cols = [np.ones_like(k), rho * y + r, b * y, -b * (rho + y / r), b * s / r]
+        return root_wt[:, None] * np.column_stack(cols)
+
+    lower = [-float(w.max()), 0.0, -0.999, float(k.min()) - span, 1e-6]
+    upper = [float(w.max()), np.inf, 0.999, float(k.max()) + span, 10.0 * span]
+    fit = least_squares(residuals, np.clip(x0, lower, upper), jac=jacobian, bounds=(lower, upper), method="trf")
+    a, b, rho, m, s = fit.x
+    # Keep the slice's minimum variance a + b s sqrt(1 - rho^2) non-negative.
+    a = max(a, -b * s * math.sqrt(1.0 - rho * rho))
+    params = np.array([a, b, rho, m, s])
+    resid = svi_total_variance(k, params) - w
+    return {
+        "params": params,
+        "rmse": float(math.sqrt(np.sum(wt * resid * resid) / np.sum(wt))),
+        "quotes": int(k.size),
+    }
+
+
+@dataclass(frozen=True)
+class SviSurface:
+    """Calibrated SVI slices plus the forward curve, ready for vectorized lookups.
+
+    Total variance is linear in maturity between slices at fixed forward log-moneyness, and scales
+    with maturity (flat implied vol) before the first and after the last expiry.
+    """
+
+    expiries: np.ndarray
+    params: np.ndarray
+    spot: float
+    rate: float
+    dividend_yield: float
+    rmse: np.ndarray
+
+    def log_moneyness(self, strike, maturity) -> np.ndarray:
+        t = np.asarray(maturity, dtype=float)
+        return np.log(np.asarray(strike, dtype=float) / self.spot) - (self.rate - self.dividend_yield) * t
+
+    def total_variance(self, log_moneyness, maturity) -> np.ndarray:
+        k, t = np.broadcast_arrays(np.asarray(log_moneyness, dtype=float), np.asarray(maturity, dtype=float))
+        if np.any(t <= 0.0):
+            raise ValueError("maturity must be > 0")
+        last = self.expiries.size - 1
+        pos = np.searchsorted(self.expiries, t)
+        i = np.clip(pos - 1, 0, last)
+        j = np.clip(pos, 0, last)
+        t_i = self.expiries[i]
+        t_j = self.expiries[j]
+        w_i = svi_total_variance(k, self.params[i])
+        w_j = svi_total_variance(k, self.params[j])
+        between = i != j
+        frac = np.where(between, (t - t_i) / np.where(between, t_j - t_i, 1.0), 0.0)
+        return np.where(between, w_i + frac * (w_j - w_i), w_i * t / t_i)
+
+    def sigma(self, strike, maturity) -> np.ndarray:
+        t = np.asarray(maturity, dtype=float)
+        w = self.total_variance(self.log_moneyness(strike, t), t)
+        return np.sqrt(np.maximum(w, 0.0) / t)
+
+
+def calibrate_svi_surface(
+    strike,
+    maturity,
+    implied_vol,
+    spot: float,
+    rate: float,
+    dividend_yield: float,
+    weights=None,
+    min_quotes: int = 5,
+) -> tuple[SviSurface, list[float]]:
+    k, t, iv, wt = np.broadcast_arrays(
+        np.asarray(strike, dtype=float),
+        np.asarray(maturity, dtype=float),
+        np.asarray(implied_vol, dtype=float),
+        np.asarray(1.0 if weights is None else weights, dtype=float),
+    )
+    if k.ndim != 1:
+        raise ValueError("quotes must be 1D arrays")
+    if min_quotes < len(SVI_PARAMS):
+        raise ValueError(f"min_quotes must be >= {len(SVI_PARAMS)}")
+    usable = np.isfinite(iv) & (iv > 0.0) & (t > 0.0) & (k > 0.0)
+    k, t, iv, wt = k[usable], t[usable], iv[usable], wt[usable]
+    log_k = np.log(k / spot) - (rate - dividend_yield) * t
+
+    expiries, params, rmse, skipped = [], [], [], []
+    for expiry in np.unique(t):
+        rows = t == expiry
+        if rows.sum() < min_quotes:
+            skipped.append(float(expiry))
+            continue
+        fit = calibrate_svi_slice(log_k[rows], iv[rows] ** 2 * expiry, wt[rows])
+        expiries.append(float(expiry))
+        params.append(fit["params"])
+        rmse.append(fit["rmse"])
+    if not expiries:
+        raise ValueError(f"No expiry has at least {min_quotes} usable implied vols")
+
+    surface = SviSurface(
+        expiries=np.asarray(expiries),
+        params=np.vstack(params),
+        spot=float(spot),
+        rate=float(rate),
+        dividend_yield=float(dividend_yield),
+        rmse=np.asarray(rmse),
+    )
+    return surface, skipped
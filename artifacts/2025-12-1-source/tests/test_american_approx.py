@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.american_approx import (
+    american_approx_price,
+    baw_price_batch,
+    bjerksund_stensland_price_batch,
+)
+from risk_pipeline.pricing.engines.binomial_crr import crr_price_batch
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
+
+
+class TestAmericanApproximations(unittest.TestCase):
+    def setUp(self):
+        self.strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+
+    def _reference(self, maturity, dividend_yield, is_call):
+        return crr_price_batch(
+            100.0, self.strikes, maturity, 0.06, dividend_yield, 0.3, is_call, 2000, exercise="american", acceleration="bbsr"
+        )
+
+    def test_close_to_crr_american(self):
+        for is_call, dividend_yield in ((True, 0.04), (False, 0.0), (False, 0.04)):
+            ref = self._reference(0.5, dividend_yield, is_call)
+            baw = baw_price_batch(100.0, self.strikes, 0.5, 0.06, dividend_yield, 0.3, is_call)
+            bjs = bjerksund_stensland_price_batch(100.0, self.strikes, 0.5, 0.06, dividend_yield, 0.3, is_call)
+            self.assertLess(np.abs(baw - ref).max(), 0.12)
+            self.assertLess(np.abs(bjs - ref).max(), 0.08)
+            # Bjerksund-Stensland prices a feasible exercise rule, so it is a lower bound.
+            self.assertTrue(np.all(bjs <= ref + 1e-3))
+
+    def test_reference_value_and_premium(self):
+        # Haug's Bjerksund-Stensland example lies between the 1993 value (5.2704) and the true price.
+        bjs = american_approx_price(42.0, 40.0, 0.75, 0.04, 0.08, 0.35, "call", method="bjerksund_stensland")
+        self.assertGreater(bjs, 5.2704)
+        self.assertLess(bjs, float(crr_price_batch(42.0, np.array([40.0]), 0.75, 0.04, 0.08, 0.35, True, 2000, exercise="american")[0]))
+
+        euro = bs_price_batch(100.0, self.strikes, 1.0, 0.06, 0.0, 0.3, False)
+        for engine in (baw_price_batch, bjerksund_stensland_price_batch):
+            american = engine(100.0, self.strikes, 1.0, 0.06, 0.0, 0.3, False)
+            self.assertTrue(np.all(american >= euro - 1e-12))
+            self.assertTrue(np.all(american >= self.strikes - 100.0 - 1e-12))
+
+    def test_no_early_exercise_cases_are_european(self):
+        euro_call = bs_price_batch(100.0, self.strikes, 1.0, 0.05, 0.0, 0.25, True)
+        euro_put = bs_price_batch(100.0, self.strikes, 1.0, 0.0, 0.02, 0.25, False)
+        for engine in (baw_price_batch, bjerksund_stensland_price_batch):
+            np.testing.assert_allclose(engine(100.0, self.strikes, 1.0, 0.05, 0.0, 0.25, True), euro_call)
+            np.testing.assert_allclose(engine(100.0, self.strikes, 1.0, 0.0, 0.02, 0.25, False), euro_put)
+
+        # With r < 0 the put is European, but a call without dividends can be worth exercising early.
+        for rate, sigma in ((-0.01, 0.2), (-0.01, 0.25), (-0.01, 0.3), (-0.01, 0.4), (-0.005, 0.2)):
+            euro_call = bs_price_batch(100.0, self.strikes, 1.0, rate, 0.0, sigma, True)
+            euro_put = bs_price_batch(100.0, self.strikes, 1.0, rate, 0.0, sigma, False)
+            ref = crr_price_batch(100.0, self.strikes, 1.0, rate, 0.0, sigma, True, 2000, exercise="american", acceleration="bbsr")
+            for engine in (baw_price_batch, bjerksund_stensland_price_batch):
+                np.testing.assert_allclose(engine(100.0, self.strikes, 1.0, rate, 0.0, sigma, False), euro_put)
+                american = engine(100.0, self.strikes, 1.0, rate, 0.0, sigma, True)
+                self.assertTrue(np.all(np.isfinite(american)))
+                self.assertTrue(np.all(american > euro_call + 1e-3))
+                self.assertLess(np.abs(american - ref).max(), 0.08)
+
+    def test_long_dated_low_vol_puts_stay_bounded(self):
+        # Strongly negative carry (r >> q) pushed the Bjerksund-Stensland trigger below the strike, and the BAW
+        # Newton step for the put boundary through zero.
+        for maturity, rate, sigma, strikes in ((5.0, 0.08, 0.08, [90.0]), (30.0, 0.05, 0.05, [50.0, 80.0]), (5.0, 0.15, 0.05, [90.0, 100.0, 110.0])):
+            strikes = np.array(strikes)
+            floor = np.maximum(bs_price_batch(100.0, strikes, maturity, rate, 0.0, sigma, False), strikes - 100.0)
+            for engine in (baw_price_batch, bjerksund_stensland_price_batch):
+                american = engine(100.0, strikes, maturity, rate, 0.0, sigma, False)
+                self.assertTrue(np.all(american >= floor - 1e-12))
+        ref = crr_price_batch(100.0, self.strikes, 5.0, 0.15, 0.0, 0.05, False, 2000, exercise="american", acceleration="bbsr")
+        self.assertLess(np.abs(baw_price_batch(100.0, self.strikes, 5.0, 0.15, 0.0, 0.05, False) - ref).max(), 0.01)
+
+    def test_broadcasting_and_validation(self):
+        rng = np.random.default_rng(5)
+        spot = rng.uniform(60.0, 140.0, size=(40, 25))
+        call = rng.random((40, 25)) < 0.5
+        for engine in (baw_price_batch, bjerksund_stensland_price_batch):
+            prices = engine(spot, 100.0, 0.75, 0.05, 0.03, 0.3, call)
+            self.assertEqual(prices.shape, (40, 25))
+            self.assertTrue(np.all(np.isfinite(prices)))
+            self.assertTrue(np.all(prices >= np.maximum(np.where(call, spot - 100.0, 100.0 - spot), 0.0) - 1e-10))
+        with self.assertRaises(ValueError):
+            baw_price_batch(100.0, 100.0, 0.0, 0.05, 0.0, 0.2, True)
+        with self.assertRaises(ValueError):
+            baw_price_batch(100.0, self.strikes, 1.0, 0.05, 0.0, 0.2, False, max_iter=1)
+        with self.assertRaises(ValueError):
+            american_approx_price(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "call", method="tree")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import importlib.util
+import types
+import unittest
+
+import numpy as np
+
+from risk_pipeline.compute.backend import Backend, BackendError, get_backend, resolve_backend
+from risk_pipeline.pricing.engines.binomial_crr import crr_price_batch
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
+from risk_pipeline.pricing.engines.mc_cpu import mc_price_cpu
+from risk_pipeline.pricing.engines.mc_gpu import mc_price_gpu_cupy
+
+HAS_CUPY = importlib.util.find_spec("cupy") is not None
+HAS_ARRAY_API_STRICT = importlib.util.find_spec("array_api_strict") is not None
+
+
+def _foreign_namespace() -> Backend:
+    # A module that is not numpy itself, so the engines take their generic array-API branches.
+    proxy = types.ModuleType("numpy_proxy")
+    proxy.__getattr__ = lambda name: getattr(np, name)
+    return resolve_backend(proxy)
+
+
+class TestBackend(unittest.TestCase):
+    def test_resolve_backend(self):
+        cpu = get_backend("cpu")
+        self.assertIs(cpu.xp, np)
+        self.assertFalse(cpu.is_gpu)
+        self.assertEqual(resolve_backend(None), cpu)
+        self.assertEqual(resolve_backend(np), cpu)
+        self.assertEqual(resolve_backend(" CPU "), cpu)
+        self.assertEqual(_foreign_namespace().name, "numpy_proxy")
+        with self.assertRaises(ValueError):
+            get_backend("tpu")
+
+    @unittest.skipIf(HAS_CUPY, "CuPy is installed")
+    def test_gpu_unavailable(self):
+        with self.assertRaises(BackendError):
+            get_backend("gpu")
+        out = mc_price_gpu_cupy(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "call", paths=1000, seed=1)
+        self.assertFalse(out["available"])
+        self.assertIn("CuPy", out["reason"])
+
+    def _assert_engines_match(self, foreign: Backend):
+        strikes = np.linspace(80.0, 120.0, 9)
+        calls = strikes > 100.0
+        np.testing.assert_array_equal(
+            foreign.to_numpy(bs_price_batch(100.0, strikes, [[0.0], [0.5]], 0.03, 0.01, 0.25, calls, backend=foreign)),
+            bs_price_batch(100.0, strikes, [[0.0], [0.5]], 0.03, 0.01, 0.25, calls),
+        )
+        for exercise in ("european", "american"):
+            np.testing.assert_array_equal(
+                foreign.to_numpy(
+                    crr_price_batch(100.0, strikes, 1.0, 0.03, 0.02, 0.25, calls, 200, exercise=exercise, acceleration="bbsr", backend=foreign)
+                ),
+                crr_price_batch(100.0, strikes, 1.0, 0.03, 0.02, 0.25, calls, 200, exercise=exercise, acceleration="bbsr"),
+            )
+        # Same generator stream, drawn per block instead of into a reused buffer.
+        for variance_reduction in ("antithetic,control_bs", "control_spot,moment_matching"):
+            kwargs = dict(paths=20000, seed=5, variance_reduction=variance_reduction, block_size=3000, greeks=True)
+            ref = mc_price_cpu(100.0, 105.0, 0.7, 0.03, 0.01, 0.25, "put", **kwargs)
+            out = mc_price_cpu(100.0, 105.0, 0.7, 0.03, 0.01, 0.25, "put", backend=foreign, **kwargs)
+            self.assertAlmostEqual(out["price"], ref["price"], places=12)
+            self.assertAlmostEqual(out["stderr"], ref["stderr"], places=12)
+            self.assertAlmostEqual(out["greeks"]["gamma"], ref["greeks"]["gamma"], places=12)
+
+    def test_engines_match_on_generic_namespace(self):
+        self._assert_engines_match(_foreign_namespace())
+
+    @unittest.skipUnless(HAS_ARRAY_API_STRICT, "array_api_strict is not installed")
+    def test_engines_match_on_array_api_strict(self):
+        # The reference array-API implementation: no NumPy scalars, no out=, no implicit dtype or index rules.
+        import array_api_strict
+
+        self._assert_engines_match(resolve_backend(array_api_strict))
+
+    @unittest.skipUnless(HAS_CUPY, "CuPy is not installed")
+    def test_gpu_matches_cpu_statistically(self):
+        try:
+            gpu = get_backend("gpu")
+        except BackendError as exc:
+            self.skipTest(str(exc))
+        strikes = np.linspace(80.0, 120.0, 9)
+        np.testing.assert_allclose(
+            gpu.to_numpy(bs_price_batch(100.0, strikes, 1.0, 0.03, 0.01, 0.25, True, backend=gpu)),
+            bs_price_batch(100.0, strikes, 1.0, 0.03, 0.01, 0.25, True),
+            rtol=1e-12,
+        )
+        cpu = mc_price_cpu(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "call", paths=200000, seed=2)
+        out = mc_price_gpu_cupy(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "call", paths=200000, seed=2)
+        self.assertTrue(out["available"])
+        self.assertLess(abs(out["price"] - cpu["price"]), 4.0 * (out["stderr"] + cpu["stderr"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
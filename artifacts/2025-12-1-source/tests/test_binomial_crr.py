@@ -1,7 +1,10 @@
+import math
 import unittest
 
-from risk_pipeline.pricing.engines.binomial_crr import crr_price
-from risk_pipeline.pricing.engines.black_scholes import bs_price
+import numpy as np
+
+from risk_pipeline.pricing.engines.binomial_crr import crr_price, crr_price_batch
+from risk_pipeline.pricing.engines.black_scholes import bs_price, bs_price_batch
 
 
 class TestBinomialCRR(unittest.TestCase):
@@ -24,6 +27,100 @@ class TestBinomialCRR(unittest.TestCase):
         self.assertGreater(abs(p300 - bs), abs(p800 - bs))
         self.assertLess(abs(p800 - bs), 0.03)
 
+    def test_european_fast_path_matches_backward_induction(self):
+        spot, maturity, rate, q, sigma = 100.0, 1.0, 0.05, 0.02, 0.25
+        for steps in (1, 7, 200):
+            dt = maturity / steps
+            u = math.exp(sigma * math.sqrt(dt))
+            d = 1.0 / u
+            p = (math.exp((rate - q) * dt) - d) / (u - d)
+            j = np.arange(steps + 1)
+            spot_t = spot * (u ** j) * (d ** (steps - j))
+            for strike in (80.0, 100.0, 120.0):
+                for option_type, values in (
+                    ("call", np.maximum(spot_t - strike, 0.0)),
+                    ("put", np.maximum(strike - spot_t, 0.0)),
+                ):
+                    for _ in range(steps):
+                        values = math.exp(-rate * dt) * (p * values[1:] + (1.0 - p) * values[:-1])
+                    fast = crr_price(spot, strike, maturity, rate, q, sigma, option_type, steps)
+                    self.assertAlmostEqual(fast, float(values[0]), places=10)
+
+    def test_deep_tree_is_practical(self):
+        bs = bs_price(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "call")
+        price = crr_price(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "call", steps=20000)
+        self.assertLess(abs(price - bs), 1e-3)
+
+    def test_american_put_early_exercise_premium(self):
+        args = (100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "put", 1000)
+        european = crr_price(*args)
+        american = crr_price(*args, exercise="american")
+        bermudan = crr_price(*args, exercise="bermudan", exercise_times=[0.25, 0.5, 0.75])
+        self.assertAlmostEqual(american, 6.0903, delta=2e-3)
+        self.assertLess(european, bermudan)
+        self.assertLess(bermudan, american)
+
+    def test_american_call_without_dividends_equals_european(self):
+        args = (100.0, 95.0, 0.5, 0.03, 0.0, 0.3, "call", 400)
+        self.assertAlmostEqual(crr_price(*args, exercise="american"), crr_price(*args), places=9)
+
+    def test_bermudan_requires_exercise_times(self):
+        with self.assertRaises(ValueError):
+            crr_price(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "put", 100, exercise="bermudan")
+        with self.assertRaises(ValueError):
+            crr_price(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "put", 100, exercise="asian")
+
+    def test_batch_ladder_matches_per_strike_induction(self):
+        spot, maturity, rate, q, sigma, steps = 100.0, 0.75, 0.04, 0.02, 0.3, 300
+        strikes = np.linspace(85.0, 115.0, 7)
+        is_call = np.array([True, False, True, False, True, False, True])
+        dt = maturity / steps
+        u = math.exp(sigma * math.sqrt(dt))
+        d = 1.0 / u
+        p = (math.exp((rate - q) * dt) - d) / (u - d)
+        for exercise in ("european", "american"):
+            batch = crr_price_batch(spot, strikes, maturity, rate, q, sigma, is_call, steps, exercise=exercise)
+            for i, strike in enumerate(strikes):
+                sign = 1.0 if is_call[i] else -1.0
+                j = np.arange(steps + 1)
+                values = np.maximum(sign * (spot * u**j * d ** (steps - j) - strike), 0.0)
+                for level in range(steps - 1, -1, -1):
+                    values = math.exp(-rate * dt) * (p * values[1:] + (1.0 - p) * values[:-1])
+                    if exercise == "american":
+                        j = np.arange(level + 1)
+                        values = np.maximum(values, sign * (spot * u**j * d ** (level - j) - strike))
+                option_type = "call" if is_call[i] else "put"
+                scalar = crr_price(spot, strike, maturity, rate, q, sigma, option_type, steps, exercise=exercise)
+                self.assertAlmostEqual(float(batch[i]), float(values[0]), places=10)
+                self.assertAlmostEqual(scalar, float(values[0]), places=10)
+
+    def test_bbs_richardson_beats_raw_tree_at_low_steps(self):
+        args = (100.0, 105.0, 0.5, 0.05, 0.01, 0.25, "call")
+        bs = bs_price(*args)
+        raw = crr_price(*args, steps=100)
+        bbs = crr_price(*args, steps=100, acceleration="bbs")
+        bbsr = crr_price(*args, steps=100, acceleration="bbsr")
+        self.assertLess(abs(bbs - bs), abs(raw - bs))
+        self.assertLess(abs(bbsr - bs), 1e-3)
+        self.assertLess(abs(bbsr - bs), abs(crr_price(*args, steps=500) - bs))
+
+    def test_bbsr_american_put_converges(self):
+        args = (100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "put")
+        reference = crr_price(*args, steps=4000, exercise="american", acceleration="bbsr")
+        accelerated = crr_price(*args, steps=200, exercise="american", acceleration="bbsr")
+        raw = crr_price(*args, steps=200, exercise="american")
+        self.assertLess(abs(accelerated - reference), abs(raw - reference))
+
+    def test_richardson_only_on_smoothed_tree(self):
+        strikes = np.array([90.0, 100.0, 105.0, 110.0])
+        bs = bs_price_batch(100.0, strikes, 0.5, 0.05, 0.01, 0.25, True)
+        for steps in (47, 50, 100, 101):
+            raw = crr_price_batch(100.0, strikes, 0.5, 0.05, 0.01, 0.25, True, steps)
+            bbsr = crr_price_batch(100.0, strikes, 0.5, 0.05, 0.01, 0.25, True, steps, acceleration="bbsr")
+            self.assertLess(np.max(np.abs(bbsr - bs)), 0.2 * np.max(np.abs(raw - bs)))
+        with self.assertRaises(ValueError):
+            crr_price_batch(100.0, strikes, 0.5, 0.05, 0.01, 0.25, True, 50, acceleration="richardson")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 
-from risk_pipeline.pricing.engines.black_scholes import bs_price
+import numpy as np
+
+from risk_pipeline.pricing.engines.black_scholes import bs_price, bs_price_batch
 
 
 class TestBlackScholes(unittest.TestCase):
@@ -16,6 +18,28 @@ class TestBlackScholes(unittest.TestCase):
         )
         self.assertAlmostEqual(price, 10.450583572185565, places=8)
 
+    def test_batch_matches_scalar_including_edge_cases(self):
+        strikes = np.array([80.0, 100.0, 120.0, 100.0, 100.0, 90.0])
+        maturities = np.array([0.5, 1.0, 2.0, 0.0, 1.0, 1e-14])
+        sigmas = np.array([0.2, 0.3, 0.25, 0.2, 0.0, 0.2])
+        for is_call, option_type in ((True, "call"), (False, "put")):
+            batch = bs_price_batch(100.0, strikes, maturities, 0.03, 0.01, sigmas, is_call)
+            for i in range(strikes.size):
+                expected = bs_price(100.0, strikes[i], maturities[i], 0.03, 0.01, sigmas[i], option_type)
+                self.assertAlmostEqual(float(batch[i]), expected, places=10)
+
+    def test_batch_broadcasts_strike_by_expiry_grid(self):
+        strikes = np.linspace(80.0, 120.0, 5)[:, None]
+        maturities = np.array([0.25, 0.5, 1.0])[None, :]
+        is_call = np.array([True, False, True, False, True])[:, None]
+        prices = bs_price_batch(100.0, strikes, maturities, 0.05, 0.0, 0.2, is_call)
+        self.assertEqual(prices.shape, (5, 3))
+        self.assertAlmostEqual(float(prices[2, 2]), 10.450583572185565, places=8)
+
+    def test_batch_rejects_non_positive_strike(self):
+        with self.assertRaises(ValueError):
+            bs_price_batch(100.0, np.array([100.0, 0.0]), 1.0, 0.05, 0.0, 0.2, True)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.black_scholes import bs_price, bs_price_batch
+from risk_pipeline.pricing.greeks.bs_analytic import bs_greeks
+from risk_pipeline.pricing.greeks.bs_batch import bs_price_greeks_batch, select_greeks
+
+
+class TestBsBatchGreeks(unittest.TestCase):
+    def test_fused_kernel_matches_scalar_price_and_greeks(self):
+        strikes = np.array([70.0, 95.0, 100.0, 110.0, 150.0])
+        maturities = np.array([0.1, 0.5, 1.0, 2.0, 3.0])
+        fused = bs_price_greeks_batch(100.0, strikes, maturities, 0.04, 0.015, 0.25)
+        for option_type in ("call", "put"):
+            selected = select_greeks(fused, option_type)
+            for i in range(strikes.size):
+                args = (100.0, strikes[i], maturities[i], 0.04, 0.015, 0.25, option_type)
+                self.assertAlmostEqual(float(selected["price"][i]), bs_price(*args), places=10)
+                expected = bs_greeks(*args)
+                for name in ("delta", "gamma", "vega", "theta", "rho"):
+                    self.assertAlmostEqual(float(selected[name][i]), expected[name], places=10, msg=name)
+
+    def test_fused_kernel_edge_case_prices(self):
+        fused = bs_price_greeks_batch(100.0, np.array([90.0, 110.0]), np.array([0.0, 1.0]), 0.05, 0.0, np.array([0.2, 0.0]))
+        self.assertAlmostEqual(float(fused["call_price"][0]), 10.0, places=12)
+        self.assertAlmostEqual(float(fused["put_price"][0]), 0.0, places=12)
+        self.assertAlmostEqual(float(fused["put_price"][1]), bs_price(100.0, 110.0, 1.0, 0.05, 0.0, 0.0, "put"), places=12)
+
+    def test_deep_out_of_the_money_puts_keep_relative_accuracy(self):
+        # Through parity these came out as round-off (exactly 0 at K=40, 1e-12 at K=50) instead of the true value.
+        strikes = np.array([40.0, 50.0, 60.0])
+        fused = bs_price_greeks_batch(100.0, strikes, 0.25, 0.03, 0.0, 0.2)
+        direct = bs_price_batch(100.0, strikes, 0.25, 0.03, 0.0, 0.2, False)
+        self.assertTrue(np.all(fused["put_price"] > 0.0))
+        np.testing.assert_allclose(fused["put_price"], direct, rtol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
+from risk_pipeline.pricing.no_arbitrage.checks import scan_chain_arbitrage
+
+
+class TestChainArbitrageScan(unittest.TestCase):
+    def setUp(self):
+        strikes = np.linspace(60.0, 140.0, 41)
+        maturities = np.array([0.1, 0.5, 1.0, 2.0])
+        k, t = (a.ravel() for a in np.meshgrid(strikes, maturities))
+        self.strike = np.concatenate([k, k])
+        self.maturity = np.concatenate([t, t])
+        self.is_call = np.repeat([True, False], k.size)
+
+    def _prices(self, dividend_yield):
+        return bs_price_batch(100.0, self.strike, self.maturity, 0.04, dividend_yield, 0.25, self.is_call)
+
+    def test_clean_black_scholes_chain_passes(self):
+        for dividend_yield in (0.0, 0.05):
+            out = scan_chain_arbitrage(
+                self.strike, self.maturity, self._prices(dividend_yield), self.is_call, 100.0, 0.04, dividend_yield
+            )
+            self.assertTrue(out["ok"], msg=str(out["counts"]))
+            self.assertEqual(out["quotes"], self.strike.size)
+
+    def test_cent_rounded_quotes_need_tick_tolerance(self):
+        rounded = np.round(self._prices(0.02), 2)
+        strict = scan_chain_arbitrage(self.strike, self.maturity, rounded, self.is_call, 100.0, 0.04, 0.02)
+        tick = scan_chain_arbitrage(self.strike, self.maturity, rounded, self.is_call, 100.0, 0.04, 0.02, tol=0.01)
+        self.assertGreater(strict["counts"]["parity"], 0)
+        self.assertTrue(tick["ok"], msg=str(tick["counts"]))
+
+    def test_flags_each_violation_type(self):
+        prices = self._prices(0.0)
+        call_atm = int(np.flatnonzero(self.is_call & (self.strike == 100.0) & (self.maturity == 0.5))[0])
+        prices[call_atm] += 1.5
+        out = scan_chain_arbitrage(self.strike, self.maturity, prices, self.is_call, 100.0, 0.04, 0.0, tol=1e-6)
+
+        self.assertFalse(out["ok"])
+        for check in ("parity", "vertical_spread", "butterfly"):
+            self.assertGreater(out["counts"][check], 0, msg=check)
+        flagged = out["violations"]
+        self.assertIn(call_atm, set(flagged.loc[flagged["check"] == "parity", "quote"]))
+        self.assertIn(call_atm, set(flagged.loc[flagged["check"] == "butterfly", "quote"]))
+
+    def test_flags_calendar_violation(self):
+        prices = self._prices(0.02)
+        late = int(np.flatnonzero(self.is_call & (self.strike == 100.0) & (self.maturity == 1.0))[0])
+        prices[late] -= 8.0
+        out = scan_chain_arbitrage(self.strike, self.maturity, prices, self.is_call, 100.0, 0.04, 0.02, tol=1e-6)
+
+        flagged = out["violations"]
+        calendar = flagged[flagged["check"] == "calendar"]
+        self.assertGreater(len(calendar), 0)
+        self.assertTrue(set(calendar["quote"]) | set(calendar["other"]) >= {late})
+
+    def test_bounds_violation(self):
+        out = scan_chain_arbitrage([100.0, 100.0], [1.0, 1.0], [-0.5, 120.0], [True, False], 100.0, 0.04, 0.0)
+        self.assertEqual(out["counts"]["bounds"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
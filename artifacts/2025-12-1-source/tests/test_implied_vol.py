@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
+from risk_pipeline.pricing.engines.implied_vol import implied_vol_batch
+
+
+class TestImpliedVol(unittest.TestCase):
+    def test_round_trip_across_chain(self):
+        strikes = np.linspace(60.0, 160.0, 41)[:, None]
+        maturities = np.array([0.05, 0.25, 1.0, 3.0])[None, :]
+        sigma = 0.15 + 0.4 * np.abs(np.log(strikes / 100.0)) + 0.0 * maturities
+        is_call = np.broadcast_to(strikes >= 100.0, sigma.shape)
+        quotes = bs_price_batch(100.0, strikes, maturities, 0.03, 0.01, sigma, is_call)
+
+        out = implied_vol_batch(quotes, 100.0, strikes, maturities, 0.03, 0.01, is_call)
+
+        self.assertEqual(out["sigma"].shape, sigma.shape)
+        self.assertTrue(out["converged"].all())
+        self.assertLessEqual(int(out["iterations"].max()), 8)
+        np.testing.assert_allclose(out["sigma"], sigma, atol=1e-8)
+
+    def test_in_the_money_quotes_use_parity(self):
+        quote = bs_price_batch(100.0, 80.0, 0.5, 0.02, 0.0, 0.3, False)
+        itm_call = bs_price_batch(100.0, 80.0, 0.5, 0.02, 0.0, 0.3, True)
+        out = implied_vol_batch(np.array([quote, itm_call]), 100.0, 80.0, 0.5, 0.02, 0.0, np.array([False, True]))
+        np.testing.assert_allclose(out["sigma"], 0.3, atol=1e-8)
+
+    def test_arbitrage_violating_quotes_are_flagged(self):
+        quotes = np.array([0.0, 150.0, 5.0])
+        maturities = np.array([1.0, 1.0, 0.0])
+        out = implied_vol_batch(quotes, 100.0, 100.0, maturities, 0.01, 0.0, True)
+        self.assertFalse(out["converged"].any())
+        self.assertTrue(np.isnan(out["sigma"]).all())
+        self.assertTrue((out["iterations"] == 0).all())
+
+    def test_deep_itm_quotes_without_time_value_are_not_converged(self):
+        # The OTM leg is below parity round-off here; a solved vol would be noise (it came out at 0.452).
+        strikes = np.array([300.0, 110.0])
+        quotes = bs_price_batch(100.0, strikes, 0.1, 0.03, 0.0, 0.2, False)
+        out = implied_vol_batch(quotes, 100.0, strikes, 0.1, 0.03, 0.0, False)
+        np.testing.assert_array_equal(out["converged"], [False, True])
+        self.assertTrue(np.isnan(out["sigma"][0]))
+        self.assertAlmostEqual(out["sigma"][1], 0.2, places=8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.binomial_crr import crr_price
+from risk_pipeline.pricing.engines.black_scholes import bs_price
+from risk_pipeline.pricing.engines.lsm import lsm_basis, lsm_price
+
+
+class TestLongstaffSchwartz(unittest.TestCase):
+    def test_american_put_brackets_tree(self):
+        ref = crr_price(100.0, 100.0, 1.0, 0.06, 0.0, 0.2, "put", 1000, exercise="american", acceleration="bbsr")
+        euro = bs_price(100.0, 100.0, 1.0, 0.06, 0.0, 0.2, "put")
+        for basis in ("laguerre", "polynomial"):
+            out = lsm_price(100.0, 100.0, 1.0, 0.06, 0.0, 0.2, "put", paths=40000, seed=3, exercise_dates=50, basis=basis)
+            self.assertTrue(out["out_of_sample"])
+            self.assertGreater(out["price"], euro + 0.2)
+            # The out-of-sample value of a Bermudan rule is low-biased against the American tree.
+            self.assertLess(out["price"], ref + 3.0 * out["stderr"])
+            self.assertLess(abs(out["price"] - ref), 0.1)
+
+    def test_no_early_exercise_call_matches_black_scholes(self):
+        out = lsm_price(100.0, 105.0, 0.5, 0.05, 0.0, 0.25, "call", paths=40000, seed=1, exercise_dates=10)
+        euro = bs_price(100.0, 105.0, 0.5, 0.05, 0.0, 0.25, "call")
+        self.assertLess(abs(out["price"] - euro), 4.0 * out["stderr"])
+
+    def test_reproducible_and_in_sample_only(self):
+        kwargs = dict(paths=5000, seed=11, exercise_dates=8, block_size=1024)
+        a = lsm_price(40.0, 44.0, 0.5, 0.04, 0.0, 0.3, "put", **kwargs)
+        b = lsm_price(40.0, 44.0, 0.5, 0.04, 0.0, 0.3, "put", **kwargs)
+        self.assertEqual(a["price"], b["price"])
+        in_sample = lsm_price(40.0, 44.0, 0.5, 0.04, 0.0, 0.3, "put", out_of_sample_paths=0, **kwargs)
+        self.assertFalse(in_sample["out_of_sample"])
+        self.assertEqual(in_sample["price"], in_sample["in_sample_price"])
+        # Deep in the money puts are worth at least immediate exercise.
+        self.assertGreaterEqual(in_sample["price"], 4.0)
+
+    def test_basis_and_validation(self):
+        x = np.linspace(0.5, 1.5, 7)
+        design = lsm_basis(x, "laguerre", 3)
+        self.assertEqual(design.shape, (7, 4))
+        np.testing.assert_allclose(design[:, 2], np.exp(-0.5 * x) * (1.0 - x))
+        np.testing.assert_allclose(lsm_basis(x, "polynomial", 2)[:, 2], x * x)
+        with self.assertRaises(ValueError):
+            lsm_basis(x, "hermite", 3)
+        with self.assertRaises(ValueError):
+            lsm_price(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "put", paths=1000, seed=0, out_of_sample_paths=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.compute.parallel import split_budget
+from risk_pipeline.legacy.risk.mc_sim import simulate_portfolio_losses_parallel
+from risk_pipeline.pricing.engines.black_scholes import bs_price
+from risk_pipeline.pricing.engines.mc_cpu import mc_price_cpu_parallel
+
+
+class TestMcParallel(unittest.TestCase):
+    def test_price_is_bit_identical_across_worker_counts(self):
+        params = {
+            "spot": 100.0,
+            "strike": 100.0,
+            "maturity": 1.0,
+            "rate": 0.05,
+            "dividend_yield": 0.0,
+            "sigma": 0.2,
+            "option_type": "call",
+        }
+        single = mc_price_cpu_parallel(**params, paths=100000, seed=9, workers=1, chunk_paths=16384)
+        multi = mc_price_cpu_parallel(**params, paths=100000, seed=9, workers=3, chunk_paths=16384)
+
+        self.assertEqual(single["price"], multi["price"])
+        self.assertEqual(single["stderr"], multi["stderr"])
+        self.assertEqual(single["chunks"], 7)
+        self.assertLessEqual(single["ci_low"], bs_price(**params))
+        self.assertGreaterEqual(single["ci_high"], bs_price(**params))
+
+    def test_portfolio_losses_are_bit_identical_across_worker_counts(self):
+        cov = np.array([[4e-4, 1e-4], [1e-4, 9e-4]])
+        weights = np.array([0.6, 0.4])
+        a = simulate_portfolio_losses_parallel(cov, weights, num_paths=50000, seed=3, workers=1, chunk_paths=8192)
+        b = simulate_portfolio_losses_parallel(cov, weights, num_paths=50000, seed=3, workers=2, chunk_paths=8192)
+
+        self.assertEqual(a.shape, (50000,))
+        np.testing.assert_array_equal(a, b)
+        expected_std = float(np.sqrt(weights @ cov @ weights))
+        self.assertAlmostEqual(float(a.std()), expected_std, delta=0.02 * expected_std)
+
+    def test_split_budget(self):
+        self.assertEqual(split_budget(10, 4), [4, 4, 2])
+        self.assertEqual(split_budget(8, 4), [4, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
 import unittest
 
+import numpy as np
+
 from risk_pipeline.pricing.engines.black_scholes import bs_price
-from risk_pipeline.pricing.engines.mc_cpu import mc_price_cpu
+from risk_pipeline.pricing.engines.mc_cpu import mc_price_cpu, parse_variance_reduction
+from risk_pipeline.pricing.engines.mc_moments import RunningMoments
+from risk_pipeline.pricing.greeks.bs_analytic import bs_greeks
 
 
 class TestMcPricing(unittest.TestCase):
@@ -21,6 +25,168 @@ class TestMcPricing(unittest.TestCase):
         self.assertLessEqual(mc["ci_low"], bs)
         self.assertGreaterEqual(mc["ci_high"], bs)
 
+    def test_variance_reduction_lowers_stderr(self):
+        params = {
+            "spot": 100.0,
+            "strike": 105.0,
+            "maturity": 0.5,
+            "rate": 0.03,
+            "dividend_yield": 0.01,
+            "sigma": 0.25,
+            "option_type": "call",
+        }
+        bs = bs_price(**params)
+        plain = mc_price_cpu(**params, paths=50000, seed=3)
+        for spec in ("antithetic", "control_spot", "antithetic,control_spot"):
+            reduced = mc_price_cpu(**params, paths=50000, seed=3, variance_reduction=spec)
+            self.assertLess(reduced["stderr"], plain["stderr"], msg=spec)
+            self.assertGreater(reduced["variance_reduction_factor"], 1.2, msg=spec)
+            self.assertLess(abs(reduced["price"] - bs), 4.0 * reduced["stderr"], msg=spec)
+        self.assertEqual(plain["variance_reduction"], "none")
+        self.assertAlmostEqual(plain["variance_reduction_factor"], 1.0, places=12)
+
+    def test_bs_control_and_moment_matching_report_honest_stderr(self):
+        params = {
+            "spot": 100.0,
+            "strike": 105.0,
+            "maturity": 0.5,
+            "rate": 0.03,
+            "dividend_yield": 0.01,
+            "sigma": 0.25,
+            "option_type": "call",
+        }
+        bs = bs_price(**params)
+        for spec in ("control_bs", "moment_matching", "antithetic,moment_matching", "moment_matching,control_bs"):
+            runs = [mc_price_cpu(**params, paths=20000, seed=seed, variance_reduction=spec, block_size=5000) for seed in range(24)]
+            prices = np.array([r["price"] for r in runs])
+            stderr = float(np.mean([r["stderr"] for r in runs]))
+            # The control is not the estimator itself, so the price is still a Monte Carlo estimate.
+            self.assertTrue(all(r["stderr"] > 0.0 for r in runs), msg=spec)
+            self.assertNotEqual(runs[0]["price"], bs, msg=spec)
+            self.assertGreater(min(r["variance_reduction_factor"] for r in runs), 5.0, msg=spec)
+            self.assertLess(abs(prices.mean() - bs), 4.0 * stderr / np.sqrt(len(runs)), msg=spec)
+            # The reported stderr matches the spread of independent runs.
+            self.assertLess(abs(prices.std(ddof=1) / stderr - 1.0), 0.4, msg=spec)
+
+    def test_moment_matched_greek_stderr_matches_spread(self):
+        params = {
+            "spot": 100.0,
+            "strike": 105.0,
+            "maturity": 1.0,
+            "rate": 0.03,
+            "dividend_yield": 0.01,
+            "sigma": 0.25,
+            "option_type": "call",
+        }
+        for spec in ("moment_matching", "antithetic,control_bs,moment_matching"):
+            runs = [mc_price_cpu(**params, paths=20000, seed=seed, variance_reduction=spec, greeks=True) for seed in range(40)]
+            for name in ("delta", "vega"):
+                values = np.array([r["greeks"][name] for r in runs])
+                stderr = float(np.mean([r["greeks"][f"{name}_stderr"] for r in runs]))
+                self.assertLess(abs(values.std(ddof=1) / stderr - 1.0), 0.4, msg=f"{spec} {name}")
+
+    def test_sobol_rqmc_ci_contains_bs_with_small_stderr(self):
+        params = {
+            "spot": 100.0,
+            "strike": 100.0,
+            "maturity": 1.0,
+            "rate": 0.05,
+            "dividend_yield": 0.0,
+            "sigma": 0.2,
+            "option_type": "put",
+        }
+        bs = bs_price(**params)
+        qmc = mc_price_cpu(**params, paths=8192, seed=5, sampler="sobol", randomizations=8)
+        pseudo = mc_price_cpu(**params, paths=8192, seed=5)
+
+        self.assertEqual(qmc["paths"], 8192)
+        self.assertLessEqual(qmc["ci_low"], bs)
+        self.assertGreaterEqual(qmc["ci_high"], bs)
+        self.assertLess(qmc["stderr"] * 10.0, pseudo["stderr"])
+
+    def test_streaming_blocks_match_single_pass(self):
+        params = {
+            "spot": 100.0,
+            "strike": 95.0,
+            "maturity": 0.75,
+            "rate": 0.02,
+            "dividend_yield": 0.0,
+            "sigma": 0.3,
+            "option_type": "call",
+        }
+        for spec in ("none", "antithetic,control_spot"):
+            full = mc_price_cpu(**params, paths=40001, seed=11, variance_reduction=spec)
+            streamed = mc_price_cpu(**params, paths=40001, seed=11, variance_reduction=spec, block_size=3000)
+            self.assertEqual(streamed["paths"], full["paths"])
+            self.assertAlmostEqual(streamed["price"], full["price"], places=11)
+            self.assertAlmostEqual(streamed["stderr"], full["stderr"], places=11)
+
+    def test_adaptive_target_stderr_stops_early(self):
+        params = {
+            "spot": 100.0,
+            "strike": 70.0,
+            "maturity": 0.1,
+            "rate": 0.02,
+            "dividend_yield": 0.0,
+            "sigma": 0.2,
+            "option_type": "call",
+        }
+        out = mc_price_cpu(**params, paths=2_000_000, seed=4, target_stderr=0.01)
+        self.assertEqual(out["stop_reason"], "target_met")
+        self.assertLessEqual(out["stderr"], 0.01)
+        self.assertLess(out["paths"], out["max_paths"])
+        self.assertLess(abs(out["price"] - bs_price(**params)), 5.0 * out["stderr"])
+
+        capped = mc_price_cpu(**params, paths=20_000, seed=4, target_stderr=1e-6)
+        self.assertEqual(capped["stop_reason"], "max_paths")
+        self.assertEqual(capped["paths"], 20_000)
+
+        # Every payoff is zero: a relative CI target can never be judged, so the whole budget is spent.
+        worthless = mc_price_cpu(100.0, 300.0, 0.05, 0.02, 0.0, 0.2, "call", paths=50_000, seed=4, target_rel_ci=0.01)
+        self.assertEqual(worthless["price"], 0.0)
+        self.assertEqual(worthless["stop_reason"], "target_unreachable")
+        self.assertEqual(worthless["paths"], 50_000)
+
+    def test_pathwise_and_lr_greeks_match_analytic(self):
+        params = {
+            "spot": 100.0,
+            "strike": 105.0,
+            "maturity": 0.75,
+            "rate": 0.03,
+            "dividend_yield": 0.01,
+            "sigma": 0.25,
+        }
+        for option_type in ("call", "put"):
+            exact = bs_greeks(**params, option_type=option_type)
+            for spec in ("none", "antithetic,control_bs"):
+                out = mc_price_cpu(**params, option_type=option_type, paths=100000, seed=6, variance_reduction=spec, greeks=True)
+                for name in ("delta", "vega", "gamma"):
+                    self.assertGreater(out["greeks"][f"{name}_stderr"], 0.0)
+                    self.assertLess(abs(out["greeks"][name] - exact[name]), 4.0 * out["greeks"][f"{name}_stderr"], msg=name)
+
+        plain = mc_price_cpu(**params, option_type="call", paths=20000, seed=6)
+        with_greeks = mc_price_cpu(**params, option_type="call", paths=20000, seed=6, greeks=True)
+        self.assertIsNone(plain["greeks"])
+        self.assertEqual(plain["price"], with_greeks["price"])
+
+    def test_running_moments_merge_matches_direct(self):
+        rng = np.random.default_rng(0)
+        rows = rng.normal(size=(3, 1000))
+        merged = RunningMoments.empty(3)
+        for start in range(0, 1000, 137):
+            merged = merged.update(rows[:, start : start + 137])
+        direct = RunningMoments.from_rows(rows)
+        self.assertEqual(merged.count, 1000)
+        np.testing.assert_allclose(merged.mean, direct.mean, atol=1e-14)
+        np.testing.assert_allclose(merged.comoment, direct.comoment, rtol=1e-12)
+
+    def test_parse_variance_reduction_rejects_two_controls(self):
+        self.assertEqual(parse_variance_reduction("none"), ())
+        with self.assertRaises(ValueError):
+            parse_variance_reduction("control_spot,control_bs")
+        with self.assertRaises(ValueError):
+            parse_variance_reduction("stratified")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.black_scholes import bs_price
+from risk_pipeline.pricing.engines.mc_path import mc_price_path_dependent
+from risk_pipeline.pricing.payoffs.path_dependent import PathPayoffState, geometric_asian_price
+
+
+PARAMS = {
+    "spot": 100.0,
+    "strike": 100.0,
+    "maturity": 1.0,
+    "rate": 0.05,
+    "dividend_yield": 0.01,
+    "sigma": 0.2,
+    "option_type": "call",
+}
+
+
+class TestPathDependent(unittest.TestCase):
+    def test_geometric_asian_matches_closed_form(self):
+        res = mc_price_path_dependent(**PARAMS, product="asian_geometric", steps=50, paths=60000, seed=4, block_size=8192)
+        ref = geometric_asian_price(**PARAMS, steps=50)
+
+        self.assertLessEqual(abs(res["price"] - ref), 3.0 * res["stderr"])
+
+    def test_barrier_in_plus_out_equals_vanilla(self):
+        common = {**PARAMS, "steps": 40, "paths": 40000, "seed": 8, "barrier": 115.0}
+        knock_in = mc_price_path_dependent(**common, product="barrier_up_in")
+        knock_out = mc_price_path_dependent(**common, product="barrier_up_out")
+        vanilla = bs_price(**PARAMS)
+
+        self.assertLessEqual(abs(knock_in["price"] + knock_out["price"] - vanilla), 3.0 * knock_in["stderr"] + 0.05)
+        self.assertLess(knock_out["price"], vanilla)
+
+    def test_geometric_control_reduces_arithmetic_asian_stderr(self):
+        common = {**PARAMS, "product": "asian_arithmetic", "steps": 50, "paths": 30000, "seed": 2}
+        plain = mc_price_path_dependent(**common)
+        controlled = mc_price_path_dependent(**common, control="geometric_asian")
+
+        self.assertLess(controlled["stderr"], 0.1 * plain["stderr"])
+        self.assertGreater(controlled["variance_reduction_factor"], 50.0)
+        self.assertLessEqual(abs(controlled["price"] - plain["price"]), 3.0 * plain["stderr"])
+
+    def test_state_tracks_lookback_extremes(self):
+        state = PathPayoffState("lookback_floating", 100.0, 2)
+        for level in ([105.0, 95.0], [90.0, 110.0], [100.0, 100.0]):
+            state.update(np.array(level))
+
+        np.testing.assert_allclose(state.payoff(100.0, "call"), [10.0, 5.0])
+        np.testing.assert_allclose(state.payoff(100.0, "put"), [5.0, 10.0])
+
+    def test_barrier_requires_level(self):
+        with self.assertRaises(ValueError):
+            mc_price_path_dependent(**PARAMS, product="barrier_down_out", steps=10, paths=100, seed=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.pricing.engines.binomial_crr import crr_price, crr_price_batch
+from risk_pipeline.pricing.engines.black_scholes import bs_price
+from risk_pipeline.pricing.engines.pde_cn import pde_cn_price, pde_cn_price_batch
+from risk_pipeline.pricing.greeks.bs_analytic import bs_greeks
+
+
+class TestPdeCrankNicolson(unittest.TestCase):
+    def test_european_matches_black_scholes_with_grid_greeks(self):
+        args = (100.0, 105.0, 0.75, 0.03, 0.01, 0.25)
+        for option_type in ("call", "put"):
+            out = pde_cn_price(*args, option_type)
+            exact = bs_greeks(*args, option_type)
+            self.assertAlmostEqual(out["price"], bs_price(*args, option_type), places=3)
+            self.assertAlmostEqual(out["delta"], exact["delta"], places=4)
+            self.assertAlmostEqual(out["gamma"], exact["gamma"], places=5)
+            self.assertAlmostEqual(out["theta"], exact["theta"], delta=0.05)
+
+    def test_american_put_beats_500_step_crr(self):
+        args = (100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "put")
+        reference = crr_price(*args, 8000, exercise="american", acceleration="bbsr")
+        pde = pde_cn_price(*args, exercise="american")["price"]
+        crr = crr_price(*args, 500, exercise="american")
+        self.assertLess(abs(pde - reference), 2e-4)
+        self.assertLess(abs(pde - reference), abs(crr - reference))
+
+    def test_strike_columns_match_reference(self):
+        strikes = np.linspace(70.0, 130.0, 7)
+        is_call = np.array([True, False, True, False, True, False, True])
+        for exercise in ("european", "american"):
+            batch = pde_cn_price_batch(100.0, strikes, 0.8, 0.04, 0.03, 0.3, is_call, exercise=exercise)
+            reference = crr_price_batch(100.0, strikes, 0.8, 0.04, 0.03, 0.3, is_call, 4000, exercise=exercise, acceleration="bbsr")
+            np.testing.assert_allclose(batch["price"], reference, atol=2e-3)
+            self.assertTrue(np.all(batch["gamma"] > 0.0))
+
+    def test_rejects_unsupported_exercise(self):
+        with self.assertRaises(ValueError):
+            pde_cn_price(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, "put", exercise="bermudan")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 
 from risk_pipeline.cli.run_pricing import main
+from risk_pipeline.pricing.engines.black_scholes import bs_price_batch
 
 
 class TestPricingPipelineSmoke(unittest.TestCase):
@@ -67,6 +68,11 @@ class TestPricingPipelineSmoke(unittest.TestCase):
                         "1",
                         "--binomial-steps",
                         "200",
+                        "--mc-greeks",
+                        "--lsm-paths",
+                        "20000",
+                        "--lsm-exercise-dates",
+                        "20",
                         "--run-id",
                         "smoke_pricing",
                         "--outdir",
@@ -105,6 +111,17 @@ class TestPricingPipelineSmoke(unittest.TestCase):
             self.assertIn("binomial", price)
             self.assertIn("mc", price)
             self.assertIn("no_arbitrage", price)
+            self.assertEqual(price["binomial"]["accelerated"]["method"], "bbsr")
+            self.assertLess(price["pde"]["abs_error_vs_bs"], 1e-2)
+            self.assertLess(price["fourier"]["cos_abs_error_vs_bs"], 1e-8)
+            lsm = price["american"]["lsm"]
+            self.assertTrue(lsm["out_of_sample"])
+            self.assertLess(lsm["abs_error_vs_crr"], 5.0 * lsm["stderr"] + 0.05)
+
+            with (outdir / "greeks.json").open("r", encoding="utf-8") as f:
+                greeks = json.load(f)
+            self.assertIn("delta_stderr", greeks["mc_pathwise"])
+            self.assertAlmostEqual(greeks["mc_pathwise"]["delta"], greeks["bs_analytic"]["delta"], delta=0.05)
 
             with (outdir / "bench.json").open("r", encoding="utf-8") as f:
                 bench = json.load(f)
@@ -112,6 +129,187 @@ class TestPricingPipelineSmoke(unittest.TestCase):
             self.assertIn("binomial", bench)
             self.assertIn("mc_cpu", bench)
 
+    def test_run_pricing_prices_chain_file(self):
+        dates = pd.date_range("2025-01-01", periods=90, freq="B")
+        rng = np.random.default_rng(7)
+        prices = 500.0 * np.exp(np.cumsum(rng.normal(0.0002, 0.01, size=len(dates))))
+        prices_df = pd.DataFrame({"SPY": prices}, index=dates)
+        prices_df.index.name = "date"
+        fake_download_report = {"chunks": [], "summary": {"total_chunks": 0, "failed": 0}}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            chain_path = Path(tmp) / "chain.csv"
+            strikes = np.array([480.0, 500.0, 520.0, 500.0])
+            maturity_days = np.array([30, 30, 60, 90])
+            is_call = np.array([True, False, True, False])
+            market = bs_price_batch(prices[-1], strikes, maturity_days / 365.0, 0.03, 0.0, 0.22, is_call)
+            pd.DataFrame(
+                {
+                    "strike": strikes,
+                    "maturity_days": maturity_days,
+                    "option_type": ["call", "put", "Call", "put"],
+                    "market_price": market,
+                }
+            ).to_csv(chain_path, index=False)
+            outdir = Path(tmp) / "results"
+            with patch(
+                "risk_pipeline.cli.run_pricing.download_prices_chunked",
+                return_value=(prices_df, {}, Path(tmp) / "cache", fake_download_report),
+            ):
+                rc = main(
+                    [
+                        "--start", "2025-01-01",
+                        "--end", "2025-06-01",
+                        "--strike", "500",
+                        "--maturity-days", "30",
+                        "--sigma-mode", "implied",
+                        "--market-price", f"{float(market[1]):.10f}",
+                        "--option-type", "put",
+                        "--mode", "fast",
+                        "--paths", "2000",
+                        "--binomial-steps", "50",
+                        "--chain-file", str(chain_path),
+                        "--risk-ladder",
+                        "--option-var",
+                        "--var-paths", "2000",
+                        "--var-workers", "1",
+                        "--outdir", str(outdir),
+                    ]
+                )
+
+            self.assertEqual(rc, 0)
+            chain_out = pd.read_csv(outdir / "chain_prices.csv")
+            self.assertEqual(chain_out.shape[0], 4)
+            self.assertTrue((chain_out["bs_price"] > 0.0).all())
+            with (outdir / "price.json").open("r", encoding="utf-8") as f:
+                price = json.load(f)
+            self.assertEqual(price["chain"]["contracts"], 4)
+            self.assertEqual(price["chain"]["calls"], 2)
+            self.assertLess(price["chain"]["cos_max_abs_diff_vs_bs"], 1e-8)
+            self.assertTrue(price["chain"]["no_arbitrage"]["ok"])
+            self.assertTrue((chain_out["american_baw"] >= chain_out["bs_price"] - 1e-10).all())
+            self.assertLess(price["american"]["bjerksund_stensland"]["abs_error_vs_crr"], 0.05)
+            self.assertEqual(price["chain"]["svi"]["fitted_expiries"], [])
+            ladder = pd.read_csv(outdir / "risk_ladder.csv")
+            self.assertEqual(ladder.shape[0], 45)
+            self.assertEqual(price["chain"]["risk_ladder"]["scenarios"], 45)
+            option_var = price["chain"]["option_var"]
+            self.assertEqual(option_var["paths"], 2000)
+            with (outdir / "bench.json").open("r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["option_var"]["workers"], 1)
+            self.assertGreater(option_var["full"]["var"], 0.0)
+            self.assertLess(abs(option_var["approximation_error"]["var_rel"]), 0.1)
+            self.assertTrue(chain_out["iv_converged"].all())
+            with (outdir / "hist_vol.json").open("r", encoding="utf-8") as f:
+                hist = json.load(f)
+            self.assertEqual(hist["note"], "implied_from_market_price")
+            self.assertAlmostEqual(price["bs"]["put"], float(market[1]), places=6)
+            np.testing.assert_allclose(chain_out["implied_vol"], 0.22, atol=1e-8)
+
+    def test_run_pricing_handles_expired_chain_rows(self):
+        dates = pd.date_range("2025-01-01", periods=90, freq="B")
+        rng = np.random.default_rng(7)
+        prices = 500.0 * np.exp(np.cumsum(rng.normal(0.0002, 0.01, size=len(dates))))
+        prices_df = pd.DataFrame({"SPY": prices}, index=dates)
+        prices_df.index.name = "date"
+        fake_download_report = {"chunks": [], "summary": {"total_chunks": 0, "failed": 0}}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            chain_path = Path(tmp) / "chain.csv"
+            strikes = np.array([400.0, 420.0, 440.0, 460.0, 480.0, 430.0, 450.0])
+            maturity_days = np.array([60, 60, 60, 60, 60, 0, 0])
+            is_call = np.array([False, False, True, True, True, True, False])
+            market = bs_price_batch(prices[-1], strikes, maturity_days / 365.0, 0.03, 0.0, 0.22, is_call)
+            pd.DataFrame(
+                {
+                    "strike": strikes,
+                    "maturity_days": maturity_days,
+                    "option_type": np.where(is_call, "call", "put"),
+                    "market_price": market,
+                }
+            ).to_csv(chain_path, index=False)
+            outdir = Path(tmp) / "results"
+            with patch(
+                "risk_pipeline.cli.run_pricing.download_prices_chunked",
+                return_value=(prices_df, {}, Path(tmp) / "cache", fake_download_report),
+            ):
+                rc = main(
+                    [
+                        "--start", "2025-01-01",
+                        "--end", "2025-06-01",
+                        "--strike", "440",
+                        "--maturity-days", "30",
+                        "--mode", "fast",
+                        "--paths", "2000",
+                        "--binomial-steps", "50",
+                        "--chain-file", str(chain_path),
+                        "--risk-ladder",
+                        "--option-var",
+                        "--var-paths", "2000",
+                        "--outdir", str(outdir),
+                    ]
+                )
+
+            self.assertEqual(rc, 0)
+            chain_out = pd.read_csv(outdir / "chain_prices.csv")
+            expired = chain_out["maturity_years"] == 0.0
+            intrinsic = np.maximum(np.where(is_call, 1.0, -1.0) * (prices[-1] - strikes), 0.0)
+            np.testing.assert_allclose(chain_out.loc[expired, "cos_price"], intrinsic[expired.to_numpy()])
+            np.testing.assert_allclose(chain_out["cos_price"], chain_out["bs_price"], atol=1e-8)
+            self.assertTrue(chain_out.loc[expired, "svi_vol"].isna().all())
+            self.assertTrue(chain_out.loc[~expired, "svi_vol"].notna().all())
+            with (outdir / "price.json").open("r", encoding="utf-8") as f:
+                price = json.load(f)
+            self.assertEqual(price["chain"]["svi"]["fitted_expiries"], [60 / 365.0])
+            self.assertEqual(price["chain"]["no_arbitrage"]["expired_skipped"], 2)
+            self.assertTrue(price["chain"]["no_arbitrage"]["ok"])
+            self.assertEqual(price["chain"]["risk_ladder"]["scenarios"], 45)
+
+    def test_run_pricing_reuses_pricing_cache(self):
+        dates = pd.date_range("2025-01-01", periods=90, freq="B")
+        rng = np.random.default_rng(7)
+        prices = 500.0 * np.exp(np.cumsum(rng.normal(0.0002, 0.01, size=len(dates))))
+        prices_df = pd.DataFrame({"SPY": prices}, index=dates)
+        prices_df.index.name = "date"
+        fake_download_report = {"chunks": [], "summary": {"total_chunks": 0, "failed": 0}}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            runs = []
+            for run in ("first", "second"):
+                outdir = Path(tmp) / run
+                with patch(
+                    "risk_pipeline.cli.run_pricing.download_prices_chunked",
+                    return_value=(prices_df, {}, Path(tmp) / "cache", fake_download_report),
+                ):
+                    rc = main(
+                        [
+                            "--start", "2025-01-01",
+                            "--end", "2025-06-01",
+                            "--strike", "500",
+                            "--maturity-days", "30",
+                            "--mode", "fast",
+                            "--paths", "4000",
+                            "--binomial-steps", "50",
+                            "--pricing-cache", "true",
+                            "--pricing-cache-dir", str(Path(tmp) / "pricing_cache"),
+                            "--outdir", str(outdir),
+                        ]
+                    )
+                self.assertEqual(rc, 0)
+                with (outdir / "price.json").open("r", encoding="utf-8") as f:
+                    price = json.load(f)
+                with (outdir / "bench.json").open("r", encoding="utf-8") as f:
+                    bench = json.load(f)
+                runs.append((price, bench))
+
+            (first_price, first_bench), (second_price, second_bench) = runs
+            self.assertEqual(first_bench["pricing_cache"]["cached"], [])
+            self.assertEqual(
+                second_bench["pricing_cache"]["cached"], ["binomial", "binomial_accelerated", "mc_cpu", "pde"]
+            )
+            self.assertEqual(second_price["mc"]["selected"], first_price["mc"]["selected"])
+            self.assertEqual(second_price["binomial"]["selected"], first_price["binomial"]["selected"])
+
 
 if __name__ == "__main__":
     unittest.main()
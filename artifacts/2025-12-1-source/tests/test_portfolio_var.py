@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from risk_pipeline.legacy.models.ewma_cov import ewma_covariance
+from risk_pipeline.legacy.risk.mc_sim import simulate_returns
+from risk_pipeline.pricing.engines.black_scholes import bs_price
+from risk_pipeline.pricing.portfolio_var import option_book_var
+
+
+class TestOptionBookVar(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        corr = np.array([[1.0, 0.7], [0.7, 1.0]])
+        self.returns = pd.DataFrame(rng.multivariate_normal([0.0, 0.0], corr * 1e-4, size=250), columns=["SPY", "QQQ"])
+        n = 200
+        self.positions = pd.DataFrame(
+            {
+                "underlying": rng.choice(["SPY", "QQQ"], n),
+                "spot": 100.0,
+                "strike": rng.uniform(85.0, 115.0, n),
+                "maturity_years": rng.uniform(0.1, 1.0, n),
+                "sigma": rng.uniform(0.15, 0.35, n),
+                "option_type": rng.choice(["call", "put"], n),
+                "quantity": rng.integers(-5, 6, n).astype(float),
+            }
+        )
+
+    def test_full_revaluation_matches_scalar_pricer(self):
+        book = self.positions.head(3)
+        out = option_book_var(book, self.returns, num_paths=50, seed=4, method="full", rate=0.02)
+        names = out["underlyings"]
+        cov = ewma_covariance(self.returns[names].to_numpy())
+        scenarios = simulate_returns(cov=cov, num_paths=50, seed=4)
+        dt = 1.0 / 252.0
+        expected = np.zeros(50)
+        for _, pos in book.iterrows():
+            move = scenarios[:, names.index(pos["underlying"])]
+            args = (pos["strike"], pos["maturity_years"], 0.02, 0.0, pos["sigma"], pos["option_type"])
+            base = bs_price(pos["spot"], *args)
+            for j in range(50):
+                shocked_args = (pos["strike"], pos["maturity_years"] - dt, 0.02, 0.0, pos["sigma"], pos["option_type"])
+                expected[j] -= pos["quantity"] * (bs_price(pos["spot"] * np.exp(move[j]), *shocked_args) - base)
+        np.testing.assert_allclose(out["losses"]["full"], expected, atol=1e-9)
+        self.assertNotIn("delta_gamma", out)
+
+    def test_delta_gamma_tracks_full_revaluation(self):
+        out = option_book_var(self.positions, self.returns, num_paths=5000, seed=1, rate=0.02, max_cells=1 << 16)
+        err = out["approximation_error"]
+        self.assertLess(abs(err["var_rel"]), 0.02)
+        self.assertLess(err["loss_rmse"], 0.05 * out["full"]["var"])
+        self.assertGreater(out["full"]["cvar"], out["full"]["var"])
+
+        rng = np.random.default_rng(2)
+        vol_shocks = rng.normal(0.0, 0.005, size=(5000, 2))
+        shocked = option_book_var(self.positions, self.returns, num_paths=5000, seed=1, rate=0.02, vol_shocks=vol_shocks)
+        self.assertLess(abs(shocked["approximation_error"]["var_rel"]), 0.05)
+
+    def test_parallel_scenarios_do_not_depend_on_worker_count(self):
+        kwargs = dict(num_paths=20000, seed=3, rate=0.02, chunk_paths=6000)
+        one = option_book_var(self.positions, self.returns, workers=1, **kwargs)
+        two = option_book_var(self.positions, self.returns, workers=2, **kwargs)
+        np.testing.assert_array_equal(one["losses"]["full"], two["losses"]["full"])
+        self.assertEqual(one["full"]["var"], two["full"]["var"])
+        self.assertEqual(two["workers"], 2)
+        serial = option_book_var(self.positions, self.returns, **kwargs)
+        self.assertIsNone(serial["workers"])
+        self.assertLess(abs(one["full"]["var"] - serial["full"]["var"]), 0.1 * serial["full"]["var"])
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            option_book_var(self.positions, self.returns[["SPY"]], num_paths=100, seed=0)
+        with self.assertRaises(ValueError):
+            option_book_var(self.positions, self.returns, num_paths=100, seed=0, method="exact")
+        with self.assertRaises(ValueError):
+            option_book_var(self.positions, self.returns, num_paths=100, seed=0, vol_shocks=np.zeros((10, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
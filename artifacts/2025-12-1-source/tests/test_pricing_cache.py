@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from risk_pipeline.pricing.cache import PricingCache
+
+
+class TestPricingCache(unittest.TestCase):
+    def test_memory_then_disk_hits(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"price": 1.25, "grid": np.arange(3.0)}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            params = {"spot": 100.0, "strike": 95.0, "seed": 7}
+            cache = PricingCache(Path(tmp))
+            first = cache.get_or_compute("mc_cpu", params, compute)
+            again = cache.get_or_compute("mc_cpu", params, compute)
+            self.assertEqual(cache.stats["memory_hits"], 1)
+            # Every caller gets its own copy: mutating one result must not leak into the next hit.
+            self.assertIsNot(again, first)
+            again["price"] = -1.0
+            again["grid"][0] = 99.0
+            third = cache.get_or_compute("mc_cpu", params, compute)
+            self.assertEqual(third["price"], 1.25)
+            np.testing.assert_array_equal(third["grid"], np.arange(3.0))
+
+            fresh = PricingCache(Path(tmp))
+            from_disk = fresh.get_or_compute("mc_cpu", params, compute)
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(from_disk["price"], 1.25)
+            np.testing.assert_array_equal(from_disk["grid"], np.arange(3.0))
+            self.assertEqual(fresh.stats["disk_hits"], 1)
+
+            found, _ = fresh.lookup("mc_cpu", {**params, "seed": 8})
+            self.assertFalse(found)
+
+    def test_engine_version_is_part_of_the_key(self):
+        cache = PricingCache()
+        cache.store("pde_cn", {"spot": 100.0}, 3.0)
+        with patch.dict("risk_pipeline.pricing.cache.ENGINE_VERSIONS", {"pde_cn": 99}):
+            self.assertFalse(cache.lookup("pde_cn", {"spot": 100.0})[0])
+        self.assertTrue(cache.lookup("pde_cn", {"spot": 100.0})[0])
+        with self.assertRaises(KeyError):
+            cache.lookup("unregistered", {})
+
+    def test_lru_and_size_eviction(self):
+        memory = PricingCache(max_entries=2)
+        for i in range(3):
+            memory.store("binomial_crr", {"steps": i}, float(i))
+        self.assertFalse(memory.lookup("binomial_crr", {"steps": 0})[0])
+        self.assertTrue(memory.lookup("binomial_crr", {"steps": 2})[0])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            disk = PricingCache(Path(tmp), max_entries=1, max_bytes=2500)
+            for i in range(6):
+                disk.store("binomial_crr", {"steps": i}, np.full(50, float(i)))
+            files = list(Path(tmp).glob("*/*.json"))
+            self.assertEqual(list(Path(tmp).glob("*/*.tmp")), [])
+            self.assertLessEqual(sum(p.stat().st_size for p in files), 2500)
+            self.assertGreater(disk.stats["evictions"], 0)
+            self.assertTrue(PricingCache(Path(tmp)).lookup("binomial_crr", {"steps": 5})[0])
+
+    def test_files_removed_by_another_process_are_misses(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = PricingCache(Path(tmp), max_bytes=10)
+            cache.store("binomial_crr", {"steps": 1}, 1.0)
+            # The file goes away between the read and the touch, as if another process evicted it.
+            with patch("risk_pipeline.pricing.cache.os.utime", side_effect=FileNotFoundError):
+                self.assertFalse(PricingCache(Path(tmp)).lookup("binomial_crr", {"steps": 1})[0])
+            # A file listed by the glob but gone before its stat is skipped.
+            ghost = Path(tmp) / "zz" / "gone.json"
+            listed = list(Path(tmp).glob("*/*.json")) + [ghost]
+            with patch.object(Path, "glob", return_value=iter(listed)):
+                cache.store("binomial_crr", {"steps": 2}, 2.0)
+            self.assertGreater(cache.stats["evictions"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from risk_pipeline.pricing.engines.black_scholes import bs_price
+from risk_pipeline.pricing.scenarios import revalue_book, scenario_grid
+
+
+class TestScenarioRevaluation(unittest.TestCase):
+    def setUp(self):
+        self.positions = pd.DataFrame(
+            {
+                "underlying": ["SPY", "SPY", "QQQ"],
+                "spot": [500.0, 500.0, 400.0],
+                "strike": [520.0, 480.0, 400.0],
+                "maturity_years": [0.25, 0.5, 1.0],
+                "sigma": [0.2, 0.25, 0.08],
+                "option_type": ["call", "put", "Call"],
+                "quantity": [10.0, -5.0, 3.0],
+            }
+        )
+
+    def test_grid_is_cartesian(self):
+        grid = scenario_grid([-0.1, 0.0, 0.1], [-0.05, 0.05], [0.0, 0.01])
+        self.assertEqual(grid.shape, (12, 3))
+        self.assertEqual(len(grid.drop_duplicates()), 12)
+        with self.assertRaises(ValueError):
+            scenario_grid([-1.0], [0.0])
+
+    def test_matches_scalar_revaluation(self):
+        out = revalue_book(self.positions, [-0.2, 0.0, 0.2], [-0.1, 0.0, 0.1], [0.0, 0.01], rate=0.03, max_cells=4)
+        grid = out["scenarios"]
+        self.assertEqual(out["position_pnl"].shape, (3, len(grid)))
+        self.assertEqual(out["revaluations"], 3 * (len(grid) + 1))
+
+        for i, pos in self.positions.iterrows():
+            kind = pos["option_type"].lower()
+            base = bs_price(pos["spot"], pos["strike"], pos["maturity_years"], 0.03, 0.0, pos["sigma"], kind)
+            for j, shock in grid.iterrows():
+                vol = max(pos["sigma"] + shock["vol_shock"], 1e-4)
+                shocked = bs_price(
+                    pos["spot"] * (1.0 + shock["spot_shock"]),
+                    pos["strike"],
+                    pos["maturity_years"],
+                    0.03 + shock["rate_shock"],
+                    0.0,
+                    vol,
+                    kind,
+                )
+                self.assertAlmostEqual(out["position_pnl"][i, j], pos["quantity"] * (shocked - base), places=8)
+
+        zero = int(np.flatnonzero((grid == 0.0).all(axis=1))[0])
+        np.testing.assert_allclose(out["book_pnl"][zero], 0.0, atol=1e-10)
+        np.testing.assert_allclose(out["underlying_pnl"].loc["SPY"], out["position_pnl"][:2].sum(axis=0))
+        np.testing.assert_allclose(out["underlying_pnl"].sum(axis=0), out["book_pnl"])
+
+    def test_rejects_incomplete_positions(self):
+        with self.assertRaises(ValueError):
+            revalue_book(self.positions.drop(columns=["quantity"]), [0.0], [0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from risk_pipeline.volatility.svi import calibrate_svi_slice, calibrate_svi_surface, svi_total_variance
+
+
+class TestSviSurface(unittest.TestCase):
+    def setUp(self):
+        self.true_params = np.array(
+            [
+                [0.01, 0.08, -0.4, 0.02, 0.15],
+                [0.03, 0.10, -0.35, 0.03, 0.20],
+                [0.06, 0.12, -0.3, 0.05, 0.25],
+            ]
+        )
+        self.expiries = np.array([0.25, 0.5, 1.0])
+        strikes = np.linspace(60.0, 150.0, 25)
+        k, t = (a.ravel() for a in np.meshgrid(strikes, self.expiries))
+        self.strike, self.maturity = k, t
+        self.spot, self.rate, self.q = 100.0, 0.03, 0.01
+        log_k = np.log(k / self.spot) - (self.rate - self.q) * t
+        w = svi_total_variance(log_k, self.true_params[np.searchsorted(self.expiries, t)])
+        self.iv = np.sqrt(w / t)
+
+    def test_slice_recovers_parameters(self):
+        k = np.linspace(-0.5, 0.4, 30)
+        fit = calibrate_svi_slice(k, svi_total_variance(k, self.true_params[1]))
+        np.testing.assert_allclose(fit["params"], self.true_params[1], atol=1e-6)
+        self.assertLess(fit["rmse"], 1e-9)
+
+    def test_surface_reprices_quotes_and_interpolates(self):
+        surface, skipped = calibrate_svi_surface(self.strike, self.maturity, self.iv, self.spot, self.rate, self.q)
+        self.assertEqual(skipped, [])
+        np.testing.assert_allclose(surface.sigma(self.strike, self.maturity), self.iv, atol=1e-8)
+
+        # Between expiries total variance is linear in T at fixed forward log-moneyness.
+        k = np.array([-0.2, 0.0, 0.15])
+        w_mid = surface.total_variance(k, 0.75)
+        w_lo = svi_total_variance(k, self.true_params[1])
+        w_hi = svi_total_variance(k, self.true_params[2])
+        np.testing.assert_allclose(w_mid, 0.5 * (w_lo + w_hi), atol=1e-8)
+        # Outside the quoted expiries implied vol is held flat.
+        np.testing.assert_allclose(surface.total_variance(k, 2.0), 2.0 * w_hi, atol=1e-8)
+        np.testing.assert_allclose(surface.total_variance(k, 0.1), 0.4 * svi_total_variance(k, self.true_params[0]), atol=1e-8)
+
+    def test_noisy_quotes_and_sparse_expiries(self):
+        rng = np.random.default_rng(3)
+        noisy = self.iv + rng.normal(0.0, 0.002, self.iv.size)
+        strike = np.append(self.strike, [95.0, 105.0])
+        maturity = np.append(self.maturity, [2.0, 2.0])
+        surface, skipped = calibrate_svi_surface(strike, maturity, np.append(noisy, [0.2, 0.2]), self.spot, self.rate, self.q)
+        self.assertEqual(skipped, [2.0])
+        self.assertLess(np.abs(surface.sigma(self.strike, self.maturity) - self.iv).max(), 5e-3)
+
+    def test_vectorized_lookup_shape_and_validation(self):
+        surface, _ = calibrate_svi_surface(self.strike, self.maturity, self.iv, self.spot, self.rate, self.q)
+        rng = np.random.default_rng(0)
+        strikes = rng.uniform(50.0, 160.0, size=(200, 50))
+        vols = surface.sigma(strikes, rng.uniform(0.05, 2.0, size=(200, 50)))
+        self.assertEqual(vols.shape, (200, 50))
+        self.assertTrue(np.all(np.isfinite(vols) & (vols > 0.0)))
+        with self.assertRaises(ValueError):
+            surface.sigma(100.0, 0.0)
+        with self.assertRaises(ValueError):
+            calibrate_svi_surface([100.0, 110.0], [0.5, 0.5], [0.2, 0.2], 100.0, 0.0, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()